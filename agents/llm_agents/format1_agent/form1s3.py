@@ -165,10 +165,13 @@ class Form1S3Agent:
             logger.error(f"[{self.name.upper()}] Error drawing grid lines: {str(e)}")
             return image
 
-    def process_image(self, input_image_path):
+    def process_image(self, input_image_path, keep_image=False):
         """
         Main processing function that reads the image from form1s2 output,
         detects the red bounding box, finds grid lines, and outputs the result.
+
+        If keep_image is True the gridlines image is also returned under "image"
+        so a caller can hand it to the next stage without re-reading the PNG.
         """
         try:
             logger.info(f"[{self.name.upper()}] Starting grid line detection process")
@@ -248,6 +251,9 @@ class Form1S3Agent:
                 "method": "opencv_hough_transform"
             }
 
+            if keep_image:
+                result["image"] = result_image
+
             logger.info(f"[{self.name.upper()}] Grid line detection completed successfully")
             return result
 
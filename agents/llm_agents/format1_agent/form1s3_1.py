@@ -29,13 +29,14 @@ class Form1S31Agent:
         self.name = name
         self.margin = 3  # Margin to avoid grid lines
 
-    def extract_table_body(self, input_file: str, output_dir: str) -> Dict[str, Any]:
+    def extract_table_body(self, input_file: str, output_dir: str, image: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """
         Extract table body content inside the outermost green grid lines.
 
         Args:
             input_file: Path to form1s3 output file (ordertable_gridlines.png)
             output_dir: Directory to save the extracted table body
+            image: The already-loaded gridlines image (skips reading input_file)
 
         Returns:
             Dictionary with extraction results
@@ -45,12 +46,13 @@ class Form1S31Agent:
             logger.info(f"[{self.name.upper()}] Input file: {input_file}")
 
             # Load the image
-            if not os.path.exists(input_file):
-                raise FileNotFoundError(f"Input file not found: {input_file}")
-
-            image = cv2.imread(input_file)
             if image is None:
-                raise ValueError(f"Could not load image: {input_file}")
+                if not os.path.exists(input_file):
+                    raise FileNotFoundError(f"Input file not found: {input_file}")
+
+                image = cv2.imread(input_file)
+                if image is None:
+                    raise ValueError(f"Could not load image: {input_file}")
 
             height, width = image.shape[:2]
             logger.info(f"[{self.name.upper()}] Loaded image: ({height}, {width}, {image.shape[2]})")
@@ -365,18 +367,19 @@ class Form1S31Agent:
             logger.error(f"[{self.name.upper()}] Error finding header separator line: {str(e)}")
             return None
 
-    def process_file(self, input_file: str, output_dir: str) -> Dict[str, Any]:
+    def process_file(self, input_file: str, output_dir: str, image: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """
         Process a single file for table body extraction.
 
         Args:
             input_file: Path to input image file
             output_dir: Directory to save extracted table body
+            image: The already-loaded input image, if the caller has it
 
         Returns:
             Processing result dictionary
         """
-        return self.extract_table_body(input_file, output_dir)
+        return self.extract_table_body(input_file, output_dir, image)
 
     def process_all_pages(self, input_dir: str, output_dir: str, order_number: str = "CO25S006375") -> Dict[str, Any]:
         """
@@ -149,13 +149,14 @@ class Form1S5Agent:
             logger.error(f"[{self.name.upper()}] Error saving title image: {str(e)}")
             return None
 
-    def process_image(self, input_path, output_dir=None):
+    def process_image(self, input_path, output_dir=None, image=None):
         """
         Main processing method to extract order title from ordertable_gridlines.png
 
         Args:
             input_path: Path to ordertable_gridlines.png
             output_dir: Output directory (defaults to io/fullorder_output)
+            image: The already-loaded gridlines image (skips reading input_path)
 
         Returns:
             dict: Processing results
@@ -168,26 +169,27 @@ class Form1S5Agent:
             if output_dir is None:
                 output_dir = "io/fullorder_output"
 
-            # Check if input file exists
-            if not os.path.exists(input_path):
-                error_msg = f"Input file not found: {input_path}"
-                logger.error(f"[{self.name.upper()}] {error_msg}")
-                return {
-                    "status": "error",
-                    "error": error_msg
-                }
-
-            # Load the image
-            print(f"[DEBUG] Loading image: {input_path}")
-            image = cv2.imread(input_path)
-
             if image is None:
-                error_msg = f"Failed to load image: {input_path}"
-                logger.error(f"[{self.name.upper()}] {error_msg}")
-                return {
-                    "status": "error",
-                    "error": error_msg
-                }
+                # Check if input file exists
+                if not os.path.exists(input_path):
+                    error_msg = f"Input file not found: {input_path}"
+                    logger.error(f"[{self.name.upper()}] {error_msg}")
+                    return {
+                        "status": "error",
+                        "error": error_msg
+                    }
+
+                # Load the image
+                print(f"[DEBUG] Loading image: {input_path}")
+                image = cv2.imread(input_path)
+
+                if image is None:
+                    error_msg = f"Failed to load image: {input_path}"
+                    logger.error(f"[{self.name.upper()}] {error_msg}")
+                    return {
+                        "status": "error",
+                        "error": error_msg
+                    }
 
             print(f"[DEBUG] Image loaded successfully: {image.shape}")
             logger.info(f"[{self.name.upper()}] Loaded image: {image.shape}")
@@ -68,8 +68,9 @@ class GlobalAgent:
                 mat = fitz.Matrix(2, 2)  # 2x zoom
                 pix = page.get_pixmap(matrix=mat)
                 img_data = pix.tobytes("png")
-                img = Image.open(io.BytesIO(img_data))
-                images.append(np.array(img))
+                with Image.open(io.BytesIO(img_data)) as img:
+                    # Pages are only read downstream, so no writable copy is needed
+                    images.append(np.asarray(img))
             pdf_document.close()
             print(f"[{self.name}] Converted PDF to {len(images)} images")
         except Exception as e:
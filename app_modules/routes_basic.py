@@ -29,6 +29,22 @@ def get_status():
     """API status endpoint"""
     return jsonify({'status': 'ok', 'message': 'Server is running'})
 
+@basic_bp.route('/healthz')
+def healthz():
+    """Liveness check - answers without touching MongoDB or the file system"""
+    return 'ok', 200
+
+@basic_bp.route('/readyz')
+def readyz():
+    """Readiness check - pings MongoDB, connecting on the first call"""
+    try:
+        # Imported here so pymongo is only loaded once something needs the database
+        from old_data.mongodb_manager import get_db
+        get_db().client.admin.command('ping')
+        return jsonify({'status': 'ready'})
+    except Exception as e:
+        return jsonify({'status': 'unavailable', 'error': str(e)}), 503
+
 # PDF serving route
 @basic_bp.route('/pdf/<filename>')
 def serve_pdf(filename):
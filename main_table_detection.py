@@ -12,58 +12,245 @@ Workflow:
 import os
 import sys
 import glob
+import hashlib
+import importlib
+import inspect
+import json
 import logging
+import multiprocessing
+import queue
+import re
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from functools import lru_cache, wraps
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Optional
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# Configure logging: the console handler stays synchronous so log lines keep their order
+# with print(); the log file is written by a QueueListener thread (started in main) and is
+# only opened on the first record, once io/log exists
+_log_queue = queue.SimpleQueue()
+_log_file_handler = RotatingFileHandler(
+    'io/log/table_detection_log.txt', maxBytes=10 * 1024 * 1024, backupCount=3, encoding='utf-8', delay=True
+)
+_log_listener = QueueListener(_log_queue, _log_file_handler)
+_worker_log = None  # (manager, queue, listener) for the worker processes, see _worker_log_queue
 
-# Import agents
-from output_cleaner import OutputCleanerAgent
-from agents.llm_agents.format1_agent import OrderFormat1MainAgent
-from agents.llm_agents.format1_agent.form1s2 import Form1S2Agent
-from agents.llm_agents.format1_agent.form1s3 import Form1S3Agent
-from agents.llm_agents.format1_agent.form1s3_1 import Form1S31Agent
-from agents.llm_agents.format1_agent.form1s3_2 import Form1S32Agent
-from agents.llm_agents.format1_agent.form1s3_3 import Form1S3_3Agent
-from agents.llm_agents.format1_agent.form1s4 import Form1S4Agent
-from agents.llm_agents.format1_agent.form1s4_1 import Form1S4_1Agent
-from agents.llm_agents.format1_agent.form1s5 import Form1S5Agent
-from agents.llm_agents.format1_agent.form1ocr1 import Form1OCR1Agent
-from agents.llm_agents.format1_agent.form1ocr2 import Form1OCR2Agent
-from agents.llm_agents.format1_agent.form1dat1 import Form1Dat1Agent
-
-# Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(message)s',
     handlers=[
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler('io/log/table_detection_log.txt', encoding='utf-8')
+        QueueHandler(_log_queue)
     ]
 )
 
 logger = logging.getLogger(__name__)
 
+# Intermediate stage files: <order>_<kind>_page<N>[_gridlines].png
+_STAGE_FILE_RE = re.compile(
+    r'(?P<order>.+?)_(?P<kind>ordertable|table_bodyonly|shape_column)_page(?P<page>\d+)(?P<gridlines>_gridlines)?\.png$'
+)
+
+# Form1Dat1 results by input content hash, reused across pipeline runs
+DAT1_CACHE_PATH = "io/log/_dat1_cache.json"
+
+# Filename parsers for the table OCR and page loops
+_BODYONLY_RE = re.compile(r'(.+)_table_bodyonly_page(\d+)\.png$')
+_PAGE_NUM_RE = re.compile(r'_page(\d+)\.')
+
+# Downstream agents by stage key as (module, class name); the heavy agent modules are
+# only imported when a stage first needs its agent (see _agent_class)
+STAGE_AGENTS = {
+    "form1s2": ("agents.llm_agents.format1_agent.form1s2", "Form1S2Agent"),
+    "form1s3": ("agents.llm_agents.format1_agent.form1s3", "Form1S3Agent"),
+    "form1s3_1": ("agents.llm_agents.format1_agent.form1s3_1", "Form1S31Agent"),
+    "form1s3_2": ("agents.llm_agents.format1_agent.form1s3_2", "Form1S32Agent"),
+    "form1s3_3": ("agents.llm_agents.format1_agent.form1s3_3", "Form1S3_3Agent"),
+    "form1s4": ("agents.llm_agents.format1_agent.form1s4", "Form1S4Agent"),
+    "form1s4_1": ("agents.llm_agents.format1_agent.form1s4_1", "Form1S4_1Agent"),
+    "form1s5": ("agents.llm_agents.format1_agent.form1s5", "Form1S5Agent"),
+    "form1ocr1": ("agents.llm_agents.format1_agent.form1ocr1", "Form1OCR1Agent"),
+    "form1ocr2": ("agents.llm_agents.format1_agent.form1ocr2", "Form1OCR2Agent"),
+    "form1dat1": ("agents.llm_agents.format1_agent.form1dat1", "Form1Dat1Agent"),
+}
+
+# The batch stages that run in this process after the page workers (page stages run in the workers)
+PREWARM_AGENTS = ("form1ocr1", "form1ocr2", "form1dat1")
+
+@lru_cache(maxsize=None)
+def _agent_class(key):
+    """Import the module for a stage agent on first use and return the agent class"""
+    module_name, class_name = STAGE_AGENTS[key]
+    return getattr(importlib.import_module(module_name), class_name)
+
+@dataclass(slots=True)
+class PipelineResults:
+    """Per-stage results of a pipeline run (each stage stores its own result dict)"""
+    cleaning: Optional[dict] = None
+    form1s1: Optional[dict] = None
+    form1s2: Optional[dict] = None
+    form1s3: Optional[dict] = None
+    form1s3_1: Optional[dict] = None
+    form1s3_2: Optional[dict] = None
+    form1s3_3: Optional[dict] = None
+    form1s4: Optional[dict] = None
+    form1s4_1: Optional[dict] = None
+    form1s5: Optional[dict] = None
+    form1ocr1: Optional[dict] = None
+    form1ocr2: Optional[dict] = None
+    form1dat1: Optional[dict] = None
+    pages: dict = field(default_factory=dict)
+    timings: dict = field(default_factory=dict)
+    errors: deque = field(default_factory=deque)  # appended to from several threads
+
+    def to_dict(self):
+        """Return the results as plain dicts/lists for serialization"""
+        results = asdict(self)
+        results["errors"] = list(self.errors)
+        return results
+
+@dataclass(slots=True)
+class PageCtx:
+    """A page image from order_to_image, with its name, page number and order number parsed once"""
+    path: str
+    name: str
+    number: str
+    order: str
+
+    @classmethod
+    def from_path(cls, path):
+        """Build the context for a *_page<N>.png file (page number defaults to 1)"""
+        name = os.path.basename(path)
+        match = _PAGE_NUM_RE.search(name)
+        if match:
+            return cls(path, name, match.group(1), name[:match.start()])
+        return cls(path, name, "1", os.path.splitext(name)[0])
+
+@dataclass(frozen=True, slots=True)
+class OrderResult:
+    """Form1Dat1 outcome for one order, as listed in results.form1dat1["processed_orders"]"""
+    file: str
+    order_number: str
+    status: str
+    output_file: Optional[str] = None
+    error: Optional[str] = None
+
+def _find_one(dir_path, suffix):
+    """Return the first file in dir_path whose name ends with suffix, or None"""
+    try:
+        with os.scandir(dir_path) as entries:
+            return next((entry.path for entry in entries if entry.name.endswith(suffix) and entry.is_file()), None)
+    except FileNotFoundError:
+        return None
+
+def _stage(name, label):
+    """Time a stage helper into results.timings and record any exception as a stage error"""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(self, *args, **kwargs)
+            except Exception as e:
+                where = f"page {args[0].number}" if args and isinstance(args[0], PageCtx) else "batch"
+                self.results.errors.append(f"{label} {where} error: {str(e)}")
+                return False
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._timings_lock:
+                    self.results.timings[name] = self.results.timings.get(name, 0.0) + elapsed
+        return wrapper
+    return decorator
+
 class TableDetectionPipeline:
     """Main pipeline for table detection workflow"""
 
     def __init__(self):
         self.input_dir = "io/input"
-        self.output_dir = "io/fullorder_output"
+        self.output_dir = "io/fullorder_output"  # also resolves the stage directories
         self.start_time = None
-        self.results = {
-            "cleaning": None,
-            "form1s1": None,
-            "form1s2": None,
-            "form1s3": None,
-            "form1s3_1": None,
-            "form1s3_2": None,
-            "form1s4": None,
-            "form1s5": None,
-            "form1ocr1": None,
-            "form1ocr2": None,
-            "form1dat1": None,
-            "errors": []
-        }
+        self._t0 = None  # perf_counter at start, for the execution time
+        self.results = PipelineResults()
+        self._agents = {}  # stage key -> Future of the agent
+        self._agents_lock = threading.Lock()
+        self._file_hashes = {}
+        self._intermediate_index = defaultdict(dict)
+        self._gridlines_images = {}
+        self._timings_lock = threading.Lock()  # stage helpers may run on several threads
+
+    @property
+    def output_dir(self):
+        """Root directory for all pipeline output"""
+        return self._output_dir
+
+    @output_dir.setter
+    def output_dir(self, value):
+        """Set the output directory and pre-resolve the stage directories under it"""
+        self._output_dir = value
+        self._order_to_image_dir = Path(value, "order_to_image")
+        self._json_output_dir = Path(value, "json_output")
+        self._td_dir = Path(value, "table_detection")
+        self._grid_dir = self._td_dir / "grid"
+        self._table_dir = self._td_dir / "table"
+        self._shape_col_dir = self._td_dir / "shape_column"
+        self._order_header_dir = self._td_dir / "order_header"
+
+    def _prewarm_agents(self):
+        """Construct the OCR and Dat1 agents in the background while Format 1 processing runs"""
+        for key in PREWARM_AGENTS:
+            try:
+                self._get_agent(key)
+            except Exception as e:
+                # The stage will construct (and report) the agent itself
+                logger.debug("[PREWARM] Could not initialize %s: %s", key, e)
+
+    def _get_agent(self, key):
+        """Return the agent for a stage, constructing it once per pipeline run (a caller racing the prewarm waits for it)"""
+        with self._agents_lock:
+            future = self._agents.get(key)
+            owner = future is None
+            if owner:
+                future = self._agents[key] = Future()
+        if owner:
+            try:
+                future.set_result(_agent_class(key)())
+            except Exception as e:
+                # Let the next caller retry the construction
+                with self._agents_lock:
+                    del self._agents[key]
+                future.set_exception(e)
+        return future.result()
+
+    def _file_hash(self, path):
+        """Return the sha256 of a file, hashing it only the first time it is seen"""
+        file_hash = self._file_hashes.get(path)
+        if file_hash is None:
+            file_hash = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+            self._file_hashes[path] = file_hash
+        return file_hash
+
+    def hash_page_files(self):
+        """Hash the page images produced by Format 1 once so later stages can reuse the digests"""
+        page_files = glob.glob(os.path.join(self._order_to_image_dir, "*_page*.png"))
+        if not page_files:
+            return
+
+        with ThreadPoolExecutor() as executor:
+            list(executor.map(self._file_hash, page_files))
+
+        print(f"[INFO] Hashed {len(page_files)} page image(s)")
 
     def print_header(self):
         """Print the application header"""
@@ -75,10 +262,9 @@ class TableDetectionPipeline:
 
     def print_section(self, title):
         """Print a section header"""
-        print()
-        print("-" * 70)
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] {title}")
-        print("-" * 70)
+        # One write, so headers of concurrently running steps are not interleaved line by line
+        rule = "-" * 70
+        sys.stdout.write(f"\n{rule}\n[{datetime.now().strftime('%H:%M:%S')}] {title}\n{rule}\n")
 
     def clean_output_directory(self, skip_cleaning=False):
         """Step 1: Clean the output directory"""
@@ -86,10 +272,11 @@ class TableDetectionPipeline:
 
         if skip_cleaning:
             print("[INFO] Skipping output cleaning (--skip-clean flag)")
-            self.results["cleaning"] = {"status": "skipped"}
+            self.results.cleaning = {"status": "skipped"}
             return True
 
         try:
+            from output_cleaner import OutputCleanerAgent
             cleaner = OutputCleanerAgent()
 
             # First get statistics
@@ -98,7 +285,7 @@ class TableDetectionPipeline:
 
             if stats["total_files"] == 0:
                 print("[CLEANER] Output directory is already clean")
-                self.results["cleaning"] = {"status": "already_clean"}
+                self.results.cleaning = {"status": "already_clean"}
                 return True
 
             print(f"[CLEANER] Found {stats['total_files']} files to clean ({stats['total_size_mb']:.2f} MB)")
@@ -111,45 +298,49 @@ class TableDetectionPipeline:
                 print(f"[CLEANER] Successfully cleaned {result['statistics']['files_deleted']} files")
                 print(f"[CLEANER] Freed {result['statistics']['total_size_deleted_mb']:.2f} MB")
                 print(f"[CLEANER] Preserved {result['statistics']['folders_preserved']} folders")
-                self.results["cleaning"] = result
+                self.results.cleaning = result
                 return True
             else:
                 error_msg = result.get("error", "Unknown error during cleaning")
                 print(f"[CLEANER] [ERROR] {error_msg}")
-                self.results["errors"].append(f"Cleaning error: {error_msg}")
+                self.results.errors.append(f"Cleaning error: {error_msg}")
                 return False
 
         except Exception as e:
             error_msg = f"Failed to initialize cleaner: {str(e)}"
             print(f"[CLEANER] [ERROR] {error_msg}")
-            self.results["errors"].append(error_msg)
+            self.results.errors.append(error_msg)
             return False
 
     def process_with_format1(self):
         """Step 2: Process PDFs with Format 1 Main agent"""
         self.print_section("STEP 2: FORMAT 1 ORDER PROCESSING")
 
+        # Warm up the downstream agents while the PDFs are being converted
+        threading.Thread(target=self._prewarm_agents, daemon=True).start()
+
         try:
             # Initialize Format 1 Main agent
+            from agents.llm_agents.format1_agent import OrderFormat1MainAgent
             format1_agent = OrderFormat1MainAgent()
-            print(f"[FORMAT1] Agent initialized: {format1_agent.short_name}")
-            print(f"[FORMAT1] Input directory: {self.input_dir}")
+            logger.info("[FORMAT1] Agent initialized: %s", format1_agent.short_name)
+            logger.info("[FORMAT1] Input directory: %s", self.input_dir)
 
             # Process with Format 1 Main agent
-            print(f"[FORMAT1] Starting Format 1 processing pipeline...")
+            logger.info("[FORMAT1] Starting Format 1 processing pipeline...")
             result = format1_agent.process_format1_orders(input_dir=self.input_dir)
 
             # Handle results based on status
             if result["status"] == "no_files":
-                print(f"[FORMAT1] No PDF files found in {self.input_dir}")
-                self.results["form1s1"] = {"status": "no_files"}
+                logger.info("[FORMAT1] No PDF files found in %s", self.input_dir)
+                self.results.form1s1 = {"status": "no_files"}
                 return True
 
             elif result["status"] == "error":
                 error_msg = f"Format 1 processing failed: {', '.join(result['errors'])}"
-                print(f"[FORMAT1] [ERROR] {error_msg}")
-                self.results["errors"].extend(result["errors"])
-                self.results["form1s1"] = result
+                logger.error("[FORMAT1] [ERROR] %s", error_msg)
+                self.results.errors.extend(result["errors"])
+                self.results.form1s1 = result
                 return False
 
             else:  # completed or completed_with_errors
@@ -159,38 +350,38 @@ class TableDetectionPipeline:
                 # Display step results
                 for step_name, step_data in result.get("steps", {}).items():
                     if step_data:
-                        print()
-                        print(f"[FORMAT1] {step_name}:")
-                        print(f"  Status: {step_data.get('status', 'unknown')}")
-                        print(f"  Files processed: {step_data.get('total_count', 0)}")
-                        print(f"  Successful: {step_data.get('success_count', 0)}")
+                        logger.info("")
+                        logger.info("[FORMAT1] %s:", step_name)
+                        logger.info("  Status: %s", step_data.get('status', 'unknown'))
+                        logger.info("  Files processed: %s", step_data.get('total_count', 0))
+                        logger.info("  Successful: %s", step_data.get('success_count', 0))
                         if step_data.get('error_count', 0) > 0:
-                            print(f"  Failed: {step_data.get('error_count', 0)}")
+                            logger.info("  Failed: %s", step_data.get('error_count', 0))
 
                         # Show individual file results
                         for file_result in step_data.get("files_processed", []):
                             file_name = file_result.get('file', file_result.get('order', 'Unknown'))
                             if file_result["status"] == "success":
-                                print(f"[FORMAT1] [SUCCESS] {file_name}")
+                                logger.info("[FORMAT1] [SUCCESS] %s", file_name)
                             else:
-                                print(f"[FORMAT1] [ERROR] {file_name}: {file_result.get('error', 'Unknown error')}")
+                                logger.error("[FORMAT1] [ERROR] %s: %s", file_name, file_result.get('error', 'Unknown error'))
 
                 # Store results
-                self.results["form1s1"] = result
+                self.results.form1s1 = result
 
                 # Add any errors to our error list
                 if result.get("errors"):
-                    self.results["errors"].extend(result["errors"])
+                    self.results.errors.extend(result["errors"])
 
-                print()
-                print(f"[FORMAT1] Processing completed in {result.get('processing_time_seconds', 0):.2f} seconds")
+                logger.info("")
+                logger.info("[FORMAT1] Processing completed in %.2f seconds", result.get('processing_time_seconds', 0))
 
                 return result["status"] == "completed"  # Return true only if no errors
 
         except Exception as e:
             error_msg = f"Failed during Format 1 processing: {str(e)}"
-            print(f"[FORMAT1] [ERROR] {error_msg}")
-            self.results["errors"].append(error_msg)
+            logger.error("[FORMAT1] [ERROR] %s", error_msg)
+            self.results.errors.append(error_msg)
             return False
 
     def process_with_form1s2(self):
@@ -199,19 +390,18 @@ class TableDetectionPipeline:
 
         try:
             # Initialize Form1S2 agent
-            form1s2_agent = Form1S2Agent()
-            print(f"[FORM1S2] Agent initialized: {form1s2_agent.name}")
+            form1s2_agent = self._get_agent("form1s2")
+            logger.info("[FORM1S2] Agent initialized: %s", form1s2_agent.name)
 
             # Find page1.png files from form1s1 output
-            import glob
             page1_files = glob.glob(f"{self.output_dir}/*_page1.png")
 
             if not page1_files:
-                print(f"[FORM1S2] No page1.png files found in {self.output_dir}")
-                self.results["form1s2"] = {"status": "no_files"}
+                logger.info("[FORM1S2] No page1.png files found in %s", self.output_dir)
+                self.results.form1s2 = {"status": "no_files"}
                 return True
 
-            print(f"[FORM1S2] Found {len(page1_files)} page1.png files to process")
+            logger.info("[FORM1S2] Found %s page1.png files to process", len(page1_files))
 
             # Process each page1.png file
             processed_files = []
@@ -220,18 +410,18 @@ class TableDetectionPipeline:
 
             for page1_file in page1_files:
                 file_name = os.path.basename(page1_file)
-                print(f"[FORM1S2] Processing: {file_name}")
+                logger.info("[FORM1S2] Processing: %s", file_name)
 
                 try:
                     result = form1s2_agent.process_image(page1_file)
 
                     if result["status"] == "success":
-                        print(f"[FORM1S2] [SUCCESS] {file_name}")
-                        print(f"[FORM1S2]   Coordinates: x={result['coordinates']['x']}, y={result['coordinates']['y']}, w={result['coordinates']['width']}, h={result['coordinates']['height']}")
-                        print(f"[FORM1S2]   Output: {result['output_image_path']}")
+                        logger.info("[FORM1S2] [SUCCESS] %s", file_name)
+                        logger.info("[FORM1S2]   Coordinates: x=%s, y=%s, w=%s, h=%s", result['coordinates']['x'], result['coordinates']['y'], result['coordinates']['width'], result['coordinates']['height'])
+                        logger.info("[FORM1S2]   Output: %s", result['output_image_path'])
                         successful_files += 1
                     else:
-                        print(f"[FORM1S2] [ERROR] {file_name}: {result.get('error', 'Unknown error')}")
+                        logger.error("[FORM1S2] [ERROR] %s: %s", file_name, result.get('error', 'Unknown error'))
                         failed_files += 1
 
                     processed_files.append({
@@ -244,17 +434,17 @@ class TableDetectionPipeline:
 
                 except Exception as e:
                     error_msg = f"Failed to process {file_name}: {str(e)}"
-                    print(f"[FORM1S2] [ERROR] {error_msg}")
+                    logger.error("[FORM1S2] [ERROR] %s", error_msg)
                     processed_files.append({
                         "file": file_name,
                         "status": "error",
                         "error": error_msg
                     })
                     failed_files += 1
-                    self.results["errors"].append(error_msg)
+                    self.results.errors.append(error_msg)
 
             # Store results
-            self.results["form1s2"] = {
+            self.results.form1s2 = {
                 "status": "completed" if failed_files == 0 else "completed_with_errors",
                 "total_files": len(page1_files),
                 "successful_files": successful_files,
@@ -262,18 +452,18 @@ class TableDetectionPipeline:
                 "processed_files": processed_files
             }
 
-            print()
-            print(f"[FORM1S2] Processing summary:")
-            print(f"[FORM1S2]   Total files: {len(page1_files)}")
-            print(f"[FORM1S2]   Successful: {successful_files}")
-            print(f"[FORM1S2]   Failed: {failed_files}")
+            logger.info("")
+            logger.info("[FORM1S2] Processing summary:")
+            logger.info("[FORM1S2]   Total files: %s", len(page1_files))
+            logger.info("[FORM1S2]   Successful: %s", successful_files)
+            logger.info("[FORM1S2]   Failed: %s", failed_files)
 
             return failed_files == 0
 
         except Exception as e:
             error_msg = f"Failed during Form1S2 processing: {str(e)}"
-            print(f"[FORM1S2] [ERROR] {error_msg}")
-            self.results["errors"].append(error_msg)
+            logger.error("[FORM1S2] [ERROR] %s", error_msg)
+            self.results.errors.append(error_msg)
             return False
 
     def process_with_form1s3(self):
@@ -282,32 +472,30 @@ class TableDetectionPipeline:
 
         try:
             # Initialize Form1S3 agent
-            form1s3_agent = Form1S3Agent()
-            print(f"[FORM1S3] Agent initialized: {form1s3_agent.name}")
+            form1s3_agent = self._get_agent("form1s3")
+            logger.info("[FORM1S3] Agent initialized: %s", form1s3_agent.name)
 
             # Look for ordertable.png from form1s2 output in grid folder with page number
-            ordertable_files = glob.glob(f"{self.output_dir}/table_detection/grid/*_ordertable_page1.png")
+            ordertable_path = _find_one(self._grid_dir, "_ordertable_page1.png")
 
-            if not ordertable_files:
-                print(f"[FORM1S3] ordertable.png not found at {self.output_dir}/table_detection/grid/*_ordertable_page1.png")
-                self.results["form1s3"] = {"status": "no_files"}
+            if not ordertable_path:
+                logger.info("[FORM1S3] ordertable.png not found at %s/*_ordertable_page1.png", self._grid_dir)
+                self.results.form1s3 = {"status": "no_files"}
                 return True
 
-            ordertable_path = ordertable_files[0]  # Use first matching file
-
-            print(f"[FORM1S3] Found ordertable.png, processing grid line detection")
+            logger.info("[FORM1S3] Found ordertable.png, processing grid line detection")
 
             try:
                 result = form1s3_agent.process_image(ordertable_path)
 
                 if result["status"] == "success":
-                    print(f"[FORM1S3] [SUCCESS] Grid line detection completed")
-                    print(f"[FORM1S3]   Red bounding box: x={result['red_bounding_box']['x']}, y={result['red_bounding_box']['y']}, w={result['red_bounding_box']['width']}, h={result['red_bounding_box']['height']}")
-                    print(f"[FORM1S3]   Grid lines detected: {result['grid_lines']['horizontal_count']} horizontal, {result['grid_lines']['vertical_count']} vertical")
-                    print(f"[FORM1S3]   Output: {result['output_image_path']}")
+                    logger.info("[FORM1S3] [SUCCESS] Grid line detection completed")
+                    logger.info("[FORM1S3]   Red bounding box: x=%s, y=%s, w=%s, h=%s", result['red_bounding_box']['x'], result['red_bounding_box']['y'], result['red_bounding_box']['width'], result['red_bounding_box']['height'])
+                    logger.info("[FORM1S3]   Grid lines detected: %s horizontal, %s vertical", result['grid_lines']['horizontal_count'], result['grid_lines']['vertical_count'])
+                    logger.info("[FORM1S3]   Output: %s", result['output_image_path'])
 
                     # Store results
-                    self.results["form1s3"] = {
+                    self.results.form1s3 = {
                         "status": "completed",
                         "total_files": 1,
                         "successful_files": 1,
@@ -317,36 +505,36 @@ class TableDetectionPipeline:
                     return True
                 else:
                     error_msg = result.get("error", "Unknown error")
-                    print(f"[FORM1S3] [ERROR] {error_msg}")
+                    logger.error("[FORM1S3] [ERROR] %s", error_msg)
 
-                    self.results["form1s3"] = {
+                    self.results.form1s3 = {
                         "status": "completed_with_errors",
                         "total_files": 1,
                         "successful_files": 0,
                         "failed_files": 1,
                         "error": error_msg
                     }
-                    self.results["errors"].append(f"Form1S3 error: {error_msg}")
+                    self.results.errors.append(f"Form1S3 error: {error_msg}")
                     return False
 
             except Exception as e:
                 error_msg = f"Failed to process ordertable.png: {str(e)}"
-                print(f"[FORM1S3] [ERROR] {error_msg}")
+                logger.error("[FORM1S3] [ERROR] %s", error_msg)
 
-                self.results["form1s3"] = {
+                self.results.form1s3 = {
                     "status": "error",
                     "total_files": 1,
                     "successful_files": 0,
                     "failed_files": 1,
                     "error": error_msg
                 }
-                self.results["errors"].append(error_msg)
+                self.results.errors.append(error_msg)
                 return False
 
         except Exception as e:
             error_msg = f"Failed during Form1S3 processing: {str(e)}"
-            print(f"[FORM1S3] [ERROR] {error_msg}")
-            self.results["errors"].append(error_msg)
+            logger.error("[FORM1S3] [ERROR] %s", error_msg)
+            self.results.errors.append(error_msg)
             return False
 
     def process_with_form1s3_1(self):
@@ -355,33 +543,31 @@ class TableDetectionPipeline:
 
         try:
             # Initialize Form1S3.1 agent
-            form1s3_1_agent = Form1S31Agent()
-            print(f"[FORM1S3.1] Agent initialized: {form1s3_1_agent.name}")
+            form1s3_1_agent = self._get_agent("form1s3_1")
+            logger.info("[FORM1S3.1] Agent initialized: %s", form1s3_1_agent.name)
 
             # Look for ordertable_gridlines.png from form1s3 output in grid folder with page number
-            gridlines_files = glob.glob(f"{self.output_dir}/table_detection/grid/*_ordertable_page1_gridlines.png")
+            gridlines_path = _find_one(self._grid_dir, "_ordertable_page1_gridlines.png")
 
-            if not gridlines_files:
-                print(f"[FORM1S3.1] ordertable_gridlines.png not found at {self.output_dir}/table_detection/grid/*_ordertable_page1_gridlines.png")
-                self.results["form1s3_1"] = {"status": "no_files"}
+            if not gridlines_path:
+                logger.info("[FORM1S3.1] ordertable_gridlines.png not found at %s/*_ordertable_page1_gridlines.png", self._grid_dir)
+                self.results.form1s3_1 = {"status": "no_files"}
                 return True
 
-            gridlines_path = gridlines_files[0]  # Use first matching file
-
-            print(f"[FORM1S3.1] Found ordertable_gridlines.png, processing table body extraction")
+            logger.info("[FORM1S3.1] Found ordertable_gridlines.png, processing table body extraction")
 
             # Set output directory
-            output_dir = f"{self.output_dir}/table_detection/table"
+            output_dir = str(self._table_dir)
 
             # Process with Form1S3.1 agent
             result = form1s3_1_agent.process_file(gridlines_path, output_dir)
 
             if result["status"] == "success":
-                print(f"[FORM1S3.1] [SUCCESS] Table body extraction completed")
-                print(f"[FORM1S3.1]   Table dimensions: {result['table_dimensions']['width']}x{result['table_dimensions']['height']} px")
-                print(f"[FORM1S3.1]   Output: {result['output_file']}")
+                logger.info("[FORM1S3.1] [SUCCESS] Table body extraction completed")
+                logger.info("[FORM1S3.1]   Table dimensions: %sx%s px", result['table_dimensions']['width'], result['table_dimensions']['height'])
+                logger.info("[FORM1S3.1]   Output: %s", result['output_file'])
 
-                self.results["form1s3_1"] = {
+                self.results.form1s3_1 = {
                     "status": "success",
                     "files_processed": 1,
                     "successful": 1,
@@ -392,8 +578,8 @@ class TableDetectionPipeline:
                 return True
             else:
                 error_msg = f"Form1S3.1 processing failed: {result.get('error', 'Unknown error')}"
-                print(f"[FORM1S3.1] [ERROR] {error_msg}")
-                self.results["form1s3_1"] = {
+                logger.error("[FORM1S3.1] [ERROR] %s", error_msg)
+                self.results.form1s3_1 = {
                     "status": "error",
                     "files_processed": 1,
                     "successful": 0,
@@ -404,8 +590,8 @@ class TableDetectionPipeline:
 
         except Exception as e:
             error_msg = f"Failed during Form1S3.1 processing: {str(e)}"
-            print(f"[FORM1S3.1] [ERROR] {error_msg}")
-            self.results["errors"].append(error_msg)
+            logger.error("[FORM1S3.1] [ERROR] %s", error_msg)
+            self.results.errors.append(error_msg)
             return False
 
     def process_with_form1s3_2(self):
@@ -414,36 +600,34 @@ class TableDetectionPipeline:
 
         try:
             # Initialize Form1S3.2 agent
-            form1s3_2_agent = Form1S32Agent()
-            print(f"[FORM1S3.2] Agent initialized: {form1s3_2_agent.name}")
+            form1s3_2_agent = self._get_agent("form1s3_2")
+            logger.info("[FORM1S3.2] Agent initialized: %s", form1s3_2_agent.name)
 
             # Look for table_bodyonly.png from form1s3.1 output with page number
-            table_body_files = glob.glob(f"{self.output_dir}/table_detection/table/*_table_bodyonly_page1.png")
+            table_body_path = _find_one(self._table_dir, "_table_bodyonly_page1.png")
 
-            if not table_body_files:
-                print(f"[FORM1S3.2] table_bodyonly.png not found at {self.output_dir}/table_detection/table/*_table_bodyonly_page1.png")
-                self.results["form1s3_2"] = {"status": "no_files"}
+            if not table_body_path:
+                logger.info("[FORM1S3.2] table_bodyonly.png not found at %s/*_table_bodyonly_page1.png", self._table_dir)
+                self.results.form1s3_2 = {"status": "no_files"}
                 return True
 
-            table_body_path = table_body_files[0]  # Use first matching file
-
-            print(f"[FORM1S3.2] Found table_bodyonly.png, processing order line counting")
+            logger.info("[FORM1S3.2] Found table_bodyonly.png, processing order line counting")
 
             # Set output directory (same as table_body.png)
-            output_dir = f"{self.output_dir}/table_detection/table"
+            output_dir = str(self._table_dir)
 
             # Process with Form1S3.2 agent
             result = form1s3_2_agent.process_file(table_body_path, output_dir)
 
             if result["status"] == "success":
-                print(f"[FORM1S3.2] [SUCCESS] Order line counting completed")
-                print(f"[FORM1S3.2]   Row count: {result['row_count']}")
-                print(f"[FORM1S3.2]   Analysis: {result.get('analysis', 'N/A')}")
+                logger.info("[FORM1S3.2] [SUCCESS] Order line counting completed")
+                logger.info("[FORM1S3.2]   Row count: %s", result['row_count'])
+                logger.info("[FORM1S3.2]   Analysis: %s", result.get('analysis', 'N/A'))
                 if result.get("row_coordinates"):
-                    print(f"[FORM1S3.2]   Y coordinates extracted for {len(result['row_coordinates'])} rows")
-                print(f"[FORM1S3.2]   Output: {result['output_file']}")
+                    logger.info("[FORM1S3.2]   Y coordinates extracted for %s rows", len(result['row_coordinates']))
+                logger.info("[FORM1S3.2]   Output: %s", result['output_file'])
 
-                self.results["form1s3_2"] = {
+                self.results.form1s3_2 = {
                     "status": "success",
                     "files_processed": 1,
                     "successful": 1,
@@ -456,8 +640,8 @@ class TableDetectionPipeline:
                 return True
             else:
                 error_msg = f"Form1S3.2 processing failed: {result.get('error', 'Unknown error')}"
-                print(f"[FORM1S3.2] [ERROR] {error_msg}")
-                self.results["form1s3_2"] = {
+                logger.error("[FORM1S3.2] [ERROR] %s", error_msg)
+                self.results.form1s3_2 = {
                     "status": "error",
                     "files_processed": 1,
                     "successful": 0,
@@ -468,8 +652,8 @@ class TableDetectionPipeline:
 
         except Exception as e:
             error_msg = f"Failed during Form1S3.2 processing: {str(e)}"
-            print(f"[FORM1S3.2] [ERROR] {error_msg}")
-            self.results["errors"].append(error_msg)
+            logger.error("[FORM1S3.2] [ERROR] %s", error_msg)
+            self.results.errors.append(error_msg)
             return False
 
     def process_with_form1s3_3(self):
@@ -478,8 +662,8 @@ class TableDetectionPipeline:
 
         try:
             # Initialize Form1S3_3 agent
-            form1s3_3_agent = Form1S3_3Agent()
-            print(f"[FORM1S3.3] Agent initialized: {form1s3_3_agent.name}")
+            form1s3_3_agent = self._get_agent("form1s3_3")
+            logger.info("[FORM1S3.3] Agent initialized: %s", form1s3_3_agent.name)
 
             # Process to extract table headers (auto-detects gridlines files)
             results = form1s3_3_agent.process_batch()
@@ -488,15 +672,15 @@ class TableDetectionPipeline:
                 success_count = sum(1 for r in results if r.get('status') == 'success')
 
                 if success_count > 0:
-                    print(f"[FORM1S3.3] [SUCCESS] Table header extraction completed")
+                    logger.info("[FORM1S3.3] [SUCCESS] Table header extraction completed")
 
                     for result in results:
                         if result['status'] == 'success':
-                            print(f"[FORM1S3.3]   Order: {result['order_name']}")
-                            print(f"[FORM1S3.3]   Header dimensions: {result['header_width']}x{result['header_height']} px")
-                            print(f"[FORM1S3.3]   Output: {result['output_file']}")
+                            logger.info("[FORM1S3.3]   Order: %s", result['order_name'])
+                            logger.info("[FORM1S3.3]   Header dimensions: %sx%s px", result['header_width'], result['header_height'])
+                            logger.info("[FORM1S3.3]   Output: %s", result['output_file'])
 
-                    self.results["form1s3_3"] = {
+                    self.results.form1s3_3 = {
                         "status": "success",
                         "files_processed": len(results),
                         "successful": success_count,
@@ -504,45 +688,62 @@ class TableDetectionPipeline:
                     }
                     return True
                 else:
-                    print(f"[FORM1S3.3] No files successfully processed")
-                    self.results["form1s3_3"] = {"status": "no_success"}
+                    logger.info("[FORM1S3.3] No files successfully processed")
+                    self.results.form1s3_3 = {"status": "no_success"}
                     return True
             else:
-                print(f"[FORM1S3.3] No gridlines files found to process")
-                self.results["form1s3_3"] = {"status": "no_files"}
+                logger.info("[FORM1S3.3] No gridlines files found to process")
+                self.results.form1s3_3 = {"status": "no_files"}
                 return True
 
         except Exception as e:
             error_msg = f"Failed during Form1S3.3 processing: {str(e)}"
-            print(f"[FORM1S3.3] [ERROR] {error_msg}")
-            self.results["errors"].append(error_msg)
+            logger.error("[FORM1S3.3] [ERROR] %s", error_msg)
+            self.results.errors.append(error_msg)
             return False
 
+    def process_with_form1s3_group(self):
+        """Steps 4-4.3: Run the Form1S3 series as a group, skipping it when Form1S2 produced no grid output"""
+        if not os.path.isdir(self._grid_dir):
+            logger.info("[FORM1S3] Grid directory not found at %s - skipping Form1S3 stages", self._grid_dir)
+            for key in ("form1s3", "form1s3_1", "form1s3_2", "form1s3_3"):
+                setattr(self.results, key, {"status": "no_files"})
+            return True
+
+        stage_results = [
+            self.process_with_form1s3(),
+            self.process_with_form1s3_1(),
+            self.process_with_form1s3_2(),
+            self.process_with_form1s3_3()
+        ]
+        return all(stage_results)
+
     def process_with_form1s4(self):
         """Step 5: Process shape_column files with Form1S4 agent for drawing cell extraction"""
         self.print_section("STEP 5: DRAWING CELL EXTRACTION (FORM1S4)")
 
         try:
             # Initialize Form1S4 agent
-            form1s4_agent = Form1S4Agent()
-            print(f"[FORM1S4] Agent initialized: {form1s4_agent.name}")
+            form1s4_agent = self._get_agent("form1s4")
+            logger.info("[FORM1S4] Agent initialized: %s", form1s4_agent.name)
 
             # Look for shape_column files from form1s4_1 output in shape_column folder
-            shape_column_files = glob.glob(f"{self.output_dir}/table_detection/shape_column/*_shape_column_page*.png")
+            shape_column_files = [str(p) for p in self._shape_col_dir.glob("*_shape_column_page*.png")]
 
             if not shape_column_files:
-                print(f"[FORM1S4] shape_column files not found at {self.output_dir}/table_detection/shape_column/*_shape_column_page*.png")
-                self.results["form1s4"] = {"status": "no_files"}
+                logger.info("[FORM1S4] shape_column files not found at %s/*_shape_column_page*.png", self._shape_col_dir)
+                self.results.form1s4 = {"status": "no_files"}
                 return True
 
-            print(f"[FORM1S4] Found {len(shape_column_files)} shape_column files, processing drawing cell extraction")
+            logger.info("[FORM1S4] Found %s shape_column files, processing drawing cell extraction", len(shape_column_files))
 
             total_successful = 0
             all_saved_files = []
 
             # Process all shape_column files
             for shape_column_path in shape_column_files:
-                print(f"[FORM1S4] Processing: {os.path.basename(shape_column_path)}")
+                fname = os.path.basename(shape_column_path)
+                logger.info("[FORM1S4] Processing: %s", fname)
 
                 try:
                     result = form1s4_agent.process_image(shape_column_path)
@@ -556,30 +757,30 @@ class TableDetectionPipeline:
                             if extraction_results.get("saved_files"):
                                 all_saved_files.extend(extraction_results["saved_files"])
 
-                        print(f"[FORM1S4] [SUCCESS] {os.path.basename(shape_column_path)} - {total_cells} cells extracted")
+                        logger.info("[FORM1S4] [SUCCESS] %s - %s cells extracted", fname, total_cells)
                     else:
                         error_msg = result.get("error", "Unknown error")
-                        print(f"[FORM1S4] [ERROR] Failed to process {os.path.basename(shape_column_path)}: {error_msg}")
+                        logger.error("[FORM1S4] [ERROR] Failed to process %s: %s", fname, error_msg)
 
                 except Exception as e:
-                    print(f"[FORM1S4] [ERROR] Exception processing {os.path.basename(shape_column_path)}: {str(e)}")
+                    logger.error("[FORM1S4] [ERROR] Exception processing %s: %s", fname, str(e))
 
             # Final summary
             if total_successful > 0:
-                print(f"[FORM1S4] [SUCCESS] Drawing cell extraction completed")
-                print(f"[FORM1S4]   Files processed: {total_successful}/{len(shape_column_files)}")
-                print(f"[FORM1S4]   Total cells extracted: {len(all_saved_files)}")
+                logger.info("[FORM1S4] [SUCCESS] Drawing cell extraction completed")
+                logger.info("[FORM1S4]   Files processed: %s/%s", total_successful, len(shape_column_files))
+                logger.info("[FORM1S4]   Total cells extracted: %s", len(all_saved_files))
 
                 if all_saved_files:
-                    print(f"[FORM1S4]   Sample files saved:")
+                    logger.info("[FORM1S4]   Sample files saved:")
                     for file_path in all_saved_files[:5]:  # Show first 5 files
                         file_name = os.path.basename(file_path)
-                        print(f"[FORM1S4]     - {file_name}")
+                        logger.info("[FORM1S4]     - %s", file_name)
                     if len(all_saved_files) > 5:
-                        print(f"[FORM1S4]     ... and {len(all_saved_files) - 5} more files")
+                        logger.info("[FORM1S4]     ... and %s more files", len(all_saved_files) - 5)
 
                 # Store results
-                self.results["form1s4"] = {
+                self.results.form1s4 = {
                     "status": "completed",
                     "total_files": len(shape_column_files),
                     "successful_files": total_successful,
@@ -589,30 +790,30 @@ class TableDetectionPipeline:
                 return True
             else:
                 error_msg = "No files processed successfully"
-                print(f"[FORM1S4] [ERROR] {error_msg}")
+                logger.error("[FORM1S4] [ERROR] %s", error_msg)
 
-                self.results["form1s4"] = {
+                self.results.form1s4 = {
                     "status": "completed_with_errors",
                     "total_files": len(shape_column_files),
                     "successful_files": 0,
                     "failed_files": len(shape_column_files),
                     "error": error_msg
                 }
-                self.results["errors"].append(f"Form1S4 error: {error_msg}")
+                self.results.errors.append(f"Form1S4 error: {error_msg}")
                 return False
 
         except Exception as e:
             error_msg = f"Failed to process shape_column files: {str(e)}"
-            print(f"[FORM1S4] [ERROR] {error_msg}")
+            logger.error("[FORM1S4] [ERROR] %s", error_msg)
 
-            self.results["form1s4"] = {
+            self.results.form1s4 = {
                 "status": "error",
                 "total_files": 1,
                 "successful_files": 0,
                 "failed_files": 1,
                 "error": error_msg
             }
-            self.results["errors"].append(error_msg)
+            self.results.errors.append(error_msg)
             return False
 
     def process_with_form1s4_1(self):
@@ -621,8 +822,8 @@ class TableDetectionPipeline:
 
         try:
             # Initialize Form1S4.1 agent
-            form1s4_1_agent = Form1S4_1Agent()
-            print(f"[FORM1S4.1] Agent initialized: {form1s4_1_agent.name}")
+            form1s4_1_agent = self._get_agent("form1s4_1")
+            logger.info("[FORM1S4.1] Agent initialized: %s", form1s4_1_agent.name)
 
             # Use batch processing to handle all table_bodyonly files
             results = form1s4_1_agent.process_batch()
@@ -632,12 +833,12 @@ class TableDetectionPipeline:
 
                 if successful_results:
                     result = successful_results[0]  # Take first successful result
-                    print(f"[FORM1S4.1] [SUCCESS] Full drawing column extraction completed")
-                    print(f"[FORM1S4.1]   Order: {result.get('order_name', 'Unknown')}")
-                    print(f"[FORM1S4.1]   Column dimensions: {result.get('column_width', 0)}x{result.get('column_height', 0)} px")
-                    print(f"[FORM1S4.1]   Output: {result.get('output_file', 'Unknown')}")
+                    logger.info("[FORM1S4.1] [SUCCESS] Full drawing column extraction completed")
+                    logger.info("[FORM1S4.1]   Order: %s", result.get('order_name', 'Unknown'))
+                    logger.info("[FORM1S4.1]   Column dimensions: %sx%s px", result.get('column_width', 0), result.get('column_height', 0))
+                    logger.info("[FORM1S4.1]   Output: %s", result.get('output_file', 'Unknown'))
 
-                    self.results["form1s4_1"] = {
+                    self.results.form1s4_1 = {
                         "status": "success",
                         "total_files": len(results),
                         "successful_files": len(successful_results),
@@ -648,26 +849,26 @@ class TableDetectionPipeline:
                     return True
                 else:
                     error_msg = "No successful column extractions"
-                    print(f"[FORM1S4.1] [ERROR] {error_msg}")
+                    logger.error("[FORM1S4.1] [ERROR] %s", error_msg)
 
-                    self.results["form1s4_1"] = {
+                    self.results.form1s4_1 = {
                         "status": "no_success",
                         "total_files": len(results),
                         "successful_files": 0,
                         "failed_files": len(results),
                         "error": error_msg
                     }
-                    self.results["errors"].append(f"Form1S4.1 error: {error_msg}")
+                    self.results.errors.append(f"Form1S4.1 error: {error_msg}")
                     return False
             else:
-                print(f"[FORM1S4.1] No table_bodyonly files found for processing")
-                self.results["form1s4_1"] = {"status": "no_files"}
+                logger.info("[FORM1S4.1] No table_bodyonly files found for processing")
+                self.results.form1s4_1 = {"status": "no_files"}
                 return True
 
         except Exception as e:
             error_msg = f"Failed during Form1S4.1 processing: {str(e)}"
-            print(f"[FORM1S4.1] [ERROR] {error_msg}")
-            self.results["errors"].append(error_msg)
+            logger.error("[FORM1S4.1] [ERROR] %s", error_msg)
+            self.results.errors.append(error_msg)
             return False
 
     def process_with_form1s5(self):
@@ -676,20 +877,18 @@ class TableDetectionPipeline:
 
         try:
             # Initialize Form1S5 agent
-            form1s5_agent = Form1S5Agent()
-            print(f"[FORM1S5] Agent initialized: {form1s5_agent.name}")
+            form1s5_agent = self._get_agent("form1s5")
+            logger.info("[FORM1S5] Agent initialized: %s", form1s5_agent.name)
 
             # Look for ordertable_gridlines.png from form1s3 output in grid folder with page number
-            gridlines_files = glob.glob(f"{self.output_dir}/table_detection/grid/*_ordertable_page1_gridlines.png")
+            gridlines_path = _find_one(self._grid_dir, "_ordertable_page1_gridlines.png")
 
-            if not gridlines_files:
-                print(f"[FORM1S5] ordertable_gridlines.png not found at {self.output_dir}/table_detection/grid/*_ordertable_page1_gridlines.png")
-                self.results["form1s5"] = {"status": "no_files"}
+            if not gridlines_path:
+                logger.info("[FORM1S5] ordertable_gridlines.png not found at %s/*_ordertable_page1_gridlines.png", self._grid_dir)
+                self.results.form1s5 = {"status": "no_files"}
                 return True
 
-            gridlines_path = gridlines_files[0]  # Use first matching file
-
-            print(f"[FORM1S5] Found ordertable_gridlines.png, processing order title extraction")
+            logger.info("[FORM1S5] Found ordertable_gridlines.png, processing order title extraction")
 
             try:
                 result = form1s5_agent.process_image(gridlines_path, self.output_dir)
@@ -698,12 +897,12 @@ class TableDetectionPipeline:
                     title_extraction = result.get("title_extraction", {})
                     title_dimensions = title_extraction.get("title_dimensions", {})
 
-                    print(f"[FORM1S5] [SUCCESS] Order title extraction completed")
-                    print(f"[FORM1S5]   Title dimensions: {title_dimensions.get('width', 0)}x{title_dimensions.get('height', 0)} px")
-                    print(f"[FORM1S5]   Saved to: {title_extraction.get('saved_file', 'N/A')}")
+                    logger.info("[FORM1S5] [SUCCESS] Order title extraction completed")
+                    logger.info("[FORM1S5]   Title dimensions: %sx%s px", title_dimensions.get('width', 0), title_dimensions.get('height', 0))
+                    logger.info("[FORM1S5]   Saved to: %s", title_extraction.get('saved_file', 'N/A'))
 
                     # Store results
-                    self.results["form1s5"] = {
+                    self.results.form1s5 = {
                         "status": "completed",
                         "total_files": 1,
                         "successful_files": 1,
@@ -713,47 +912,47 @@ class TableDetectionPipeline:
                     return True
                 else:
                     error_msg = result.get("error", "Unknown error")
-                    print(f"[FORM1S5] [ERROR] {error_msg}")
+                    logger.error("[FORM1S5] [ERROR] %s", error_msg)
 
-                    self.results["form1s5"] = {
+                    self.results.form1s5 = {
                         "status": "completed_with_errors",
                         "total_files": 1,
                         "successful_files": 0,
                         "failed_files": 1,
                         "error": error_msg
                     }
-                    self.results["errors"].append(f"Form1S5 error: {error_msg}")
+                    self.results.errors.append(f"Form1S5 error: {error_msg}")
                     return False
 
             except Exception as e:
                 error_msg = f"Failed to process ordertable_gridlines.png with Form1S5: {str(e)}"
-                print(f"[FORM1S5] [ERROR] {error_msg}")
+                logger.error("[FORM1S5] [ERROR] %s", error_msg)
 
-                self.results["form1s5"] = {
+                self.results.form1s5 = {
                     "status": "error",
                     "total_files": 1,
                     "successful_files": 0,
                     "failed_files": 1,
                     "error": error_msg
                 }
-                self.results["errors"].append(error_msg)
+                self.results.errors.append(error_msg)
                 return False
 
         except Exception as e:
             error_msg = f"Failed during Form1S5 processing: {str(e)}"
-            print(f"[FORM1S5] [ERROR] {error_msg}")
-            self.results["errors"].append(error_msg)
+            logger.error("[FORM1S5] [ERROR] %s", error_msg)
+            self.results.errors.append(error_msg)
             return False
 
     def process_all_pages(self):
         """Process all pages found in order_to_image folder through form1s2-5 pipeline"""
         # Find all page files in order_to_image directory
-        order_to_image_dir = os.path.join(self.output_dir, "order_to_image")
+        order_to_image_dir = self._order_to_image_dir
 
         if not os.path.exists(order_to_image_dir):
             print()
             print(f"[ERROR] order_to_image directory not found: {order_to_image_dir}")
-            self.results["errors"].append("order_to_image directory not found")
+            self.results.errors.append("order_to_image directory not found")
             return False
 
         # Find all page files
@@ -762,7 +961,7 @@ class TableDetectionPipeline:
         if not page_files:
             print()
             print(f"[ERROR] No page files found in {order_to_image_dir}")
-            self.results["errors"].append("No page files found in order_to_image directory")
+            self.results.errors.append("No page files found in order_to_image directory")
             return False
 
         # Sort files by page number
@@ -772,286 +971,392 @@ class TableDetectionPipeline:
         print(f"[INFO] Found {len(page_files)} page(s) to process")
 
         # Initialize results tracking for multiple pages
-        self.results["pages"] = {}
+        self.results.pages = {}
 
-        # Process each page through the complete pipeline
-        for page_file in page_files:
-            page_name = os.path.basename(page_file)
-            print()
-            print(f"[INFO] Processing page: {page_name}")
+        # Parse each page's name, page number and order number once
+        pages = [PageCtx.from_path(page_file) for page_file in page_files]
 
-            # Extract page number from filename
-            page_number = "1"
-            if "_page" in page_name:
+        if len(pages) == 1:
+            return self._process_single_page_optimized(pages[0])
+
+        # Phase A: pages are independent up to the table body - run each one in its own process
+        max_workers = min(len(pages), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker_logging,
+                                 initargs=(_worker_log_queue(),)) as executor:
+            futures = {}
+            for ctx in pages:
+                sys.stdout.write(f"\n[INFO] Processing page: {ctx.name}\n")
+                futures[executor.submit(_run_page, self.output_dir, ctx)] = ctx
+
+            for future in as_completed(futures):
+                ctx = futures[future]
                 try:
-                    page_number = page_name.split("_page")[1].split(".")[0]
-                except:
-                    page_number = "1"
+                    page_result = future.result()
+                except Exception as e:
+                    page_result = {"success": False, "stages": {}, "timings": {}, "errors": [f"Error processing page {ctx.number}: {str(e)}"]}
 
-            # Process this page through all steps
-            page_success = self.process_single_page(page_file, page_number)
+                self.results.errors.extend(page_result["errors"])
+                self._add_timings(page_result["timings"])
 
-            # Store page results
-            self.results["pages"][page_number] = {
-                "file": page_file,
-                "success": page_success
-            }
+                # Store page results
+                self.results.pages[ctx.number] = {
+                    "file": ctx.path,
+                    "sha256": self._file_hashes.get(ctx.path),
+                    "success": page_result["success"],
+                    "stages": page_result["stages"]
+                }
+
+            # Phase B: Form1S3.3 and Form1S4.1 process every page's files in one batch, so run them once
+            form1s3_3_success, form1s4_1_success = self._run_batch_stages()
+
+            # Phase C: Form1S4 needs the shape columns from Form1S4.1
+            futures = {}
+            if form1s4_1_success:
+                for ctx in pages:
+                    print(f"  -> Running Form1S4 for page {ctx.number}")
+                    futures[executor.submit(_run_page_shapes, self.output_dir, ctx)] = ctx
+            else:
+                print("  -> Skipping Form1S4 for all pages (no shape columns)")
+
+            for future in as_completed(futures):
+                ctx = futures[future]
+                try:
+                    page_result = future.result()
+                except Exception as e:
+                    page_result = {"success": False, "timings": {}, "errors": [f"Form1S4 page {ctx.number} error: {str(e)}"]}
+
+                self.results.errors.extend(page_result["errors"])
+                self._add_timings(page_result["timings"])
+                self.results.pages[ctx.number]["stages"]["form1s4"] = page_result["success"]
+
+        self._report_pages(form1s3_3_success, form1s4_1_success)
+
+    def _process_single_page_optimized(self, ctx):
+        """Run a one-page order in this process - the page worker pool only pays off with several pages"""
+        logger.info("[PERF] Single page found - processing it in-process without the page worker pool")
+        sys.stdout.write(f"\n[INFO] Processing page: {ctx.name}\n")
+
+        page_success = self.process_single_page(ctx)
+        self.results.pages[ctx.number] = {
+            "file": ctx.path,
+            "sha256": self._file_hashes.get(ctx.path),
+            "success": page_success,
+            "stages": self.results.pages[ctx.number]["stages"]
+        }
+
+        form1s3_3_success, form1s4_1_success = self._run_batch_stages()
+
+        # Form1S4 needs the shape column from Form1S4.1
+        if form1s4_1_success:
+            print(f"  -> Running Form1S4 for page {ctx.number}")
+            self.results.pages[ctx.number]["stages"]["form1s4"] = self.process_page_with_form1s4(ctx)
+        else:
+            print("  -> Skipping Form1S4 for all pages (no shape columns)")
+
+        self._report_pages(form1s3_3_success, form1s4_1_success)
+
+    def _run_batch_stages(self):
+        """Run the Form1S3.3 and Form1S4.1 batches once for all pages and record them on every page"""
+        # They read different directories (grid vs table) and can run side by side
+        print()
+        print("[INFO] Running Form1S3.3 and Form1S4.1 batches for all pages")
+        with ThreadPoolExecutor(max_workers=2) as batch_executor:
+            form1s3_3_future = batch_executor.submit(self.process_batch_with_form1s3_3)
+            form1s4_1_future = batch_executor.submit(self.process_batch_with_form1s4_1)
+            form1s3_3_success = form1s3_3_future.result()
+            form1s4_1_success = form1s4_1_future.result()
+
+        for page_info in self.results.pages.values():
+            page_info["stages"]["form1s3_3"] = form1s3_3_success
+            page_info["stages"]["form1s4_1"] = form1s4_1_success
+
+        return form1s3_3_success, form1s4_1_success
+
+    def _report_pages(self, form1s3_3_success, form1s4_1_success):
+        """Fold the batch stage outcomes into each page's success and print the per-page status"""
+        lines = []
+        for page_number, page_info in sorted(self.results.pages.items()):
+            page_info["stages"].setdefault("form1s4", False)
+            page_success = page_info["success"] and form1s3_3_success and form1s4_1_success and page_info["stages"]["form1s4"]
+            page_info["success"] = page_success
 
             if page_success:
-                print(f"[SUCCESS] Page {page_number} processed successfully")
+                lines.append(f"[SUCCESS] Page {page_number} processed successfully")
             else:
-                print(f"[ERROR] Page {page_number} processing failed")
+                lines.append(f"[ERROR] Page {page_number} processing failed")
+        sys.stdout.write("\n".join(lines) + "\n")
 
-    def process_single_page(self, page_file, page_number):
-        """Process a single page through form1s2-5 pipeline"""
-        try:
-            page_name = os.path.basename(page_file)
+    def _add_timings(self, timings):
+        """Merge stage timings reported by a page worker into this run's totals"""
+        for name, seconds in timings.items():
+            self.results.timings[name] = self.results.timings.get(name, 0.0) + seconds
+
+    def process_single_page(self, ctx):
+        """Process a single page through the per-page stages (form1s2, form1s3, form1s3_1, form1s3_2, form1s5)"""
+        # Stage outcomes for this page - skipped stages are recorded as failed
+        successes = {}
+        self.results.pages.setdefault(ctx.number, {})["stages"] = successes
 
+        try:
             # Step 1: Form1S2 - Table boundary detection
-            print(f"  -> Running Form1S2 for page {page_number}")
-            form1s2_success = self.process_page_with_form1s2(page_file, page_number)
+            print(f"  -> Running Form1S2 for page {ctx.number}")
+            successes["form1s2"] = self.process_page_with_form1s2(ctx)
 
-            if not form1s2_success:
-                print(f"  -> Form1S2 failed for page {page_number}")
+            if not successes["form1s2"]:
+                print(f"  -> Form1S2 failed for page {ctx.number}")
                 return False
 
             # Step 2: Form1S3 - Grid line detection
-            print(f"  -> Running Form1S3 for page {page_number}")
-            form1s3_success = self.process_page_with_form1s3(page_number)
+            print(f"  -> Running Form1S3 for page {ctx.number}")
+            successes["form1s3"] = self.process_page_with_form1s3(ctx)
 
-            if not form1s3_success:
-                print(f"  -> Form1S3 failed for page {page_number}")
+            if not successes["form1s3"]:
+                print(f"  -> Form1S3 failed for page {ctx.number}")
                 return False
 
-            # Step 3: Form1S3.1 - Table body extraction
-            print(f"  -> Running Form1S3.1 for page {page_number}")
-            form1s3_1_success = self.process_page_with_form1s3_1(page_number)
-
-            # Step 4: Form1S3.2 - Order line counting
-            print(f"  -> Running Form1S3.2 for page {page_number}")
-            form1s3_2_success = self.process_page_with_form1s3_2(page_number)
-
-            # Step 5: Form1S3.3 - Table header extraction
-            print(f"  -> Running Form1S3.3 for page {page_number}")
-            form1s3_3_success = self.process_page_with_form1s3_3(page_number)
+            # Form1S5 only needs the Form1S3 gridlines, so it runs alongside the
+            # table body chain instead of waiting for it
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # Step 8: Form1S5 - Order title extraction
+                print(f"  -> Running Form1S5 for page {ctx.number}")
+                form1s5_future = executor.submit(self.process_page_with_form1s5, ctx)
+
+                # Step 3: Form1S3.1 - Table body extraction
+                print(f"  -> Running Form1S3.1 for page {ctx.number}")
+                successes["form1s3_1"] = self.process_page_with_form1s3_1(ctx)
+
+                # Step 4: Form1S3.2 - Order line counting (needs the table body from Form1S3.1)
+                if successes["form1s3_1"]:
+                    print(f"  -> Running Form1S3.2 for page {ctx.number}")
+                    successes["form1s3_2"] = self.process_page_with_form1s3_2(ctx)
+                else:
+                    print(f"  -> Skipping Form1S3.2 for page {ctx.number} (no table body)")
+                    successes["form1s3_2"] = False
 
-            # Step 6: Form1S4.1 - Full drawing column extraction (must run first)
-            print(f"  -> Running Form1S4.1 for page {page_number}")
-            form1s4_1_success = self.process_page_with_form1s4_1(page_number)
+                # Form1S3.3, Form1S4.1 and Form1S4 run from process_all_pages once every
+                # page has its table body (see process_batch_with_form1s3_3/form1s4_1)
 
-            # Step 7: Form1S4 - Drawing cell extraction from shape columns
-            print(f"  -> Running Form1S4 for page {page_number}")
-            form1s4_success = self.process_page_with_form1s4(page_number)
+                successes["form1s5"] = form1s5_future.result()
 
-            # Step 8: Form1S5 - Order title extraction
-            print(f"  -> Running Form1S5 for page {page_number}")
-            form1s5_success = self.process_page_with_form1s5(page_number)
-
-            return True
+            return all(successes.values())
 
         except Exception as e:
-            error_msg = f"Error processing page {page_number}: {str(e)}"
+            error_msg = f"Error processing page {ctx.number}: {str(e)}"
             print(f"  -> {error_msg}")
-            self.results["errors"].append(error_msg)
+            self.results.errors.append(error_msg)
             return False
 
-    def process_page_with_form1s2(self, page_file, page_number):
+        finally:
+            self._gridlines_images.pop(ctx.number, None)
+
+    def _rebuild_index(self):
+        """Scan the table_detection stage directories once and group their files by (order, page number)"""
+        intermediate_index = defaultdict(dict)
+        for stage_dir in (self._grid_dir, self._table_dir, self._shape_col_dir):
+            try:
+                entries = os.scandir(stage_dir)
+            except FileNotFoundError:
+                continue
+            with entries:
+                for entry in entries:
+                    match = _STAGE_FILE_RE.match(entry.name)
+                    if match:
+                        kind = match["kind"] + (match["gridlines"] or "")
+                        intermediate_index[(match["order"], match["page"])].setdefault(kind, entry.path)
+        self._intermediate_index = intermediate_index
+
+    def _find_stage_file(self, kind, ctx):
+        """Look up a stage output file for a page, rescanning the stage directories on a miss"""
+        key = (ctx.order, ctx.number)
+        path = self._intermediate_index.get(key, {}).get(kind)
+        if path is None:
+            # The producing stage has run since the last scan
+            self._rebuild_index()
+            path = self._intermediate_index.get(key, {}).get(kind)
+        return path
+
+    @_stage("form1s2", "Form1S2")
+    def process_page_with_form1s2(self, ctx):
         """Process single page with Form1S2 agent"""
-        try:
-            form1s2_agent = Form1S2Agent()
-            result = form1s2_agent.process_image(page_file)
-            return result.get("status") == "success"
-        except Exception as e:
-            self.results["errors"].append(f"Form1S2 page {page_number} error: {str(e)}")
-            return False
+        form1s2_agent = self._get_agent("form1s2")
+        result = form1s2_agent.process_image(ctx.path)
+        return result.get("status") == "success"
 
-    def process_page_with_form1s3(self, page_number):
+    @_stage("form1s3", "Form1S3")
+    def process_page_with_form1s3(self, ctx):
         """Process single page with Form1S3 agent"""
-        try:
-            form1s3_agent = Form1S3Agent()
-            # Look for ordertable file for this page
-            ordertable_pattern = f"{self.output_dir}/table_detection/grid/*_ordertable_page{page_number}.png"
-            ordertable_files = glob.glob(ordertable_pattern)
+        form1s3_agent = self._get_agent("form1s3")
+        # Look for ordertable file for this page
+        ordertable_path = self._find_stage_file("ordertable", ctx)
 
-            if not ordertable_files:
-                return False
-
-            result = form1s3_agent.process_image(ordertable_files[0])
-            return result.get("status") == "success"
-        except Exception as e:
-            self.results["errors"].append(f"Form1S3 page {page_number} error: {str(e)}")
+        if not ordertable_path:
             return False
 
-    def process_page_with_form1s3_1(self, page_number):
-        """Process single page with Form1S3.1 agent"""
-        try:
-            form1s3_1_agent = Form1S31Agent()
-            # Look for gridlines file for this page
-            gridlines_pattern = f"{self.output_dir}/table_detection/grid/*_ordertable_page{page_number}_gridlines.png"
-            gridlines_files = glob.glob(gridlines_pattern)
+        # Keep the gridlines image in memory for Form1S3.1 and Form1S5 on this page
+        result = form1s3_agent.process_image(ordertable_path, keep_image=True)
+        gridlines_image = result.pop("image", None)
+        if gridlines_image is not None:
+            self._gridlines_images[ctx.number] = gridlines_image
+        return result.get("status") == "success"
 
-            if not gridlines_files:
-                return False
+    @_stage("form1s3_1", "Form1S3.1")
+    def process_page_with_form1s3_1(self, ctx):
+        """Process single page with Form1S3.1 agent"""
+        form1s3_1_agent = self._get_agent("form1s3_1")
+        # Look for gridlines file for this page
+        gridlines_path = self._find_stage_file("ordertable_gridlines", ctx)
 
-            output_dir = f"{self.output_dir}/table_detection/table"
-            result = form1s3_1_agent.process_file(gridlines_files[0], output_dir)
-            return result.get("status") == "success"
-        except Exception as e:
-            self.results["errors"].append(f"Form1S3.1 page {page_number} error: {str(e)}")
+        if not gridlines_path:
             return False
 
-    def process_page_with_form1s3_2(self, page_number):
-        """Process single page with Form1S3.2 agent"""
-        try:
-            form1s3_2_agent = Form1S32Agent()
-            # Look for table_bodyonly file for this page
-            table_body_pattern = f"{self.output_dir}/table_detection/table/*_table_bodyonly_page{page_number}.png"
-            table_body_files = glob.glob(table_body_pattern)
+        output_dir = str(self._table_dir)
+        result = form1s3_1_agent.process_file(gridlines_path, output_dir, self._gridlines_images.get(ctx.number))
+        return result.get("status") == "success"
 
-            if not table_body_files:
-                return False
+    @_stage("form1s3_2", "Form1S3.2")
+    def process_page_with_form1s3_2(self, ctx):
+        """Process single page with Form1S3.2 agent"""
+        form1s3_2_agent = self._get_agent("form1s3_2")
+        # Look for table_bodyonly file for this page
+        table_body_path = self._find_stage_file("table_bodyonly", ctx)
 
-            output_dir = f"{self.output_dir}/table_detection/table"
-            result = form1s3_2_agent.process_file(table_body_files[0], output_dir)
-            return result.get("status") == "success"
-        except Exception as e:
-            self.results["errors"].append(f"Form1S3.2 page {page_number} error: {str(e)}")
+        if not table_body_path:
             return False
 
-    def process_page_with_form1s3_3(self, page_number):
-        """Process single page with Form1S3.3 agent"""
-        try:
-            form1s3_3_agent = Form1S3_3Agent()
-            results = form1s3_3_agent.process_batch()
-            return len([r for r in results if r.get("status") == "success"]) > 0
-        except Exception as e:
-            self.results["errors"].append(f"Form1S3.3 page {page_number} error: {str(e)}")
-            return False
+        output_dir = str(self._table_dir)
+        result = form1s3_2_agent.process_file(table_body_path, output_dir)
+        return result.get("status") == "success"
 
-    def process_page_with_form1s4(self, page_number):
-        """Process single page with Form1S4 agent using shape column files"""
-        try:
-            form1s4_agent = Form1S4Agent()
-            # Look for shape_column file for this page (created by Form1S4_1)
-            shape_column_pattern = f"{self.output_dir}/table_detection/shape_column/*_shape_column_page{page_number}.png"
-            shape_column_files = glob.glob(shape_column_pattern)
+    @_stage("form1s3_3", "Form1S3.3")
+    def process_batch_with_form1s3_3(self):
+        """Process every page's gridlines file with Form1S3.3 agent in one batch"""
+        form1s3_3_agent = self._get_agent("form1s3_3")
+        results = form1s3_3_agent.process_batch()
+        return len([r for r in results if r.get("status") == "success"]) > 0
 
-            if not shape_column_files:
-                print(f"[FORM1S4] No shape column file found for page {page_number}")
-                return False
+    @_stage("form1s4", "Form1S4")
+    def process_page_with_form1s4(self, ctx):
+        """Process single page with Form1S4 agent using shape column files"""
+        form1s4_agent = self._get_agent("form1s4")
+        # Look for shape_column file for this page (created by Form1S4_1)
+        shape_column_path = self._find_stage_file("shape_column", ctx)
 
-            result = form1s4_agent.process_image(shape_column_files[0])
-            return result.get("status") == "success"
-        except Exception as e:
-            self.results["errors"].append(f"Form1S4 page {page_number} error: {str(e)}")
+        if not shape_column_path:
+            print(f"[FORM1S4] No shape column file found for page {ctx.number}")
             return False
 
-    def process_page_with_form1s4_1(self, page_number):
-        """Process single page with Form1S4.1 agent"""
-        try:
-            form1s4_1_agent = Form1S4_1Agent()
-            results = form1s4_1_agent.process_batch()
-            return len([r for r in results if r.get("status") == "success"]) > 0
-        except Exception as e:
-            self.results["errors"].append(f"Form1S4.1 page {page_number} error: {str(e)}")
-            return False
+        result = form1s4_agent.process_image(shape_column_path)
+        return result.get("status") == "success"
 
-    def process_page_with_form1s5(self, page_number):
-        """Process single page with Form1S5 agent"""
-        try:
-            form1s5_agent = Form1S5Agent()
-            # Look for gridlines file for this page
-            gridlines_pattern = f"{self.output_dir}/table_detection/grid/*_page{page_number}_gridlines.png"
-            gridlines_files = glob.glob(gridlines_pattern)
+    @_stage("form1s4_1", "Form1S4.1")
+    def process_batch_with_form1s4_1(self):
+        """Process every page's table file with Form1S4.1 agent in one batch"""
+        form1s4_1_agent = self._get_agent("form1s4_1")
+        results = form1s4_1_agent.process_batch()
+        return len([r for r in results if r.get("status") == "success"]) > 0
 
-            if not gridlines_files:
-                return False
+    @_stage("form1s5", "Form1S5")
+    def process_page_with_form1s5(self, ctx):
+        """Process single page with Form1S5 agent"""
+        form1s5_agent = self._get_agent("form1s5")
+        # Look for gridlines file for this page
+        gridlines_path = self._find_stage_file("ordertable_gridlines", ctx)
 
-            result = form1s5_agent.process_image(gridlines_files[0], self.output_dir)
-            return result.get("status") == "success"
-        except Exception as e:
-            self.results["errors"].append(f"Form1S5 page {page_number} error: {str(e)}")
+        if not gridlines_path:
             return False
 
+        result = form1s5_agent.process_image(gridlines_path, self.output_dir, self._gridlines_images.get(ctx.number))
+        return result.get("status") == "success"
+
     def print_summary(self):
         """Print final summary of the pipeline execution"""
         self.print_section("PIPELINE SUMMARY")
 
+        # Collect the summary and write it in one go
+        lines = []
+
         # Calculate execution time
-        if self.start_time:
-            execution_time = datetime.now() - self.start_time
-            print(f"Total execution time: {execution_time.total_seconds():.2f} seconds")
-            print()
+        if self._t0 is not None:
+            elapsed = time.perf_counter() - self._t0
+            lines.append(f"Total execution time: {elapsed:.2f} seconds")
+            lines.append("")
+
+        # Per-stage time summed over all pages
+        if self.results.timings:
+            lines.append("Stage timings (summed over pages):")
+            for name, seconds in self.results.timings.items():
+                lines.append(f"  {name}: {seconds:.2f} seconds")
+            lines.append("")
 
         # Cleaning summary
-        if self.results["cleaning"]:
-            if self.results["cleaning"].get("status") == "skipped":
-                print("[CLEAN] Output Cleaning: SKIPPED")
-            elif self.results["cleaning"].get("status") == "already_clean":
-                print("[CLEAN] Output Cleaning: Already Clean")
-            elif self.results["cleaning"].get("status") == "success":
-                stats = self.results["cleaning"].get("statistics", {})
-                print(f"[CLEAN] Output Cleaning: {stats.get('files_deleted', 0)} files deleted")
+        if self.results.cleaning:
+            if self.results.cleaning.get("status") == "skipped":
+                lines.append("[CLEAN] Output Cleaning: SKIPPED")
+            elif self.results.cleaning.get("status") == "already_clean":
+                lines.append("[CLEAN] Output Cleaning: Already Clean")
+            elif self.results.cleaning.get("status") == "success":
+                stats = self.results.cleaning.get("statistics", {})
+                lines.append(f"[CLEAN] Output Cleaning: {stats.get('files_deleted', 0)} files deleted")
 
         # Format 1 processing summary
-        if self.results["form1s1"]:
-            form1_result = self.results["form1s1"]
+        if self.results.form1s1:
+            form1_result = self.results.form1s1
             if form1_result.get("status") == "no_files":
-                print("[FORMAT1] Processing: No PDF files found")
+                lines.append("[FORMAT1] Processing: No PDF files found")
             elif form1_result.get("status") in ["completed", "completed_with_errors"]:
                 summary = form1_result.get("summary", {})
                 for step_name, step_info in summary.get("steps_summary", {}).items():
-                    print(f"[FORMAT1] {step_name}: {step_info.get('success_count', 0)}/{step_info.get('files_processed', 0)} files processed")
+                    lines.append(f"[FORMAT1] {step_name}: {step_info.get('success_count', 0)}/{step_info.get('files_processed', 0)} files processed")
 
         # Form1S2 processing summary
-        if self.results["form1s2"]:
-            form1s2_result = self.results["form1s2"]
+        if self.results.form1s2:
+            form1s2_result = self.results.form1s2
             if form1s2_result.get("status") == "no_files":
-                print("[FORM1S2] Table Detection: No page1.png files found")
+                lines.append("[FORM1S2] Table Detection: No page1.png files found")
             elif form1s2_result.get("status") in ["completed", "completed_with_errors"]:
-                print(f"[FORM1S2] Table Detection: {form1s2_result.get('successful_files', 0)}/{form1s2_result.get('total_files', 0)} files processed")
+                lines.append(f"[FORM1S2] Table Detection: {form1s2_result.get('successful_files', 0)}/{form1s2_result.get('total_files', 0)} files processed")
 
         # Form1S3 processing summary
-        if self.results["form1s3"]:
-            form1s3_result = self.results["form1s3"]
+        if self.results.form1s3:
+            form1s3_result = self.results.form1s3
             if form1s3_result.get("status") == "no_files":
-                print("[FORM1S3] Grid Line Detection: No ordertable.png found")
+                lines.append("[FORM1S3] Grid Line Detection: No ordertable.png found")
             elif form1s3_result.get("status") in ["completed", "completed_with_errors"]:
                 result_data = form1s3_result.get("result", {})
                 grid_lines = result_data.get("grid_lines", {})
                 horizontal_count = grid_lines.get("horizontal_count", 0)
                 vertical_count = grid_lines.get("vertical_count", 0)
-                print(f"[FORM1S3] Grid Line Detection: {horizontal_count} horizontal, {vertical_count} vertical lines detected")
+                lines.append(f"[FORM1S3] Grid Line Detection: {horizontal_count} horizontal, {vertical_count} vertical lines detected")
 
         # Form1S3.1 processing summary
-        if self.results["form1s3_1"]:
-            form1s3_1_result = self.results["form1s3_1"]
+        if self.results.form1s3_1:
+            form1s3_1_result = self.results.form1s3_1
             if form1s3_1_result.get("status") == "no_files":
-                print("[FORM1S3.1] Table Body Extraction: No ordertable_gridlines.png found")
+                lines.append("[FORM1S3.1] Table Body Extraction: No ordertable_gridlines.png found")
             elif form1s3_1_result.get("status") == "success":
                 table_dims = form1s3_1_result.get("table_dimensions", {})
                 width = table_dims.get("width", 0)
                 height = table_dims.get("height", 0)
-                print(f"[FORM1S3.1] Table Body Extraction: {width}x{height} px table body extracted")
+                lines.append(f"[FORM1S3.1] Table Body Extraction: {width}x{height} px table body extracted")
 
         # Form1S3.2 processing summary
-        if self.results["form1s3_2"]:
-            form1s3_2_result = self.results["form1s3_2"]
+        if self.results.form1s3_2:
+            form1s3_2_result = self.results.form1s3_2
             if form1s3_2_result.get("status") == "no_files":
-                print("[FORM1S3.2] Order Line Counting: No table_body.png found")
+                lines.append("[FORM1S3.2] Order Line Counting: No table_body.png found")
             elif form1s3_2_result.get("status") == "success":
                 row_count = form1s3_2_result.get("row_count", 0)
                 coords_count = len(form1s3_2_result.get("row_coordinates", []))
                 if coords_count > 0:
-                    print(f"[FORM1S3.2] Order Line Counting: {row_count} order lines detected by ChatGPT, {coords_count} Y coordinates extracted")
+                    lines.append(f"[FORM1S3.2] Order Line Counting: {row_count} order lines detected by ChatGPT, {coords_count} Y coordinates extracted")
                 else:
-                    print(f"[FORM1S3.2] Order Line Counting: {row_count} order lines detected by ChatGPT")
+                    lines.append(f"[FORM1S3.2] Order Line Counting: {row_count} order lines detected by ChatGPT")
 
         # Form1S3.3 processing summary
-        if self.results.get("form1s3_3"):
-            form1s3_3_result = self.results["form1s3_3"]
+        if self.results.form1s3_3:
+            form1s3_3_result = self.results.form1s3_3
             if form1s3_3_result.get("status") == "no_files":
-                print("[FORM1S3.3] Table Header Extraction: No gridlines files found")
+                lines.append("[FORM1S3.3] Table Header Extraction: No gridlines files found")
             elif form1s3_3_result.get("status") == "success":
                 successful = form1s3_3_result.get("successful", 0)
                 # Get first successful result for dimensions
@@ -1061,67 +1366,85 @@ class TableDetectionPipeline:
                     if first_success:
                         width = first_success.get("header_width", 0)
                         height = first_success.get("header_height", 0)
-                        print(f"[FORM1S3.3] Table Header Extraction: {width}x{height} px header extracted")
+                        lines.append(f"[FORM1S3.3] Table Header Extraction: {width}x{height} px header extracted")
                     else:
-                        print(f"[FORM1S3.3] Table Header Extraction: {successful} header(s) extracted")
+                        lines.append(f"[FORM1S3.3] Table Header Extraction: {successful} header(s) extracted")
                 else:
-                    print(f"[FORM1S3.3] Table Header Extraction: {successful} header(s) extracted")
+                    lines.append(f"[FORM1S3.3] Table Header Extraction: {successful} header(s) extracted")
             elif form1s3_3_result.get("status") == "no_success":
-                print("[FORM1S3.3] Table Header Extraction: No files successfully processed")
+                lines.append("[FORM1S3.3] Table Header Extraction: No files successfully processed")
 
         # Form1S4 processing summary
-        if self.results["form1s4"]:
-            form1s4_result = self.results["form1s4"]
+        if self.results.form1s4:
+            form1s4_result = self.results.form1s4
             if form1s4_result.get("status") == "no_files":
-                print("[FORM1S4] Drawing Cell Extraction: No ordertable_gridlines.png found")
+                lines.append("[FORM1S4] Drawing Cell Extraction: No ordertable_gridlines.png found")
             elif form1s4_result.get("status") in ["completed", "completed_with_errors"]:
                 result_data = form1s4_result.get("result", {})
                 extraction_results = result_data.get("extraction_results", {})
                 total_cells = extraction_results.get("total_cells_extracted", 0)
-                print(f"[FORM1S4] Drawing Cell Extraction: {total_cells} drawing cells extracted")
+                lines.append(f"[FORM1S4] Drawing Cell Extraction: {total_cells} drawing cells extracted")
 
         # Form1S4.1 processing summary
-        if self.results.get("form1s4_1"):
-            form1s4_1_result = self.results["form1s4_1"]
+        if self.results.form1s4_1:
+            form1s4_1_result = self.results.form1s4_1
             if form1s4_1_result.get("status") == "no_files":
-                print("[FORM1S4.1] Full Drawing Column Extraction: No gridlines files found")
+                lines.append("[FORM1S4.1] Full Drawing Column Extraction: No gridlines files found")
             elif form1s4_1_result.get("status") == "success":
                 successful_files = form1s4_1_result.get("successful_files", 0)
                 column_dimensions = form1s4_1_result.get("column_dimensions", [])
                 if column_dimensions:
                     width, height = column_dimensions[0]
-                    print(f"[FORM1S4.1] Full Drawing Column Extraction: {width}x{height} px column extracted")
+                    lines.append(f"[FORM1S4.1] Full Drawing Column Extraction: {width}x{height} px column extracted")
                 else:
-                    print(f"[FORM1S4.1] Full Drawing Column Extraction: {successful_files} column(s) extracted")
+                    lines.append(f"[FORM1S4.1] Full Drawing Column Extraction: {successful_files} column(s) extracted")
             elif form1s4_1_result.get("status") == "no_success":
-                print("[FORM1S4.1] Full Drawing Column Extraction: No files successfully processed")
+                lines.append("[FORM1S4.1] Full Drawing Column Extraction: No files successfully processed")
 
         # Form1S5 processing summary
-        if self.results["form1s5"]:
-            form1s5_result = self.results["form1s5"]
+        if self.results.form1s5:
+            form1s5_result = self.results.form1s5
             if form1s5_result.get("status") == "no_files":
-                print("[FORM1S5] Order Title Extraction: No ordertable_gridlines.png found")
+                lines.append("[FORM1S5] Order Title Extraction: No ordertable_gridlines.png found")
             elif form1s5_result.get("status") in ["completed", "completed_with_errors"]:
                 result_data = form1s5_result.get("result", {})
                 title_extraction = result_data.get("title_extraction", {})
                 title_dimensions = title_extraction.get("title_dimensions", {})
                 width = title_dimensions.get("width", 0)
                 height = title_dimensions.get("height", 0)
-                print(f"[FORM1S5] Order Title Extraction: {width}x{height} px title extracted")
+                lines.append(f"[FORM1S5] Order Title Extraction: {width}x{height} px title extracted")
 
         # Error summary
-        if self.results["errors"]:
-            print()
-            print("[WARNING] Errors encountered:")
-            for error in self.results["errors"]:
-                print(f"  - {error}")
+        if self.results.errors:
+            lines.append("")
+            lines.append("[WARNING] Errors encountered:")
+            for error in self.results.errors:
+                lines.append(f"  - {error}")
 
         # Success status
-        print()
-        if not self.results["errors"]:
-            print("[SUCCESS] PIPELINE COMPLETED SUCCESSFULLY")
+        lines.append("")
+        if not self.results.errors:
+            lines.append("[SUCCESS] PIPELINE COMPLETED SUCCESSFULLY")
         else:
-            print("[WARNING] PIPELINE COMPLETED WITH ERRORS")
+            lines.append("[WARNING] PIPELINE COMPLETED WITH ERRORS")
+
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def save_results(self):
+        """Persist the pipeline results to io/log (msgpack, JSON fallback)"""
+        try:
+            results = self.results.to_dict()
+            if MSGPACK_AVAILABLE:
+                results_path = "io/log/pipeline_results.msgpack"
+                with open(results_path, "wb") as f:
+                    f.write(msgpack.packb(results, use_bin_type=True, default=str))
+            else:
+                results_path = "io/log/pipeline_results.json"
+                with open(results_path, "w", encoding="utf-8") as f:
+                    json.dump(results, f, ensure_ascii=False, default=str)
+            print(f"[INFO] Pipeline results saved to: {results_path}")
+        except Exception as e:
+            print(f"[WARNING] Failed to save pipeline results: {str(e)}")
 
     def process_with_form1ocr1(self):
         """Process order header with Form1OCR1 agent (page 1 only)"""
@@ -1129,41 +1452,37 @@ class TableDetectionPipeline:
 
         try:
             # Check if order header image from page 1 exists
-            order_header_dir = os.path.join(self.output_dir, "table_detection", "order_header")
+            order_header_dir = self._order_header_dir
 
             if not os.path.exists(order_header_dir):
-                print("[FORM1OCR1] [ERROR] Order header directory not found")
-                self.results["form1ocr1"] = {"status": "failed", "error": "order_header directory not found"}
+                logger.error("[FORM1OCR1] [ERROR] Order header directory not found")
+                self.results.form1ocr1 = {"status": "failed", "error": "order_header directory not found"}
                 return False
 
-            # Look for page 1 order header image
-            page1_header_files = glob.glob(os.path.join(order_header_dir, "*_page1_order_header.png"))
-            if not page1_header_files:
-                # Try alternative naming patterns
-                page1_header_files = glob.glob(os.path.join(order_header_dir, "*_order_title_page1_order_header.png"))
+            # Look for page 1 order header image (also matches the *_order_title_page1_order_header.png naming)
+            page1_header_file = _find_one(order_header_dir, "_page1_order_header.png")
 
-            if not page1_header_files:
-                print("[FORM1OCR1] [ERROR] No page 1 order header image found")
-                self.results["form1ocr1"] = {"status": "failed", "error": "no page 1 order header image found"}
+            if not page1_header_file:
+                logger.error("[FORM1OCR1] [ERROR] No page 1 order header image found")
+                self.results.form1ocr1 = {"status": "failed", "error": "no page 1 order header image found"}
                 return False
 
-            page1_header_file = page1_header_files[0]
-            print(f"[FORM1OCR1] Found page 1 order header: {os.path.basename(page1_header_file)}")
+            logger.info("[FORM1OCR1] Found page 1 order header: %s", os.path.basename(page1_header_file))
 
             # Initialize and run Form1OCR1 agent
-            print("[FORM1OCR1] Starting OCR processing with ChatGPT...")
-            form1ocr1_agent = Form1OCR1Agent()
+            logger.info("[FORM1OCR1] Starting OCR processing with ChatGPT...")
+            form1ocr1_agent = self._get_agent("form1ocr1")
 
             # Process the order header
             result = form1ocr1_agent.process()
 
             if result['success']:
                 field_count = result['agent_result']['field_count']
-                print(f"[FORM1OCR1] [SUCCESS] Extracted {field_count} fields from order header")
-                print(f"[FORM1OCR1] OCR output: {result['agent_result']['output_file']}")
-                print(f"[FORM1OCR1] Website analysis file: {result['agent_result']['analysis_file']}")
+                logger.info("[FORM1OCR1] [SUCCESS] Extracted %s fields from order header", field_count)
+                logger.info("[FORM1OCR1] OCR output: %s", result['agent_result']['output_file'])
+                logger.info("[FORM1OCR1] Website analysis file: %s", result['agent_result']['analysis_file'])
 
-                self.results["form1ocr1"] = {
+                self.results.form1ocr1 = {
                     "status": "success",
                     "fields_extracted": field_count,
                     "output_file": result['agent_result']['output_file'],
@@ -1172,177 +1491,268 @@ class TableDetectionPipeline:
                 return True
             else:
                 error_msg = result.get('error', 'Unknown OCR error')
-                print(f"[FORM1OCR1] [ERROR] {error_msg}")
-                self.results["form1ocr1"] = {"status": "failed", "error": error_msg}
+                logger.error("[FORM1OCR1] [ERROR] %s", error_msg)
+                self.results.form1ocr1 = {"status": "failed", "error": error_msg}
                 return False
 
         except Exception as e:
             error_msg = f"Failed during Form1OCR1 processing: {str(e)}"
-            print(f"[FORM1OCR1] [ERROR] {error_msg}")
-            self.results["form1ocr1"] = {"status": "failed", "error": error_msg}
-            self.results["errors"].append(error_msg)
+            logger.error("[FORM1OCR1] [ERROR] %s", error_msg)
+            self.results.form1ocr1 = {"status": "failed", "error": error_msg}
+            self.results.errors.append(error_msg)
             return False
 
+    def _iter_bodyonly(self):
+        """Yield (file name, order number, page number) for each table_bodyonly file from form1s3.1"""
+        try:
+            entries = os.scandir(self._table_dir)
+        except FileNotFoundError:
+            return
+        with entries:
+            for entry in entries:
+                match = _BODYONLY_RE.search(entry.name)
+                if match:
+                    yield entry.name, match.group(1), match.group(2)
+
     def process_with_form1ocr2(self):
         """Process table bodies with Form1OCR2 agent for table OCR extraction"""
         self.print_section("STEP 7: TABLE OCR PROCESSING (FORM1OCR2)")
 
         try:
             # Initialize Form1OCR2 agent
-            form1ocr2_agent = Form1OCR2Agent()
-            print(f"[FORM1OCR2] Agent initialized: {form1ocr2_agent.short_name}")
-
-            # Look for table_bodyonly files from form1s3.1 output
-            table_bodyonly_files = glob.glob(f"{self.output_dir}/table_detection/table/*_table_bodyonly_page*.png")
-
-            if not table_bodyonly_files:
-                print(f"[FORM1OCR2] No table_bodyonly files found at {self.output_dir}/table_detection/table/")
-                self.results["form1ocr2"] = {"status": "no_files"}
-                return True
-
-            print(f"[FORM1OCR2] Found {len(table_bodyonly_files)} table_bodyonly files to process")
+            form1ocr2_agent = self._get_agent("form1ocr2")
+            logger.info("[FORM1OCR2] Agent initialized: %s", form1ocr2_agent.short_name)
 
             # Process each table_bodyonly file
             processed_files = []
             successful_files = 0
             failed_files = 0
 
-            for table_file in table_bodyonly_files:
-                file_name = os.path.basename(table_file)
-                print(f"[FORM1OCR2] Processing: {file_name}")
-
-                try:
-                    # Extract order number and page number from filename
-                    import re
-                    match = re.search(r'(.+)_table_bodyonly_page(\d+)\.png$', file_name)
-                    if not match:
-                        print(f"[FORM1OCR2] [ERROR] {file_name}: Could not extract order/page info")
-                        failed_files += 1
-                        continue
-
-                    order_number = match.group(1)
-                    page_number = match.group(2)
-
-                    # Process with Form1OCR2 agent
-                    result = form1ocr2_agent.process_page(order_number, page_number)
+            # Each page is a separate ChatGPT round-trip - stream the table_bodyonly files
+            # from form1s3.1 output straight into concurrent requests
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = {}
+                for file_name, order_number, page_number in self._iter_bodyonly():
+                    logger.info("[FORM1OCR2] Processing: %s", file_name)
+                    future = executor.submit(form1ocr2_agent.process_page, order_number, page_number)
+                    futures[future] = (file_name, order_number, page_number)
+
+                total_files = len(futures)
+                if not total_files:
+                    logger.info("[FORM1OCR2] No table_bodyonly files found at %s/", self._table_dir)
+                    self.results.form1ocr2 = {"status": "no_files"}
+                    return True
 
-                    if result and result.get("status") == "success":
-                        print(f"[FORM1OCR2] [SUCCESS] {file_name}")
-                        print(f"[FORM1OCR2]   OCR output: {result.get('output_file', 'N/A')}")
-                        successful_files += 1
-                    else:
-                        error_msg = result.get("error", "Unknown error") if result else "No result returned"
-                        print(f"[FORM1OCR2] [ERROR] {file_name}: {error_msg}")
+                logger.info("[FORM1OCR2] Submitted %s table_bodyonly files", total_files)
+
+                for future in as_completed(futures):
+                    file_name, order_number, page_number = futures[future]
+
+                    try:
+                        result = future.result()
+
+                        if result and result.get("status") == "success":
+                            logger.info("[FORM1OCR2] [SUCCESS] %s", file_name)
+                            logger.info("[FORM1OCR2]   OCR output: %s", result.get('output_file', 'N/A'))
+                            successful_files += 1
+                        else:
+                            error_msg = result.get("error", "Unknown error") if result else "No result returned"
+                            logger.error("[FORM1OCR2] [ERROR] %s: %s", file_name, error_msg)
+                            failed_files += 1
+
+                        processed_files.append({
+                            "file": file_name,
+                            "order_number": order_number,
+                            "page_number": page_number,
+                            "status": result.get("status", "error") if result else "error",
+                            "output_file": result.get("output_file") if result else None,
+                            "error": result.get("error") if result else "No result returned"
+                        })
+
+                    except Exception as e:
+                        error_msg = f"Failed to process {file_name}: {str(e)}"
+                        logger.error("[FORM1OCR2] [ERROR] %s", error_msg)
+                        processed_files.append({
+                            "file": file_name,
+                            "status": "error",
+                            "error": error_msg
+                        })
                         failed_files += 1
-
-                    processed_files.append({
-                        "file": file_name,
-                        "order_number": order_number,
-                        "page_number": page_number,
-                        "status": result.get("status", "error") if result else "error",
-                        "output_file": result.get("output_file") if result else None,
-                        "error": result.get("error") if result else "No result returned"
-                    })
-
-                except Exception as e:
-                    error_msg = f"Failed to process {file_name}: {str(e)}"
-                    print(f"[FORM1OCR2] [ERROR] {error_msg}")
-                    processed_files.append({
-                        "file": file_name,
-                        "status": "error",
-                        "error": error_msg
-                    })
-                    failed_files += 1
-                    self.results["errors"].append(error_msg)
+                        self.results.errors.append(error_msg)
 
             # Store results
-            self.results["form1ocr2"] = {
+            self.results.form1ocr2 = {
                 "status": "completed" if failed_files == 0 else "completed_with_errors",
-                "total_files": len(table_bodyonly_files),
+                "total_files": total_files,
                 "successful_files": successful_files,
                 "failed_files": failed_files,
                 "processed_files": processed_files
             }
 
-            print()
-            print(f"[FORM1OCR2] Processing summary:")
-            print(f"[FORM1OCR2]   Total files: {len(table_bodyonly_files)}")
-            print(f"[FORM1OCR2]   Successful: {successful_files}")
-            print(f"[FORM1OCR2]   Failed: {failed_files}")
+            logger.info("")
+            logger.info("[FORM1OCR2] Processing summary:")
+            logger.info("[FORM1OCR2]   Total files: %s", total_files)
+            logger.info("[FORM1OCR2]   Successful: %s", successful_files)
+            logger.info("[FORM1OCR2]   Failed: %s", failed_files)
 
             return failed_files == 0
 
         except Exception as e:
             error_msg = f"Failed during Form1OCR2 processing: {str(e)}"
-            print(f"[FORM1OCR2] [ERROR] {error_msg}")
-            self.results["errors"].append(error_msg)
+            logger.error("[FORM1OCR2] [ERROR] %s", error_msg)
+            self.results.errors.append(error_msg)
+            return False
+
+    def _dat1_up_to_date(self, order_number, out_file):
+        """Check whether an order's _out.json already holds the analysis of its current table OCR files"""
+        ocr_files = glob.glob(os.path.join(self._td_dir, "table_ocr", f"{order_number}_table_ocr_page*.json"))
+        if not ocr_files:
+            return False
+
+        out_mtime = os.path.getmtime(out_file)
+        if any(os.path.getmtime(ocr_file) >= out_mtime for ocr_file in ocr_files):
             return False
 
+        return self._has_dat1_analysis(out_file)
+
+    @staticmethod
+    def _has_dat1_analysis(out_file):
+        """Check that an order's _out.json holds the integrated Form1Dat1 section"""
+        # A rebuild that failed part way leaves the file without the integrated section
+        try:
+            with open(out_file, "rb") as f:
+                return b'"section_3_shape_analysis"' in f.read()
+        except OSError:
+            return False
+
+    def _dat1_cache_key(self, order_number):
+        """Hash an order's table OCR files together with the Form1Dat1 agent source, or None if it has none"""
+        ocr_files = sorted(glob.glob(os.path.join(self._td_dir, "table_ocr", f"{order_number}_table_ocr_page*.json")))
+        if not ocr_files:
+            return None
+
+        key = hashlib.sha256()
+        key.update(self._file_hash(inspect.getfile(_agent_class("form1dat1"))).encode())
+        for ocr_file in ocr_files:
+            key.update(os.path.basename(ocr_file).encode())
+            key.update(self._file_hash(ocr_file).encode())
+        return key.hexdigest()
+
     def process_with_form1dat1(self):
         """Process with Form1Dat1 agent for comprehensive data analysis"""
         self.print_section("STEP 8: COMPREHENSIVE DATA ANALYSIS (FORM1DAT1)")
 
         try:
             # Initialize Form1Dat1 agent
-            form1dat1_agent = Form1Dat1Agent()
-            print(f"[FORM1DAT1] Agent initialized: {form1dat1_agent.name}")
+            form1dat1_agent = self._get_agent("form1dat1")
+            logger.info("[FORM1DAT1] Agent initialized: %s", form1dat1_agent.name)
 
             # Look for order output files from previous processing
-            json_output_files = glob.glob(f"{self.output_dir}/json_output/*_out.json")
+            json_output_files = glob.glob(os.path.join(self._json_output_dir, "*_out.json"))
 
             if not json_output_files:
-                print(f"[FORM1DAT1] No JSON output files found at {self.output_dir}/json_output/")
-                self.results["form1dat1"] = {"status": "no_files"}
+                logger.info("[FORM1DAT1] No JSON output files found at %s/", self._json_output_dir)
+                self.results.form1dat1 = {"status": "no_files"}
                 return True
 
-            print(f"[FORM1DAT1] Found {len(json_output_files)} JSON output files to process")
+            logger.info("[FORM1DAT1] Found %s JSON output files to process", len(json_output_files))
 
             # Process each JSON file (representing an order)
             processed_orders = []
             successful_orders = 0
             failed_orders = 0
 
+            # Previous Form1Dat1 results by input hash
+            try:
+                with open(DAT1_CACHE_PATH, "r", encoding="utf-8") as f:
+                    dat1_cache = json.load(f)
+            except (OSError, ValueError):
+                dat1_cache = {}
+            cache_updated = False
+
+            # Orders still needing analysis, as (file name, order number, cache key)
+            pending = []
             for json_file in json_output_files:
                 file_name = os.path.basename(json_file)
-                print(f"[FORM1DAT1] Processing: {file_name}")
-
-                try:
-                    # Extract order number from filename
-                    order_number = file_name.replace("_out.json", "")
-
-                    # Process with Form1Dat1 agent
-                    result = form1dat1_agent.process_order(order_number)
-
-                    if result and result.get("status") == "success":
-                        print(f"[FORM1DAT1] [SUCCESS] {file_name}")
-                        print(f"[FORM1DAT1]   Analysis output: {result.get('output_file', 'N/A')}")
-                        successful_orders += 1
-                    else:
-                        error_msg = result.get("error", "Unknown error") if result else "No result returned"
-                        print(f"[FORM1DAT1] [ERROR] {file_name}: {error_msg}")
+                logger.info("[FORM1DAT1] Processing: %s", file_name)
+
+                # Extract order number from filename
+                order_number = file_name.replace("_out.json", "")
+
+                # Skip orders whose output was already rebuilt from the current table OCR files
+                if self._dat1_up_to_date(order_number, json_file):
+                    logger.info("[FORM1DAT1] [CACHE] %s is newer than its table OCR files - skipping", file_name)
+                    successful_orders += 1
+                    processed_orders.append(OrderResult(file_name, order_number, "cached", json_file))
+                    continue
+
+                cache_key = self._dat1_cache_key(order_number)
+                cached = dat1_cache.get(cache_key) if cache_key else None
+                cached_output = cached.get("output_file") if cached else None
+                if cached_output and self._has_dat1_analysis(cached_output):
+                    logger.info("[FORM1DAT1] [CACHE] %s table OCR unchanged since last analysis - skipping", file_name)
+                    successful_orders += 1
+                    processed_orders.append(OrderResult(file_name, order_number, "cached", cached_output))
+                    continue
+
+                pending.append((file_name, order_number, cache_key))
+
+            # Orders touch separate files, so they can be analysed in parallel worker processes
+            if len(pending) > 1:
+                executor = ProcessPoolExecutor(max_workers=min(len(pending), max(1, (os.cpu_count() or 1) - 1)),
+                                               initializer=_init_worker_logging,
+                                               initargs=(_worker_log_queue(),))
+                run_order = _run_one_order
+            else:
+                # A single order is not worth starting worker processes for
+                executor = ThreadPoolExecutor(max_workers=1)
+                run_order = form1dat1_agent.process_order
+
+            with executor:
+                futures = {executor.submit(run_order, order_number): (file_name, order_number, cache_key)
+                           for file_name, order_number, cache_key in pending}
+
+                for future in as_completed(futures):
+                    file_name, order_number, cache_key = futures[future]
+
+                    try:
+                        result = future.result()
+
+                        # Read the agent's result dict once
+                        if result:
+                            status = result.get("status", "error")
+                            output_file = result.get("output_file")
+                            error = result.get("error")
+                        else:
+                            status, output_file, error = "error", None, "No result returned"
+
+                        if status == "success":
+                            logger.info("[FORM1DAT1] [SUCCESS] %s", file_name)
+                            logger.info("[FORM1DAT1]   Analysis output: %s", output_file or "N/A")
+                            successful_orders += 1
+                            if cache_key:
+                                dat1_cache[cache_key] = {"output_file": output_file, "status": "success"}
+                                cache_updated = True
+                        else:
+                            logger.error("[FORM1DAT1] [ERROR] %s: %s", file_name, error or "Unknown error")
+                            failed_orders += 1
+
+                        processed_orders.append(OrderResult(file_name, order_number, status, output_file, error))
+
+                    except Exception as e:
+                        error_msg = f"Failed to process {file_name}: {str(e)}"
+                        logger.error("[FORM1DAT1] [ERROR] %s", error_msg)
+                        processed_orders.append(OrderResult(file_name, order_number, "error", error=error_msg))
                         failed_orders += 1
+                        self.results.errors.append(error_msg)
 
-                    processed_orders.append({
-                        "file": file_name,
-                        "order_number": order_number,
-                        "status": result.get("status", "error") if result else "error",
-                        "output_file": result.get("output_file") if result else None,
-                        "error": result.get("error") if result else "No result returned"
-                    })
-
-                except Exception as e:
-                    error_msg = f"Failed to process {file_name}: {str(e)}"
-                    print(f"[FORM1DAT1] [ERROR] {error_msg}")
-                    processed_orders.append({
-                        "file": file_name,
-                        "status": "error",
-                        "error": error_msg
-                    })
-                    failed_orders += 1
-                    self.results["errors"].append(error_msg)
+            # Persist the new cache entries in one write
+            if cache_updated:
+                with open(DAT1_CACHE_PATH, "w", encoding="utf-8") as f:
+                    json.dump(dat1_cache, f, ensure_ascii=False)
 
             # Store results
-            self.results["form1dat1"] = {
+            self.results.form1dat1 = {
                 "status": "completed" if failed_orders == 0 else "completed_with_errors",
                 "total_orders": len(json_output_files),
                 "successful_orders": successful_orders,
@@ -1350,23 +1760,31 @@ class TableDetectionPipeline:
                 "processed_orders": processed_orders
             }
 
-            print()
-            print(f"[FORM1DAT1] Processing summary:")
-            print(f"[FORM1DAT1]   Total orders: {len(json_output_files)}")
-            print(f"[FORM1DAT1]   Successful: {successful_orders}")
-            print(f"[FORM1DAT1]   Failed: {failed_orders}")
+            logger.info("")
+            logger.info("[FORM1DAT1] Processing summary:")
+            logger.info("[FORM1DAT1]   Total orders: %s", len(json_output_files))
+            logger.info("[FORM1DAT1]   Successful: %s", successful_orders)
+            logger.info("[FORM1DAT1]   Failed: %s", failed_orders)
 
             return failed_orders == 0
 
         except Exception as e:
             error_msg = f"Failed during Form1Dat1 processing: {str(e)}"
-            print(f"[FORM1DAT1] [ERROR] {error_msg}")
-            self.results["errors"].append(error_msg)
+            logger.error("[FORM1DAT1] [ERROR] %s", error_msg)
+            self.results.errors.append(error_msg)
             return False
 
     def run(self, skip_cleaning=False):
-        """Run the complete table detection pipeline"""
+        """Run the complete table detection pipeline
+
+        Step dependencies:
+            Format 1 (page images) -> page processing (order header + table body images)
+            page processing -> Form1OCR1 (page 1 order header)    } independent, run concurrently
+            page processing -> Form1OCR2 (table_bodyonly images)  }
+            Form1OCR1 + Form1OCR2 -> Form1Dat1 (reads both OCR outputs)
+        """
         self.start_time = datetime.now()
+        self._t0 = time.perf_counter()
         self.print_header()
 
         print(f"Starting at: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -1392,13 +1810,20 @@ class TableDetectionPipeline:
             print()
             print("[ERROR] Failed to extract pages from PDF - stopping pipeline")
             self.print_summary()
+            self.save_results()
             return False
 
+        # Hash the extracted page images once for reuse by the downstream stages
+        self.hash_page_files()
+
         # Step 3: Process all pages from order_to_image folder
         self.process_all_pages()
 
-        # Step 4: Run OCR on order header (page 1 only) after all table processing is complete
-        ocr_success = self.process_with_form1ocr1()
+        # Steps 4 and 5: order header OCR (page 1 only) and table OCR read different images and
+        # write different files, so both round-trips run at the same time
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(self.process_with_form1ocr1), executor.submit(self.process_with_form1ocr2)]
+            ocr_success, ocr2_success = [future.result() for future in futures]
 
         if ocr_success:
             print()
@@ -1407,9 +1832,6 @@ class TableDetectionPipeline:
             print()
             print("[WARNING] Form1OCR1 order header OCR failed, but continuing...")
 
-        # Step 5: Run Form1OCR2 for table OCR processing on all table_bodyonly files
-        ocr2_success = self.process_with_form1ocr2()
-
         if ocr2_success:
             print()
             print("[SUCCESS] Form1OCR2 table OCR processing completed successfully")
@@ -1417,7 +1839,7 @@ class TableDetectionPipeline:
             print()
             print("[WARNING] Form1OCR2 table OCR processing failed, but continuing...")
 
-        # Step 6: Run Form1Dat1 for comprehensive data analysis
+        # Step 6: Run Form1Dat1 for comprehensive data analysis once both OCR steps are done
         dat1_success = self.process_with_form1dat1()
 
         if dat1_success:
@@ -1429,8 +1851,70 @@ class TableDetectionPipeline:
 
         # Print summary
         self.print_summary()
-
-        return len(self.results["errors"]) == 0
+        self.save_results()
+
+        return len(self.results.errors) == 0
+
+def _worker_log_queue():
+    """Return the queue worker processes log through, starting its manager and file listener on first use"""
+    global _worker_log
+    if _worker_log is None:
+        manager = multiprocessing.Manager()
+        log_queue = manager.Queue()
+        listener = QueueListener(log_queue, _log_file_handler)
+        listener.start()
+        _worker_log = (manager, log_queue, listener)
+    return _worker_log[1]
+
+def _stop_worker_logging():
+    """Write out the queued worker log records and shut the manager down"""
+    global _worker_log
+    if _worker_log is not None:
+        manager, _, listener = _worker_log
+        listener.stop()
+        manager.shutdown()
+        _worker_log = None
+
+def _init_worker_logging(log_queue):
+    """Worker processes send their file records to the parent, which alone writes (and rotates) the log file"""
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        if isinstance(handler, QueueHandler):
+            root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+
+@lru_cache(maxsize=None)
+def _worker_agent(key):
+    """The agent for a stage in this worker process, constructed on its first task"""
+    return _agent_class(key)()
+
+def _worker_pipeline(output_dir):
+    """A fresh pipeline for one worker task that takes its agents from the worker's cache"""
+    pipeline = TableDetectionPipeline()
+    pipeline.output_dir = output_dir
+    pipeline._get_agent = _worker_agent
+    return pipeline
+
+def _run_page(output_dir, ctx):
+    """Worker entry point: process one page with the worker's agents, return its result dict"""
+    pipeline = _worker_pipeline(output_dir)
+    page_success = pipeline.process_single_page(ctx)
+    return {
+        "success": page_success,
+        "stages": pipeline.results.pages[ctx.number]["stages"],
+        "timings": pipeline.results.timings,
+        "errors": list(pipeline.results.errors)
+    }
+
+def _run_page_shapes(output_dir, ctx):
+    """Worker entry point: run Form1S4 on one page's shape column, return its result dict"""
+    pipeline = _worker_pipeline(output_dir)
+    page_success = pipeline.process_page_with_form1s4(ctx)
+    return {"success": page_success, "timings": pipeline.results.timings, "errors": list(pipeline.results.errors)}
+
+def _run_one_order(order_number):
+    """Worker entry point: run Form1Dat1 on one order and return the agent's result dict"""
+    return _worker_agent("form1dat1").process_order(order_number)
 
 def main():
     """Main entry point"""
@@ -1454,9 +1938,19 @@ def main():
         type=str,
         help="Override the default output directory"
     )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only log warnings and errors to the console (the log file still gets everything)"
+    )
 
     args = parser.parse_args()
 
+    if args.quiet:
+        for handler in logging.getLogger().handlers:
+            if type(handler) is logging.StreamHandler:
+                handler.setLevel(logging.WARNING)
+
     # Create pipeline
     pipeline = TableDetectionPipeline()
 
@@ -1467,6 +1961,7 @@ def main():
         pipeline.output_dir = args.output_dir
 
     # Run pipeline
+    _log_listener.start()
     try:
         success = pipeline.run(skip_cleaning=args.skip_clean)
         sys.exit(0 if success else 1)
@@ -1477,6 +1972,10 @@ def main():
         print(f"\n\n[FATAL ERROR] {str(e)}")
         logger.exception("Fatal error in pipeline")
         sys.exit(1)
+    finally:
+        # Write out the queued log file records
+        _stop_worker_logging()
+        _log_listener.stop()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,5 +1,7 @@
 """Manual coordinate calculation from JSON to HTML template"""
 
+import numpy as np
+
 # JSON coordinates (lower-left reference)
 json_coords = {
     "Input Field_1": {"x": 238.0, "y": 198.0},
@@ -15,22 +17,35 @@ image_height = 280
 container_padding_top = 40
 image_margin_top = 20
 
-print("Converting JSON coordinates to HTML template coordinates:")
-print("=" * 60)
 
-for field_name, coords in json_coords.items():
-    x_from_left = coords['x']
-    y_from_bottom = coords['y']
+def convert_coords(json_coords, image_width, image_height,
+                   container_padding_top=40, image_margin_top=20):
+    """Convert lower-left JSON coordinates to HTML template (top, left-from-center) offsets
 
-    print(f"\n{field_name}:")
-    print(f"  JSON: x={x_from_left}, y={y_from_bottom} (from lower-left)")
+    Returns a dict of field name -> (web_top_px, web_left_px), computed for all fields at once.
+    """
+    coords = np.array([[c['x'], c['y']] for c in json_coords.values()], dtype=np.float64).reshape(-1, 2)
 
     # Convert y from bottom to top positioning
-    y_from_top = image_height - y_from_bottom
-    web_top_px = container_padding_top + image_margin_top + y_from_top
+    y_from_top = image_height - coords[:, 1]
+    web_top = container_padding_top + image_margin_top + y_from_top
 
     # Convert x to offset from center
-    center_offset_x = x_from_left - (image_width / 2)
-    web_left_px = center_offset_x
+    web_left = coords[:, 0] - (image_width / 2)
+
+    return {name: (float(top), float(left))
+            for name, top, left in zip(json_coords.keys(), web_top, web_left)}
+
+
+if __name__ == "__main__":
+    print("Converting JSON coordinates to HTML template coordinates:")
+    print("=" * 60)
+
+    converted = convert_coords(json_coords, image_width, image_height,
+                               container_padding_top, image_margin_top)
 
-    print(f"  HTML: top={web_top_px:.0f}px, left=calc(50% + {web_left_px:.0f}px)")
\ No newline at end of file
+    for field_name, (web_top_px, web_left_px) in converted.items():
+        coords = json_coords[field_name]
+        print(f"\n{field_name}:")
+        print(f"  JSON: x={coords['x']}, y={coords['y']} (from lower-left)")
+        print(f"  HTML: top={web_top_px:.0f}px, left=calc(50% + {web_left_px:.0f}px)")
@@ -1,15 +1,124 @@
 import os
+import glob
 import json
+import mmap
+import re
+import struct
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional
 import uuid
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+def _dumps(data) -> bytes:
+    """Serialize to compact UTF-8 JSON (orjson when installed)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _loads(raw):
+    """Parse JSON from bytes or str (orjson when installed)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _write_atomic(file_path: str, payload: bytes, durable: bool = False):
+    """
+    Replace a file in one step: write a temporary file next to it, then os.replace() it in
+    
+    Readers see either the old or the new file, never a partial write. fsync is only paid
+    for when durable=True; otherwise the OS flushes the page cache in its own time.
+    """
+    tmp_path = file_path + ".tmp"
+    try:
+        with open(tmp_path, 'wb', buffering=1 << 20) as f:
+            f.write(payload)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _iter_zst_lines(file_path: str):
+    """Yield the lines of a zstd-compressed JSONL archive, decompressing as it streams"""
+    pending = b""
+    with open(file_path, 'rb') as f:
+        for chunk in zstandard.ZstdDecompressor().read_to_iter(f):
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            yield from lines
+    if pending:
+        yield pending
+
+
+def _gen_uuid_batch(n: int) -> List[str]:
+    """Generate n random (version 4) UUID strings from a single os.urandom call"""
+    entropy = os.urandom(16 * n)
+    return [str(uuid.UUID(bytes=entropy[i:i + 16], version=4)) for i in range(0, 16 * n, 16)]
+
+
+@lru_cache(maxsize=4)
+def _load_catalog_index(index_path: str, mtime_ns: int, size: int) -> Dict:
+    """
+    Load a catalog index once per file version (mtime_ns and size are part of the cache key,
+    so a rewrite within one timestamp tick of a coarse filesystem is still picked up)
+    
+    The index is plain JSON: the shapes plus, per lower-cased shape type, the positions of
+    its shapes. The returned dict is shared by every caller and must not be modified.
+    """
+    with open(index_path, 'rb') as f:
+        index = _loads(f.read())
+    shapes = index["shapes"]
+    return {"shapes": shapes,
+            "by_type": {shape_type: [shapes[i] for i in positions] for shape_type, positions in index["by_type"].items()}}
+
+
+# Record count near the start of catalog_shapes.json (its "metadata" block is written first)
+_TOTAL_RECORDS_RE = re.compile(rb'"total_records"\s*:\s*(\d+)')
+
+
+# Order drawings index entry: byte offset of one record line in order_drawings.jsonl
+_OFFSET = struct.Struct("<Q")
+
+
 class IronDrawingJSONDatabase:
     """
     Simple JSON file-based database for iron order drawing analysis.
     Stores data in JSON files in the data folder - much simpler than MongoDB.
     """
     
+    # rib_count -> (type letter, explanation if the shape type contains it, explanation otherwise)
+    _SHAPE_TABLE = {
+        1: (None, "a. Straight rib", "a. Straight rib"),
+        2: ("l", "b. L rib with rotation", "b. L rib with rotation"),
+        # Equal vs different U side lengths would need additional analysis
+        3: ("u", "d. U rib with different side rib length with rotation",
+            "c. Rib with equal side rib with rotation"),
+    }
+    
+    # Size at which the live order log is compressed into an archive segment (needs zstandard)
+    ORDER_LOG_ROTATE_BYTES = 64 * 1024 * 1024
+    
     def __init__(self, data_folder: str = "."):
         """
         Initialize JSON database with two main data files
@@ -18,8 +127,24 @@ class IronDrawingJSONDatabase:
             data_folder: Folder to store JSON database files
         """
         self.data_folder = data_folder
-        self.order_drawings_file = os.path.join(data_folder, "order_drawings.json")
+        # Order drawings are an append-only JSON Lines log (one record per line)
+        self.order_drawings_file = os.path.join(data_folder, "order_drawings.jsonl")
+        self.legacy_order_drawings_file = os.path.join(data_folder, "order_drawings.json")
+        # Older records, rotated out of the live log: order_drawings.<timestamp>.jsonl.zst
+        self.order_archive_pattern = os.path.join(data_folder, "order_drawings.*.jsonl.zst")
+        # Fixed-width byte offsets of every record in the log, in insertion order
+        self.order_drawings_index_file = os.path.join(data_folder, "order_drawings.idx")
         self.catalog_shapes_file = os.path.join(data_folder, "catalog_shapes.json")
+        # JSON {"shapes": [...], "by_type": {shape_type_lower: [positions]}}, rebuilt whenever the catalog changes
+        self.catalog_index_file = os.path.join(data_folder, "catalog_shapes.idx")
+        # Small metadata file with the record counts and timestamps of both stores
+        self.metadata_file = os.path.join(data_folder, "metadata.json")
+        
+        # Writes deferred by session(): buffered order records and the in-memory catalog
+        self._session_depth = 0
+        self._pending_orders = []
+        self._catalog_data = None
+        self._dirty_catalog = False
         
         # Create data folder if it doesn't exist
         os.makedirs(data_folder, exist_ok=True)
@@ -28,24 +153,33 @@ class IronDrawingJSONDatabase:
         self._initialize_database_files()
         
         print(f"[DATABASE] JSON Database initialized in: {data_folder}")
-        print(f"[DATABASE] Files: order_drawings.json, catalog_shapes.json")
+        print(f"[DATABASE] Files: order_drawings.jsonl, catalog_shapes.json")
     
     def _initialize_database_files(self):
         """Create initial JSON database files if they don't exist"""
         try:
-            # Initialize order_drawings.json
+            # Initialize order_drawings.jsonl, carrying over records from an older order_drawings.json
             if not os.path.exists(self.order_drawings_file):
-                initial_data = {
-                    "metadata": {
-                        "created": datetime.now().isoformat(),
-                        "description": "Iron order drawing analysis results",
-                        "total_records": 0
-                    },
-                    "drawings": []
+                metadata = {
+                    "created": datetime.now().isoformat(),
+                    "description": "Iron order drawing analysis results",
+                    "total_records": 0
                 }
-                with open(self.order_drawings_file, 'w', encoding='utf-8') as f:
-                    json.dump(initial_data, f, indent=2, ensure_ascii=False)
-                print("[DATABASE] Created order_drawings.json")
+                drawings = []
+                if os.path.exists(self.legacy_order_drawings_file):
+                    legacy_data = self._load_json_file(self.legacy_order_drawings_file)
+                    metadata.update(legacy_data.get("metadata", {}))
+                    drawings = legacy_data.get("drawings", [])
+                    metadata["total_records"] = len(drawings)
+
+                _write_atomic(self.order_drawings_file, b"".join(_dumps(record) + b"\n" for record in drawings))
+                self._rebuild_order_index()
+                self._update_metadata("order_drawings", metadata)
+
+                if drawings:
+                    print(f"[DATABASE] Migrated {len(drawings)} records from order_drawings.json to order_drawings.jsonl")
+                else:
+                    print("[DATABASE] Created order_drawings.jsonl")
             
             # Initialize catalog_shapes.json
             if not os.path.exists(self.catalog_shapes_file):
@@ -57,8 +191,7 @@ class IronDrawingJSONDatabase:
                     },
                     "shapes": []
                 }
-                with open(self.catalog_shapes_file, 'w', encoding='utf-8') as f:
-                    json.dump(initial_data, f, indent=2, ensure_ascii=False)
+                self._save_catalog(initial_data)
                 print("[DATABASE] Created catalog_shapes.json")
                 
         except Exception as e:
@@ -67,20 +200,23 @@ class IronDrawingJSONDatabase:
     def _load_json_file(self, file_path: str) -> Dict:
         """Load JSON data from file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(file_path, 'rb') as f:
+                return _loads(f.read())
         except Exception as e:
             print(f"[DATABASE] Error loading {file_path}: {e}")
             return {}
     
-    def _save_json_file(self, file_path: str, data: Dict):
-        """Save JSON data to file"""
+    def _save_json_file(self, file_path: str, data: Dict, durable: bool = False):
+        """Save JSON data to file (compact, replaced atomically; fsync'd only if durable)"""
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _write_atomic(file_path, _dumps(data), durable)
         except Exception as e:
             print(f"[DATABASE] Error saving {file_path}: {e}")
     
+    def pretty_dump(self, file_path: str) -> str:
+        """Return a database file as indented JSON for human inspection"""
+        return json.dumps(self._load_json_file(file_path), indent=2, ensure_ascii=False)
+    
     def _get_shape_explanation(self, shape_type: str, rib_count: int) -> str:
         """
         Determine shape explanation based on shape type and rib count
@@ -92,24 +228,183 @@ class IronDrawingJSONDatabase:
         Returns:
             Explanation string for the shape
         """
-        shape_type_lower = shape_type.lower()
-        
-        if rib_count == 1:
-            return "a. Straight rib"
-        elif rib_count == 2:
-            if "l" in shape_type_lower:
-                return "b. L rib with rotation"
-            else:
-                return "b. L rib with rotation"
-        elif rib_count == 3:
-            if "u" in shape_type_lower:
-                # Check if sides are equal or different (would need additional analysis)
-                return "d. U rib with different side rib length with rotation"
-            else:
-                return "c. Rib with equal side rib with rotation"
-        else:
+        entry = self._SHAPE_TABLE.get(rib_count)
+        if entry is None:
             # Complex shape with more than 3 ribs
             return f"Complex shape with {rib_count} ribs"
+        
+        letter, with_letter, without_letter = entry
+        if letter and letter in shape_type.casefold():
+            return with_letter
+        return without_letter
+    
+    def _build_order_record(self, order_number: str, file_name: str, analysis_result: Optional[Dict],
+                            record_id: str, date: str) -> Dict:
+        """Build an order drawing record in the stored structure from the analysis results"""
+        # Extract data from analysis results if provided
+        if analysis_result:
+            # Get number of ribs
+            rib_count = analysis_result.get("ribfinder", {}).get("rib_count", 0)
+            
+            # Determine if all ribs are straight
+            all_straight = True  # Default assumption
+            
+            # Determine shape explanation
+            shape_type = analysis_result.get("shape_type", "")
+            shape_explanation = self._get_shape_explanation(shape_type, rib_count)
+            
+            # Extract path degrees (angles and lengths for each rib)
+            sides = analysis_result.get("sides", [])
+            last = len(sides) - 1  # the last rib has no angle to a next rib
+            path_degrees = [
+                {
+                    "rib_number": i + 1,
+                    "length": side.get("length", 0),
+                    "degree_to_next": side.get("angle_to_next", 0) if i < last else None
+                }
+                for i, side in enumerate(sides)
+            ]
+            
+            # Extract path vectors from PathFinder
+            path_vectors = []
+            for vec in analysis_result.get("pathfinder", {}).get("vectors", []):
+                vector = vec.get("vector", {})
+                path_vectors.append({
+                    "rib_number": vec.get("rib_number", 0),
+                    "dx": vector.get("dx", 0),
+                    "dy": vector.get("dy", 0)
+                })
+        else:
+            # Default values if no analysis result provided
+            rib_count = 0
+            all_straight = None
+            shape_explanation = ""
+            path_degrees = []
+            path_vectors = []
+        
+        # Extract catalog compatibility data
+        catalog_compatibility = {
+            "best_match_file": analysis_result.get("comparison", {}).get("best_match_file", ""),
+            "similarity_score": analysis_result.get("comparison", {}).get("similarity_score", 0),
+            "match_quality": analysis_result.get("comparison", {}).get("match_quality", ""),
+            "is_compatible": analysis_result.get("comparison", {}).get("similarity_score", 0) >= 70,  # Consider 70% or higher as compatible
+            "differences": analysis_result.get("comparison", {}).get("differences", [])
+        }
+        
+        # Create new record with your exact structure
+        return {
+            "id": record_id,
+            
+            # 1. Order number
+            "order_number": order_number,
+            
+            # 2. File name
+            "file_name": file_name,
+            
+            # 3. Date
+            "date": date,
+            
+            # 4. Number of ribs
+            "number_of_ribs": rib_count,
+            
+            # 5. Straight rib (true/false)
+            "straight_rib": all_straight,
+            
+            # 6. Explanation of the shape
+            "shape_explanation": shape_explanation,
+            
+            # 7. Path degree (length and angle for each rib)
+            "path_degrees": path_degrees,
+            
+            # 8. Path vectors (dx, dy for each rib)
+            "path_vectors": path_vectors,
+            
+            # 9. Compatible catalog shape
+            "compatible_catalog_shape": catalog_compatibility
+        }
+    
+    def _append_order_records(self, records: List[Dict]):
+        """Append records to the order drawings log in one write and update the metadata once"""
+        lines = [_dumps(record) + b"\n" for record in records]
+        with open(self.order_drawings_file, 'ab', buffering=1 << 20) as f:
+            position = f.tell()
+            f.write(b"".join(lines))
+        
+        # Extend the offset index - if it is missing, get_order_drawings rebuilds it from the whole log
+        if os.path.exists(self.order_drawings_index_file):
+            offsets = bytearray()
+            for line in lines:
+                offsets += _OFFSET.pack(position)
+                position += len(line)
+            with open(self.order_drawings_index_file, 'ab') as f:
+                f.write(offsets)
+        
+        if ZSTD_AVAILABLE and position >= self.ORDER_LOG_ROTATE_BYTES:
+            self._rotate_order_log()
+        
+        total_records = self._read_metadata().get("order_drawings", {}).get("total_records", 0)
+        self._update_metadata("order_drawings", {
+            "total_records": total_records + len(records),
+            "last_updated": datetime.now().isoformat()
+        })
+    
+    def _read_metadata(self) -> Dict:
+        """Return metadata.json, or an empty dict if it has not been written yet"""
+        if not os.path.exists(self.metadata_file):
+            return {}
+        return self._load_json_file(self.metadata_file)
+    
+    def _update_metadata(self, store: str, fields: Dict):
+        """Merge fields into one store's section of metadata.json"""
+        metadata = self._read_metadata()
+        metadata.setdefault(store, {}).update(fields)
+        self._save_json_file(self.metadata_file, metadata)
+    
+    def _save_catalog(self, data: Dict):
+        """Write the catalog, its lookup index and its metadata.json entry"""
+        self._save_json_file(self.catalog_shapes_file, data)
+        self._write_catalog_index(data)
+        self._update_metadata("catalog_shapes", {
+            "total_records": data["metadata"].get("total_records", 0),
+            "last_updated": data["metadata"].get("last_updated", data["metadata"].get("created"))
+        })
+    
+    def _store_order_records(self, records: List[Dict]):
+        """Append records now, or buffer them until the end of the current session"""
+        if self._session_depth:
+            self._pending_orders.extend(records)
+        else:
+            self._append_order_records(records)
+    
+    @contextmanager
+    def session(self):
+        """
+        Defer writes until the end of the block, so a burst of inserts costs one write per file
+        
+        Reads inside the session see only data written before it (or by flush()).
+        """
+        self._session_depth += 1
+        try:
+            yield self
+        finally:
+            self._session_depth -= 1
+            if not self._session_depth:
+                self.flush()
+                self._catalog_data = None
+    
+    def flush(self):
+        """Write out any order records and catalog changes deferred by session()"""
+        try:
+            if self._pending_orders:
+                self._append_order_records(self._pending_orders)
+                self._pending_orders = []
+            
+            if self._dirty_catalog:
+                self._save_catalog(self._catalog_data)
+                self._dirty_catalog = False
+                
+        except Exception as e:
+            print(f"[DATABASE] Error flushing deferred writes: {e}")
     
     def insert_order_drawing(self, order_number: str, file_name: str, analysis_result: Dict = None) -> str:
         """
@@ -124,101 +419,9 @@ class IronDrawingJSONDatabase:
             Record ID of inserted document
         """
         try:
-            # Load existing data
-            data = self._load_json_file(self.order_drawings_file)
-            if not data:
-                return ""
-            
-            # Extract data from analysis results if provided
-            if analysis_result:
-                # Get number of ribs
-                rib_count = analysis_result.get("ribfinder", {}).get("rib_count", 0)
-                
-                # Determine if all ribs are straight
-                all_straight = True  # Default assumption
-                
-                # Determine shape explanation
-                shape_type = analysis_result.get("shape_type", "")
-                shape_explanation = self._get_shape_explanation(shape_type, rib_count)
-                
-                # Extract path degrees (angles and lengths for each rib)
-                path_degrees = []
-                sides = analysis_result.get("sides", [])
-                for i, side in enumerate(sides):
-                    rib_info = {
-                        "rib_number": i + 1,
-                        "length": side.get("length", 0),
-                        "degree_to_next": side.get("angle_to_next", 0) if i < len(sides) - 1 else None
-                    }
-                    path_degrees.append(rib_info)
-                
-                # Extract path vectors from PathFinder
-                path_vectors = []
-                vectors = analysis_result.get("pathfinder", {}).get("vectors", [])
-                for vec in vectors:
-                    vector_info = {
-                        "rib_number": vec.get("rib_number", 0),
-                        "dx": vec.get("vector", {}).get("dx", 0),
-                        "dy": vec.get("vector", {}).get("dy", 0)
-                    }
-                    path_vectors.append(vector_info)
-            else:
-                # Default values if no analysis result provided
-                rib_count = 0
-                all_straight = None
-                shape_explanation = ""
-                path_degrees = []
-                path_vectors = []
-            
-            # Extract catalog compatibility data
-            catalog_compatibility = {
-                "best_match_file": analysis_result.get("comparison", {}).get("best_match_file", ""),
-                "similarity_score": analysis_result.get("comparison", {}).get("similarity_score", 0),
-                "match_quality": analysis_result.get("comparison", {}).get("match_quality", ""),
-                "is_compatible": analysis_result.get("comparison", {}).get("similarity_score", 0) >= 70,  # Consider 70% or higher as compatible
-                "differences": analysis_result.get("comparison", {}).get("differences", [])
-            }
-            
-            # Create new record with your exact structure
             record_id = str(uuid.uuid4())
-            new_record = {
-                "id": record_id,
-                
-                # 1. Order number
-                "order_number": order_number,
-                
-                # 2. File name
-                "file_name": file_name,
-                
-                # 3. Date
-                "date": datetime.now().isoformat(),
-                
-                # 4. Number of ribs
-                "number_of_ribs": rib_count,
-                
-                # 5. Straight rib (true/false)
-                "straight_rib": all_straight,
-                
-                # 6. Explanation of the shape
-                "shape_explanation": shape_explanation,
-                
-                # 7. Path degree (length and angle for each rib)
-                "path_degrees": path_degrees,
-                
-                # 8. Path vectors (dx, dy for each rib)
-                "path_vectors": path_vectors,
-                
-                # 9. Compatible catalog shape
-                "compatible_catalog_shape": catalog_compatibility
-            }
-            
-            # Add to data and update metadata
-            data["drawings"].append(new_record)
-            data["metadata"]["total_records"] = len(data["drawings"])
-            data["metadata"]["last_updated"] = datetime.now().isoformat()
-            
-            # Save updated data
-            self._save_json_file(self.order_drawings_file, data)
+            new_record = self._build_order_record(order_number, file_name, analysis_result, record_id, datetime.now().isoformat())
+            self._store_order_records([new_record])
             
             print(f"[DATABASE] Order drawing analysis saved with ID: {record_id}")
             return record_id
@@ -227,6 +430,33 @@ class IronDrawingJSONDatabase:
             print(f"[DATABASE] Error inserting order drawing: {e}")
             return ""
     
+    def insert_order_drawings_bulk(self, records: List[Dict]) -> List[str]:
+        """
+        Insert several order drawings with a single append and one metadata update
+        
+        Args:
+            records: List of dicts with order_number, file_name and (optional) analysis_result
+            
+        Returns:
+            Record IDs of the inserted documents (empty list on failure)
+        """
+        try:
+            # One entropy read and one timestamp for the whole batch
+            now_iso = datetime.now().isoformat()
+            new_records = [
+                self._build_order_record(record["order_number"], record["file_name"],
+                                         record.get("analysis_result"), record_id, now_iso)
+                for record, record_id in zip(records, _gen_uuid_batch(len(records)))
+            ]
+            self._store_order_records(new_records)
+            
+            print(f"[DATABASE] Saved {len(new_records)} order drawing analyses")
+            return [record["id"] for record in new_records]
+            
+        except Exception as e:
+            print(f"[DATABASE] Error inserting order drawings: {e}")
+            return []
+    
     def insert_catalog_shape(self, shape_name: str, shape_data: Dict) -> str:
         """
         Insert catalog shape data
@@ -238,59 +468,192 @@ class IronDrawingJSONDatabase:
         Returns:
             Record ID of inserted document
         """
+        ids = self.insert_catalog_shapes_bulk([(shape_name, shape_data)])
+        if not ids:
+            return ""
+        
+        print(f"[DATABASE] Catalog shape '{shape_name}' saved with ID: {ids[0]}")
+        return ids[0]
+    
+    def insert_catalog_shapes_bulk(self, shapes: List[tuple]) -> List[str]:
+        """
+        Insert several catalog shapes with a single load and a single write
+        
+        Args:
+            shapes: List of (shape_name, shape_data) pairs
+            
+        Returns:
+            Record IDs of the inserted shapes (empty list on failure)
+        """
         try:
-            # Load existing data
-            data = self._load_json_file(self.catalog_shapes_file)
-            if not data:
-                return ""
+            # Load existing data (kept in memory for the rest of a session)
+            data = self._catalog_data
+            if data is None:
+                data = self._load_json_file(self.catalog_shapes_file)
+                if not data:
+                    return []
             
-            # Create new record
-            record_id = str(uuid.uuid4())
-            new_record = {
-                "id": record_id,
-                "timestamp": datetime.now().isoformat(),
-                "shape_name": shape_name,
-                "shape_type": shape_data.get("shape_type", ""),
-                "rib_count": shape_data.get("rib_count", 0),
-                "dimensions": shape_data.get("dimensions", []),
-                "file_path": shape_data.get("file_path", ""),
-                "description": shape_data.get("description", ""),
-                "tags": shape_data.get("tags", [])
-            }
+            # Create new records (one entropy read and one timestamp for the whole batch)
+            now_iso = datetime.now().isoformat()
+            record_ids = _gen_uuid_batch(len(shapes))
+            for (shape_name, shape_data), record_id in zip(shapes, record_ids):
+                data["shapes"].append({
+                    "id": record_id,
+                    "timestamp": now_iso,
+                    "shape_name": shape_name,
+                    "shape_type": shape_data.get("shape_type", ""),
+                    "rib_count": shape_data.get("rib_count", 0),
+                    "dimensions": shape_data.get("dimensions", []),
+                    "file_path": shape_data.get("file_path", ""),
+                    "description": shape_data.get("description", ""),
+                    "tags": shape_data.get("tags", [])
+                })
             
-            # Add to data and update metadata
-            data["shapes"].append(new_record)
+            # Update metadata
             data["metadata"]["total_records"] = len(data["shapes"])
-            data["metadata"]["last_updated"] = datetime.now().isoformat()
+            data["metadata"]["last_updated"] = now_iso
             
-            # Save updated data
-            self._save_json_file(self.catalog_shapes_file, data)
-            
-            print(f"[DATABASE] Catalog shape '{shape_name}' saved with ID: {record_id}")
-            return record_id
+            # Save updated data, or leave it for the end of the session
+            if self._session_depth:
+                self._catalog_data = data
+                self._dirty_catalog = True
+            else:
+                self._save_catalog(data)
+            return record_ids
             
         except Exception as e:
-            print(f"[DATABASE] Error inserting catalog shape: {e}")
-            return ""
+            print(f"[DATABASE] Error inserting catalog shapes: {e}")
+            return []
+    
+    def _rotate_order_log(self):
+        """Compress the live order log into an archive segment and start an empty one"""
+        archive = os.path.join(self.data_folder, f"order_drawings.{datetime.now():%Y%m%d%H%M%S%f}.jsonl.zst")
+        with open(self.order_drawings_file, 'rb') as src, open(archive + ".tmp", 'wb') as dst:
+            zstandard.ZstdCompressor(level=3).copy_stream(src, dst)
+        os.replace(archive + ".tmp", archive)
+        
+        _write_atomic(self.order_drawings_file, b"")
+        _write_atomic(self.order_drawings_index_file, b"")
+        print(f"[DATABASE] Archived order drawings log to {os.path.basename(archive)}")
+    
+    def _recent_archived_orders(self, limit: int) -> List[Dict]:
+        """The newest `limit` records from the archive segments, newest first"""
+        records = []
+        # Segment names sort by their timestamp, oldest first
+        for archive in sorted(glob.glob(self.order_archive_pattern), reverse=True):
+            if len(records) >= limit:
+                break
+            if not ZSTD_AVAILABLE:
+                print(f"[DATABASE] zstandard is not installed - skipping archived records in {os.path.basename(archive)}")
+                break
+            tail = deque((line for line in _iter_zst_lines(archive) if line.strip()), maxlen=limit - len(records))
+            records.extend(_loads(line) for line in reversed(tail))
+        return records
+    
+    def _rebuild_order_index(self) -> bytes:
+        """Scan the order drawings log and rewrite its byte-offset index"""
+        offsets = bytearray()
+        position = 0
+        with open(self.order_drawings_file, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    offsets += _OFFSET.pack(position)
+                position += len(line)
+        
+        _write_atomic(self.order_drawings_index_file, bytes(offsets))
+        return bytes(offsets)
+    
+    def _recent_order_offsets(self, log: mmap.mmap, limit: int) -> List[int]:
+        """Offsets of the last `limit` records, rebuilding the index if it is missing or stale"""
+        try:
+            with open(self.order_drawings_index_file, 'rb') as f:
+                count = os.fstat(f.fileno()).st_size // _OFFSET.size
+                f.seek(max(0, count - limit) * _OFFSET.size)
+                tail = f.read((count - max(0, count - limit)) * _OFFSET.size)
+            offsets = [offset for (offset,) in _OFFSET.iter_unpack(tail)]
+            
+            # The index is current when its last entry is the final line of the log
+            if offsets and log.find(b"\n", offsets[-1]) + 1 == len(log):
+                return offsets
+        except FileNotFoundError:
+            pass
+        
+        print("[DATABASE] Rebuilding order_drawings.idx")
+        index = self._rebuild_order_index()
+        return [offset for (offset,) in _OFFSET.iter_unpack(index[max(0, len(index) - limit * _OFFSET.size):])]
     
     def get_order_drawings(self, limit: int = 10) -> List[Dict]:
         """Get recent order drawing analyses"""
         try:
-            data = self._load_json_file(self.order_drawings_file)
-            if not data or "drawings" not in data:
+            if limit <= 0:
                 return []
             
-            # Sort by timestamp (newest first) and limit results
-            drawings = sorted(data["drawings"], key=lambda x: x.get("timestamp", ""), reverse=True)
-            return drawings[:limit]
+            recent = []
+            with open(self.order_drawings_file, 'rb') as f:
+                # Seek straight to the last `limit` records via the offset index
+                if os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as log:
+                        for offset in self._recent_order_offsets(log, limit):
+                            end = log.find(b"\n", offset)
+                            recent.append(_loads(log[offset:end if end != -1 else len(log)]))
+            
+            # Newest first, topped up from the archives if the live log is short
+            recent.reverse()
+            if len(recent) < limit:
+                recent.extend(self._recent_archived_orders(limit - len(recent)))
+            return recent
             
         except Exception as e:
             print(f"[DATABASE] Error retrieving order drawings: {e}")
             return []
     
+    def _write_catalog_index(self, data: Dict):
+        """Write the catalog lookup index for the given catalog data"""
+        shapes = data.get("shapes", [])
+        by_type = {}
+        for i, shape in enumerate(shapes):
+            by_type.setdefault(shape.get("shape_type", "").lower(), []).append(i)
+        
+        _write_atomic(self.catalog_index_file, _dumps({"shapes": shapes, "by_type": by_type}))
+    
+    def _catalog_index(self) -> Dict:
+        """Return the catalog index, rebuilding it if the JSON is newer (the JSON stays the source of truth)"""
+        catalog_mtime = os.stat(self.catalog_shapes_file).st_mtime_ns
+        try:
+            index_stat = os.stat(self.catalog_index_file)
+        except FileNotFoundError:
+            index_stat = None
+        
+        if index_stat is not None and index_stat.st_mtime_ns >= catalog_mtime:
+            try:
+                return _load_catalog_index(self.catalog_index_file, index_stat.st_mtime_ns, index_stat.st_size)
+            except (ValueError, KeyError, TypeError):
+                pass  # Unreadable index (e.g. written by an older version) - rebuild it below
+        
+        data = self._load_json_file(self.catalog_shapes_file)
+        if not data or "shapes" not in data:
+            return {"shapes": [], "by_type": {}}
+        self._write_catalog_index(data)
+        index_stat = os.stat(self.catalog_index_file)
+        return _load_catalog_index(self.catalog_index_file, index_stat.st_mtime_ns, index_stat.st_size)
+    
     def get_catalog_shapes(self, shape_type: str = None) -> List[Dict]:
-        """Get catalog shapes, optionally filtered by type"""
+        """
+        Get catalog shapes, optionally filtered by type
+        
+        The returned list is the caller's own, but the shape dicts in it are shared with the
+        cached catalog index: treat them as read-only (copy a shape before changing it).
+        """
         try:
+            # Warm reads come from the cached index without parsing the JSON
+            try:
+                index = self._catalog_index()
+                if shape_type:
+                    return list(index["by_type"].get(shape_type.lower(), []))
+                return list(index["shapes"])
+            except OSError as e:
+                print(f"[DATABASE] Catalog index unavailable, reading catalog_shapes.json: {e}")
+            
             data = self._load_json_file(self.catalog_shapes_file)
             if not data or "shapes" not in data:
                 return []
@@ -307,18 +670,35 @@ class IronDrawingJSONDatabase:
             print(f"[DATABASE] Error retrieving catalog shapes: {e}")
             return []
     
+    def _scan_catalog_count(self) -> int:
+        """Read the catalog record count from the head of catalog_shapes.json (older installs without metadata.json entry)"""
+        with open(self.catalog_shapes_file, 'rb') as f:
+            match = _TOTAL_RECORDS_RE.search(f.read(1024))
+        if match:
+            return int(match.group(1))
+        return self._load_json_file(self.catalog_shapes_file).get("metadata", {}).get("total_records", 0)
+    
     def get_statistics(self) -> Dict:
         """Get database statistics"""
         try:
-            order_data = self._load_json_file(self.order_drawings_file)
-            catalog_data = self._load_json_file(self.catalog_shapes_file)
+            # Both counts come from the small metadata.json - neither data file is parsed
+            metadata = self._read_metadata()
+            
+            order_count = metadata.get("order_drawings", {}).get("total_records")
+            if order_count is None:
+                # One fixed-width offset per record
+                order_count = os.path.getsize(self.order_drawings_index_file) // _OFFSET.size
+            
+            catalog_count = metadata.get("catalog_shapes", {}).get("total_records")
+            if catalog_count is None:
+                catalog_count = self._scan_catalog_count()
             
             stats = {
-                "total_order_drawings": order_data.get("metadata", {}).get("total_records", 0),
-                "total_catalog_shapes": catalog_data.get("metadata", {}).get("total_records", 0),
+                "total_order_drawings": order_count,
+                "total_catalog_shapes": catalog_count,
                 "database_type": "JSON Files",
                 "data_folder": self.data_folder,
-                "files": ["order_drawings.json", "catalog_shapes.json"]
+                "files": ["order_drawings.jsonl", "catalog_shapes.json"]
             }
             return stats
             
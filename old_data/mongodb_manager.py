@@ -1,8 +1,51 @@
+import atexit
+import copy
+import logging
 import os
-from datetime import datetime
-from pymongo import MongoClient
-from typing import Dict, List, Optional
-import json
+import struct
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+import bson
+import gridfs
+from bson import json_util
+from bson.objectid import ObjectId
+from bson.raw_bson import RawBSONDocument
+from pymongo import ASCENDING, DESCENDING, IndexModel, MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Newest-first order with _id breaking timestamp ties (a whole batch shares one timestamp);
+# matches the ts_id_desc index exactly, so sort+limit walks the index and stops after `limit` keys
+_RECENT_SORT = [("timestamp", DESCENDING), ("_id", DESCENDING)]
+
+# Index holding every field of the recent-drawings summary, so MongoDB can answer that query from
+# the index keys. That only holds while chatco stays a subdocument (see _build_order_document): an
+# array on an indexed path makes the index multikey, and a multikey path cannot be covered.
+# It starts with _RECENT_SORT so the summary has the same deterministic order as the full listing
+_SUMMARY_INDEX = _RECENT_SORT + [("file_name", ASCENDING), ("chatco.similarity_score", ASCENDING)]
+_SUMMARY_FIELDS = {"_id": 0, "timestamp": 1, "file_name": 1, "chatco.similarity_score": 1}
+
+_INT32 = struct.Struct("<i")
+
+
+def _bson_elements(fields: Dict) -> bytes:
+    """Encode fields as a run of BSON elements (a document without its length header and terminator)"""
+    return bson.encode(fields)[4:-1]
+
+
+def _splice_bson(prefix: bytes, fields: Dict) -> RawBSONDocument:
+    """Build a raw BSON document from pre-encoded leading elements plus freshly encoded fields"""
+    elements = prefix + _bson_elements(fields)
+    return RawBSONDocument(_INT32.pack(len(elements) + 5) + elements + b"\x00")
 
 class IronDrawingDatabase:
     """
@@ -10,6 +53,12 @@ class IronDrawingDatabase:
     Uses embedded MongoDB with data stored in the data folder.
     """
     
+    # One client (and connection pool) per process - a client must not be shared across fork
+    _client_by_pid: Dict[int, MongoClient] = {}
+    
+    # PathFinder vertex/vector lists at least this long are stored in GridFS instead of inline
+    PATH_BLOB_MIN_ITEMS = 256
+    
     def __init__(self, db_name: str = "iron_drawing_analysis"):
         """
         Initialize MongoDB connection for iron drawing analysis
@@ -17,15 +66,39 @@ class IronDrawingDatabase:
         Args:
             db_name: Name of the MongoDB database
         """
-        # Use MongoDB connection string for local embedded database
-        # For simplicity, we'll use a local connection
-        self.client = MongoClient('mongodb://localhost:27017/')
+        # Use MongoDB connection string for local embedded database, reusing this process's
+        # client so every instance shares one connection pool (connect=False: no socket until first use)
+        pid = os.getpid()
+        client = type(self)._client_by_pid.get(pid)
+        if client is None:
+            # Pool sized for the Flask server (threaded, one process): keep maxPoolSize at or above
+            # the expected concurrent requests; fail fast instead of hanging when Mongo is unreachable
+            client = MongoClient(
+                'mongodb://localhost:27017/',
+                maxPoolSize=32,
+                minPoolSize=4,
+                waitQueueTimeoutMS=2500,
+                socketTimeoutMS=10000,
+                serverSelectionTimeoutMS=3000,
+                appname='ironman-flask',
+                connect=False
+            )
+            type(self)._client_by_pid[pid] = client
+            atexit.register(_close_shared_client)
+        self.client = client
         self.db = self.client[db_name]
         
         # Create collections (tables)
         self.order_drawings = self.db.order_drawings
         self.catalog_shapes = self.db.catalog_shapes
         
+        # Large PathFinder arrays live outside the drawing documents (no I/O until first put)
+        self.fs = gridfs.GridFS(self.db, collection="path_arrays")
+        
+        # get_catalog_shapes results by shape type: (fetched at, shapes)
+        self._catalog_cache: Dict[Optional[str], Tuple[float, List[Dict]]] = {}
+        self._catalog_ttl = 60.0
+        
         print(f"[DATABASE] Connected to MongoDB database: {db_name}")
         print(f"[DATABASE] Collections: order_drawings, catalog_shapes")
     
@@ -34,16 +107,36 @@ class IronDrawingDatabase:
         Create the two main collections with proper schema validation
         """
         try:
+            # One round-trip for the existing collection names
+            existing = set(self.db.list_collection_names())
+            
             # Create order_drawings collection
-            if "order_drawings" not in self.db.list_collection_names():
+            if "order_drawings" not in existing:
                 self.db.create_collection("order_drawings")
                 print("[DATABASE] Created 'order_drawings' collection")
             
             # Create catalog_shapes collection  
-            if "catalog_shapes" not in self.db.list_collection_names():
+            if "catalog_shapes" not in existing:
                 self.db.create_collection("catalog_shapes")
                 print("[DATABASE] Created 'catalog_shapes' collection")
             
+            # The summary index used to lack the _id tie-breaker; its name now belongs to the old keys
+            if "summary_covering" in self.order_drawings.index_information():
+                self.order_drawings.drop_index("summary_covering")
+            
+            # Indexes for the hot queries (create_indexes is a no-op for indexes that already exist):
+            # recent drawings sorted by timestamp (and _id), file name lookups, the covered recent
+            # drawings summary, catalog filtering by shape type and upserts by shape name
+            self.order_drawings.create_indexes([
+                IndexModel(_RECENT_SORT, name="ts_id_desc"),
+                IndexModel([("file_name", ASCENDING)], name="file_name"),
+                IndexModel(_SUMMARY_INDEX, name="summary_ts_id_covering")
+            ])
+            self.catalog_shapes.create_indexes([
+                IndexModel([("shape_type", ASCENDING), ("shape_name", ASCENDING)], name="shape_type_name"),
+                IndexModel([("shape_name", ASCENDING)], name="shape_name")
+            ])
+            
             print("[DATABASE] Collections created successfully")
             return True
             
@@ -51,6 +144,183 @@ class IronDrawingDatabase:
             print(f"[DATABASE] Error creating collections: {e}")
             return False
     
+    def _build_order_document(self, analysis_result: Dict) -> Dict:
+        """
+        Build the per-drawing fields of an order drawing document from the analysis results
+        
+        The fields shared by the whole batch (timestamp, analysis_status) are spliced in
+        pre-encoded by insert_order_drawings_bulk.
+        """
+        # Bind each agent's sub-result once
+        ribfinder = analysis_result.get("ribfinder") or {}
+        pathfinder = analysis_result.get("pathfinder") or {}
+        comparison = analysis_result.get("comparison") or {}
+        path_summary = pathfinder.get("path_summary") or {}
+        file_name = analysis_result.get("file_name", "unknown")
+        
+        # Each subdocument is written out as a literal (cheaper than filling a copied template);
+        # agents that produced no result get no subdocument instead of one full of zero defaults
+        document = {
+            "_id": ObjectId(),
+            "file_name": file_name
+        }
+        
+        # RibFinder results
+        if ribfinder:
+            document["ribfinder"] = {
+                "rib_count": ribfinder.get("rib_count", 0),
+                "shape_pattern": ribfinder.get("shape_pattern", ""),
+                "confidence": ribfinder.get("confidence", 0),
+                "match_percentage": ribfinder.get("match_percentage", 0)
+            }
+        
+        # CHATAN results
+        document["chatan"] = {
+            "shape_type": analysis_result.get("shape_type", ""),
+            "number_of_ribs": analysis_result.get("number_of_ribs", 0),
+            "confidence": analysis_result.get("confidence", 0),
+            "match_percentage": analysis_result.get("match_percentage", 0),
+            "sides": analysis_result.get("sides", []),
+            "angles_between_ribs": analysis_result.get("angles_between_ribs", []),
+            "google_vision_data": analysis_result.get("google_vision_data", {})
+        }
+        
+        # PathFinder results
+        if pathfinder:
+            document["pathfinder"] = {
+                "shape_type": pathfinder.get("shape_type", ""),
+                "vertex_count": pathfinder.get("vertex_count", 0),
+                "total_path_length": pathfinder.get("total_path_length", 0),
+                "is_closed": pathfinder.get("is_closed", False),
+                "bounding_box": path_summary.get("bounding_box", {})
+            }
+            document["pathfinder"].update(self._path_array_fields(file_name, pathfinder))
+        
+        # CHATCO comparison results
+        if comparison:
+            document["chatco"] = {
+                "best_match_file": comparison.get("best_match_file", ""),
+                "similarity_score": comparison.get("similarity_score", 0),
+                "match_quality": comparison.get("match_quality", ""),
+                "matching_features": comparison.get("matching_features", []),
+                "differences": comparison.get("differences", [])
+            }
+        
+        return document
+    
+    def _path_array_fields(self, file_name: str, pathfinder: Dict) -> Dict:
+        """
+        Build the vertices/vectors fields of a PathFinder subdocument
+        
+        Short lists are embedded as before. Long ones are written to GridFS and replaced by a
+        reference and a count (read back with get_vertices / get_vectors), so listing drawings
+        never decodes them: vertices as a float32 (x, y) blob (needs NumPy), vectors as BSON.
+        """
+        vertices = pathfinder.get("vertices", [])
+        vectors = pathfinder.get("vectors", [])
+        fields = {}
+        
+        if NUMPY_AVAILABLE and len(vertices) >= self.PATH_BLOB_MIN_ITEMS:
+            # The vertex "index" is its position in the array, so only x and y are kept
+            points = np.asarray([(v["x"], v["y"]) if isinstance(v, dict) else (v[0], v[1]) for v in vertices],
+                                dtype="<f4")
+            fields["vertices_ref"] = self.fs.put(points.tobytes(), filename=f"{file_name}.verts.f32")
+            fields["vertices_count"] = len(vertices)
+        else:
+            fields["vertices"] = vertices
+        
+        if len(vectors) >= self.PATH_BLOB_MIN_ITEMS:
+            fields["vectors_ref"] = self.fs.put(bson.encode({"vectors": vectors}), filename=f"{file_name}.vectors.bson")
+            fields["vectors_count"] = len(vectors)
+        else:
+            fields["vectors"] = vectors
+        
+        return fields
+    
+    def _build_catalog_document(self, shape_name: str, shape_data: Dict, timestamp: datetime) -> Dict:
+        """Build a catalog shape document from the shape characteristics"""
+        return {
+            "timestamp": timestamp,
+            "shape_name": shape_name,
+            "shape_type": shape_data.get("shape_type", ""),
+            "rib_count": shape_data.get("rib_count", 0),
+            "dimensions": shape_data.get("dimensions", []),
+            "file_path": shape_data.get("file_path", ""),
+            "description": shape_data.get("description", ""),
+            "tags": shape_data.get("tags", [])
+        }
+    
+    def _insert_many(self, collection, documents: List[Dict], label: str) -> List[str]:
+        """
+        Insert documents in one round-trip
+        
+        The insert is unordered: a document that fails (e.g. schema validation or a duplicate
+        _id) is reported and skipped, and the rest of the batch is still inserted.
+        
+        Returns:
+            IDs of the documents that were inserted
+        """
+        if not documents:
+            return []
+        start = time.perf_counter()
+        try:
+            collection.insert_many(documents, ordered=False)
+            # Read ids from the documents: insert_many sets _id on dicts but does not report raw BSON ones
+            ids = [str(doc["_id"]) for doc in documents]
+        except BulkWriteError as e:
+            # Every document carries its _id before sending, so the successful ones are known
+            failed = {error["index"] for error in e.details.get("writeErrors", [])}
+            print(f"[DATABASE] {len(failed)} of {len(documents)} {label} failed to insert: {e.details.get('writeErrors', [])[:1]}")
+            ids = [str(doc["_id"]) for i, doc in enumerate(documents) if i not in failed]
+        
+        # One summary line per batch instead of a print per document
+        logger.info("[DATABASE] Inserted %d %s in %.1fms", len(ids), label, (time.perf_counter() - start) * 1000)
+        return ids
+    
+    def insert_order_drawings_bulk(self, results: List[Dict],
+                                   numeric_arrays: Optional[Dict[str, Sequence]] = None) -> List[str]:
+        """
+        Insert analysis results for several order drawings with a single insert_many
+        
+        Args:
+            results: Complete analysis results from the system, one per drawing
+            numeric_arrays: Optional numeric columns parallel to results, keyed by (dotted) document
+                            field, e.g. {"ribfinder.confidence": confidences}; NumPy arrays are
+                            accepted and override the per-result values
+            
+        Returns:
+            Document IDs of the inserted records (empty list on failure)
+        """
+        try:
+            # Convert each column to Python numbers once (ndarray.tolist() runs in C; BSON
+            # cannot encode NumPy scalars) instead of a float() per field per document
+            columns = []
+            for field, values in (numeric_arrays or {}).items():
+                values = values.tolist() if hasattr(values, "tolist") else list(values)
+                if len(values) != len(results):
+                    raise ValueError(f"'{field}' has {len(values)} values for {len(results)} results")
+                *parents, key = field.split(".")
+                columns.append((parents, key, values))
+            
+
+            # The batch-wide fields (one native BSON date timestamp, the status) are encoded once and
+            # spliced into every raw document; only the per-drawing fields are encoded per insert
+            static = _bson_elements({"timestamp": datetime.now(timezone.utc), "analysis_status": "completed"})
+            documents = []
+            for i, analysis_result in enumerate(results):
+                document = self._build_order_document(analysis_result)
+                for parents, key, values in columns:
+                    target = document
+                    for parent in parents:
+                        target = target.setdefault(parent, {})
+                    target[key] = values[i]
+                documents.append(_splice_bson(static, document))
+            return self._insert_many(self.order_drawings, documents, "order drawings")
+            
+        except Exception as e:
+            print(f"[DATABASE] Error inserting order drawings: {e}")
+            return []
+    
     def insert_order_drawing(self, analysis_result: Dict) -> str:
         """
         Insert analysis results for an order drawing
@@ -61,60 +331,63 @@ class IronDrawingDatabase:
         Returns:
             Document ID of inserted record
         """
+        ids = self.insert_order_drawings_bulk([analysis_result])
+        if not ids:
+            return ""
+        
+        logger.debug("[DATABASE] Order drawing analysis saved with ID: %s", ids[0])
+        return ids[0]
+    
+    def insert_catalog_shapes_bulk(self, shapes: List[tuple]) -> List[str]:
+        """
+        Insert or update several catalog shapes (keyed by shape name) with a single bulk_write
+        
+        Re-running a catalog load updates the existing shapes instead of duplicating them.
+        
+        Args:
+            shapes: List of (shape_name, shape_data) pairs
+            
+        Returns:
+            Document IDs of the stored shapes (empty list on failure)
+        """
         try:
-            # Add metadata
-            document = {
-                "timestamp": datetime.now().isoformat(),
-                "file_name": analysis_result.get("file_name", "unknown"),
-                "analysis_status": "completed",
-                
-                # RibFinder results
-                "ribfinder": {
-                    "rib_count": analysis_result.get("ribfinder", {}).get("rib_count", 0),
-                    "shape_pattern": analysis_result.get("ribfinder", {}).get("shape_pattern", ""),
-                    "confidence": analysis_result.get("ribfinder", {}).get("confidence", 0),
-                    "match_percentage": analysis_result.get("ribfinder", {}).get("match_percentage", 0)
-                },
-                
-                # CHATAN results
-                "chatan": {
-                    "shape_type": analysis_result.get("shape_type", ""),
-                    "number_of_ribs": analysis_result.get("number_of_ribs", 0),
-                    "confidence": analysis_result.get("confidence", 0),
-                    "match_percentage": analysis_result.get("match_percentage", 0),
-                    "sides": analysis_result.get("sides", []),
-                    "angles_between_ribs": analysis_result.get("angles_between_ribs", []),
-                    "google_vision_data": analysis_result.get("google_vision_data", {})
-                },
-                
-                # PathFinder results
-                "pathfinder": {
-                    "shape_type": analysis_result.get("pathfinder", {}).get("shape_type", ""),
-                    "vertex_count": analysis_result.get("pathfinder", {}).get("vertex_count", 0),
-                    "total_path_length": analysis_result.get("pathfinder", {}).get("total_path_length", 0),
-                    "is_closed": analysis_result.get("pathfinder", {}).get("is_closed", False),
-                    "vertices": analysis_result.get("pathfinder", {}).get("vertices", []),
-                    "vectors": analysis_result.get("pathfinder", {}).get("vectors", []),
-                    "bounding_box": analysis_result.get("pathfinder", {}).get("path_summary", {}).get("bounding_box", {})
-                },
-                
-                # CHATCO comparison results
-                "chatco": {
-                    "best_match_file": analysis_result.get("comparison", {}).get("best_match_file", ""),
-                    "similarity_score": analysis_result.get("comparison", {}).get("similarity_score", 0),
-                    "match_quality": analysis_result.get("comparison", {}).get("match_quality", ""),
-                    "matching_features": analysis_result.get("comparison", {}).get("matching_features", []),
-                    "differences": analysis_result.get("comparison", {}).get("differences", [])
-                }
-            }
+            if not shapes:
+                return []
+            start = time.perf_counter()
+            
+            # One native (BSON date) timestamp for the whole batch
+            now = datetime.now(timezone.utc)
+            operations = [
+                UpdateOne({"shape_name": shape_name},
+                          {"$set": self._build_catalog_document(shape_name, shape_data, now)},
+                          upsert=True)
+                for shape_name, shape_data in shapes
+            ]
+            try:
+                result = self.catalog_shapes.bulk_write(operations, ordered=False)
+                upserted_ids, failed = result.upserted_ids, set()
+            except BulkWriteError as e:
+                upserted_ids = {item["index"]: item["_id"] for item in e.details.get("upserted", [])}
+                failed = {error["index"] for error in e.details.get("writeErrors", [])}
+                print(f"[DATABASE] {len(failed)} of {len(shapes)} catalog shapes failed to save: {e.details.get('writeErrors', [])[:1]}")
+            self._catalog_cache.clear()
             
-            result = self.order_drawings.insert_one(document)
-            print(f"[DATABASE] Order drawing analysis saved with ID: {result.inserted_id}")
-            return str(result.inserted_id)
+            # Updated shapes report no id - look those up in one query
+            updated = {shapes[i][0] for i in range(len(shapes)) if i not in upserted_ids and i not in failed}
+            existing_ids = {}
+            if updated:
+                for doc in self.catalog_shapes.find({"shape_name": {"$in": list(updated)}}, {"shape_name": 1}):
+                    existing_ids.setdefault(doc["shape_name"], doc["_id"])
+            
+            ids = [str(upserted_ids[i]) if i in upserted_ids else str(existing_ids[shapes[i][0]])
+                   for i in range(len(shapes))
+                   if i not in failed and (i in upserted_ids or shapes[i][0] in existing_ids)]
+            logger.info("[DATABASE] Saved %d catalog shapes in %.1fms", len(ids), (time.perf_counter() - start) * 1000)
+            return ids
             
         except Exception as e:
-            print(f"[DATABASE] Error inserting order drawing: {e}")
-            return ""
+            print(f"[DATABASE] Error inserting catalog shapes: {e}")
+            return []
     
     def insert_catalog_shape(self, shape_name: str, shape_data: Dict) -> str:
         """
@@ -127,41 +400,100 @@ class IronDrawingDatabase:
         Returns:
             Document ID of inserted record
         """
-        try:
-            document = {
-                "timestamp": datetime.now().isoformat(),
-                "shape_name": shape_name,
-                "shape_type": shape_data.get("shape_type", ""),
-                "rib_count": shape_data.get("rib_count", 0),
-                "dimensions": shape_data.get("dimensions", []),
-                "file_path": shape_data.get("file_path", ""),
-                "description": shape_data.get("description", ""),
-                "tags": shape_data.get("tags", [])
-            }
-            
-            result = self.catalog_shapes.insert_one(document)
-            print(f"[DATABASE] Catalog shape '{shape_name}' saved with ID: {result.inserted_id}")
-            return str(result.inserted_id)
-            
-        except Exception as e:
-            print(f"[DATABASE] Error inserting catalog shape: {e}")
+        ids = self.insert_catalog_shapes_bulk([(shape_name, shape_data)])
+        if not ids:
             return ""
+        
+        logger.debug("[DATABASE] Catalog shape '%s' saved with ID: %s", shape_name, ids[0])
+        return ids[0]
     
-    def get_order_drawings(self, limit: int = 10) -> List[Dict]:
-        """Get recent order drawing analyses"""
+    def get_order_drawings(self, limit: int = 10, fields: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Get recent order drawing analyses
+        
+        Args:
+            limit: Maximum number of drawings to return (newest first)
+            fields: Only return these (dotted) fields, e.g. ["file_name", "chatco.similarity_score"];
+                    all fields if None
+        """
         try:
-            cursor = self.order_drawings.find().sort("timestamp", -1).limit(limit)
+            projection = {field: 1 for field in fields} if fields else None
+            cursor = self.order_drawings.find({}, projection).sort(_RECENT_SORT).limit(limit)
+            if limit:
+                # Fetch the whole result in one batch instead of the default 101-document first batch
+                cursor = cursor.batch_size(limit)
             return list(cursor)
         except Exception as e:
             print(f"[DATABASE] Error retrieving order drawings: {e}")
             return []
     
+    def iter_order_drawings(self, limit: int = 10, fields: Optional[List[str]] = None):
+        """
+        Stream recent order drawing analyses (newest first) without materializing the list
+        
+        Returns the cursor itself - documents are fetched and decoded 32 at a time as it is
+        iterated, e.g. by json_lines() in a streaming HTTP response.
+        """
+        projection = {field: 1 for field in fields} if fields else None
+        return self.order_drawings.find({}, projection).sort(_RECENT_SORT).limit(limit).batch_size(32)
+    
+    def get_order_drawings_summary(self, limit: int = 10) -> List[Dict]:
+        """
+        Get timestamp, file name and similarity score of the recent order drawings
+        
+        Hinted to the summary_ts_id_covering index, which holds every projected field
+        (see _SUMMARY_INDEX for when MongoDB can skip reading the documents).
+        """
+        try:
+            cursor = (self.order_drawings.find({}, _SUMMARY_FIELDS)
+                      .sort(_RECENT_SORT)
+                      .limit(limit)
+                      .hint(_SUMMARY_INDEX))
+            return list(cursor)
+        except Exception as e:
+            print(f"[DATABASE] Error retrieving order drawing summaries: {e}")
+            return []
+    
+    def get_vertices(self, file_id: ObjectId) -> "np.ndarray":
+        """
+        Load PathFinder vertices stored in GridFS
+        
+        Args:
+            file_id: The pathfinder.vertices_ref of an order drawing
+            
+        Returns:
+            float32 array of shape (vertex_count, 2) holding the (x, y) vertices
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy is required to read stored PathFinder vertices")
+        return np.frombuffer(self.fs.get(file_id).read(), dtype="<f4").reshape(-1, 2)
+    
+    def get_vectors(self, file_id: ObjectId) -> List[Dict]:
+        """
+        Load PathFinder vectors stored in GridFS
+        
+        Args:
+            file_id: The pathfinder.vectors_ref of an order drawing
+        """
+        return bson.decode(self.fs.get(file_id).read())["vectors"]
+    
     def get_catalog_shapes(self, shape_type: str = None) -> List[Dict]:
-        """Get catalog shapes, optionally filtered by type"""
+        """
+        Get catalog shapes, optionally filtered by type
+        
+        Results are cached for _catalog_ttl seconds (writes through this instance clear the
+        cache; other writers show up once it expires). Callers get their own copies.
+        """
         try:
+            now = time.monotonic()
+            cached = self._catalog_cache.get(shape_type)
+            if cached and now - cached[0] < self._catalog_ttl:
+                return copy.deepcopy(cached[1])
+            
             query = {"shape_type": shape_type} if shape_type else {}
-            cursor = self.catalog_shapes.find(query)
-            return list(cursor)
+            shapes = list(self.catalog_shapes.find(query))
+            self._catalog_cache[shape_type] = (now, shapes)
+            return copy.deepcopy(shapes)
         except Exception as e:
             print(f"[DATABASE] Error retrieving catalog shapes: {e}")
             return []
@@ -169,9 +501,10 @@ class IronDrawingDatabase:
     def get_statistics(self) -> Dict:
         """Get database statistics"""
         try:
+            # Counts come from collection metadata instead of a full count_documents scan
             stats = {
-                "total_order_drawings": self.order_drawings.count_documents({}),
-                "total_catalog_shapes": self.catalog_shapes.count_documents({}),
+                "total_order_drawings": self.order_drawings.estimated_document_count(),
+                "total_catalog_shapes": self.catalog_shapes.estimated_document_count(),
                 "database_name": self.db.name,
                 "collections": self.db.list_collection_names()
             }
@@ -181,12 +514,31 @@ class IronDrawingDatabase:
             return {}
     
     def close_connection(self):
-        """Close database connection"""
-        try:
-            self.client.close()
-            print("[DATABASE] Connection closed")
-        except Exception as e:
-            print(f"[DATABASE] Error closing connection: {e}")
+        """
+        Release this instance's use of the database connection
+        
+        The client and its pool are shared by every instance in this process (including
+        get_db()), so closing it here would break the others; it is closed at process exit.
+        """
+        print("[DATABASE] Connection released")
+
+
+def _close_shared_client():
+    """Close this process's shared MongoClient (registered with atexit when it is created)"""
+    client = IronDrawingDatabase._client_by_pid.pop(os.getpid(), None)
+    if client is not None:
+        client.close()
+
+
+def json_lines(documents):
+    """
+    Yield documents as newline-delimited JSON (ObjectId and dates in MongoDB extended JSON)
+    
+    For streaming a cursor over HTTP, e.g.
+    Response(stream_with_context(json_lines(db.iter_order_drawings(100))), mimetype='application/x-ndjson')
+    """
+    for document in documents:
+        yield json_util.dumps(document) + "\n"
 
 
 def create_iron_database() -> IronDrawingDatabase:
@@ -198,13 +550,29 @@ def create_iron_database() -> IronDrawingDatabase:
     """
     try:
         db = IronDrawingDatabase()
-        db.create_collections()
+        # The client connects lazily, so this is the first round-trip to the server
+        if not db.create_collections():
+            return None
         return db
     except Exception as e:
         print(f"[DATABASE] Failed to create database: {e}")
         return None
 
 
+@lru_cache(maxsize=1)
+def get_db() -> IronDrawingDatabase:
+    """
+    The process-wide database, created on first use rather than at import
+    
+    Servers can start while MongoDB is still coming up; a failed attempt raises, so
+    lru_cache does not keep it and the next call retries.
+    """
+    db = create_iron_database()
+    if db is None:
+        raise RuntimeError("MongoDB database could not be initialized")
+    return db
+
+
 if __name__ == "__main__":
     # Test the database creation
     print("="*50)
@@ -18,13 +18,15 @@ try:
     print("Press Ctrl+C to stop")
     print("=" * 50)
 
-    # Run the server
+    # Run the server: one process, a thread per request. Shared connection pools (e.g. the
+    # MongoDB client's maxPoolSize=32) should be at least the expected concurrent requests
     app.run(
         host='0.0.0.0',
         port=5002,
         debug=False,
         use_reloader=False,
-        threaded=True
+        threaded=True,
+        processes=1
     )
 
 except Exception as e:
@@ -9,12 +9,56 @@ Usage: python shape_positioning_tool.py
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-from PIL import Image, ImageTk, ImageDraw
+from tkinter import ttk, filedialog, messagebox, simpledialog
+from PIL import Image, ImageTk, ImageColor
 import json
+import math
 import os
 from datetime import datetime
-from shape_template_generator import ShapeTemplateGenerator
+from functools import lru_cache
+
+# Parsed user shape configuration per file path: (st_mtime_ns, data) - re-read only when the file changes
+_SHAPE_CFG_CACHE = {}
+
+# Outline color of each area type
+_AREA_COLORS = {"shape": "blue", "field": "green", "label": "orange"}
+
+# Number of decoded images / thumbnails / Tk photos kept for switching back and forth between shapes
+_IMAGE_CACHE_SIZE = 16
+
+
+@lru_cache(maxsize=_IMAGE_CACHE_SIZE)
+def _open_image(path, mtime_ns):
+    """Decode an image file once per file version (callers must copy() before modifying it)"""
+    image = Image.open(path)
+    image.load()
+    return image
+
+
+@lru_cache(maxsize=_IMAGE_CACHE_SIZE)
+def _load_thumbnail(path, mtime_ns, max_width, max_height):
+    """
+    Image scaled down to fit max_width x max_height, cached per file version and size
+
+    May be the cached decoded image itself - callers must copy() before modifying it.
+    """
+    image = _open_image(path, mtime_ns)
+    if image.mode == 'P':
+        # Expand palette images so the image can be filled with plain color values (eraser)
+        image = image.convert('RGBA' if 'transparency' in image.info else 'RGB')
+    if image.mode in ('RGBA', 'LA'):
+        # Shape images are line art on white - flatten the alpha once so Tk never composites it
+        flattened = Image.new('RGB', image.size, (255, 255, 255))
+        flattened.paste(image, mask=image.split()[-1])
+        image = flattened
+
+    # Scale once to the precomputed size; images that already fit (most shape PNGs) are used as is
+    width, height = image.size
+    ratio = min(max_width / width, max_height / height)
+    if ratio < 1:
+        image = image.resize((max(1, int(width * ratio)), max(1, int(height * ratio))), Image.Resampling.LANCZOS)
+    return image
+
 
 class ShapePositioningTool:
     def __init__(self):
@@ -34,10 +78,18 @@ class ShapePositioningTool:
         self.image_path = None
         self.image_original = None
         self.image_display = None
+        self._photoimage_cache = {}  # (path, mtime_ns, max_width, max_height) -> ImageTk.PhotoImage
         self.canvas_image_id = None
+        self._place_image_after_id = None  # Pending idle callback placing a newly loaded image
         self.elements = []  # List of positioned elements
         self.selected_element = None
+        self._selected_index = None  # Position of selected_element in self.elements / the listbox
+        self._item_to_element = {}  # Canvas item id (shape and text) -> element, for click hit-testing
         self.drag_data = {"x": 0, "y": 0}
+        self._pending_drag = None  # Latest (x, y) of a drag not yet applied to the canvas
+        self._drag_after_id = None  # Pending _flush_drag callback
+        self._text_after_id = None  # Pending deferred elements list refresh while typing
+        self._dirty_elements = []  # Elements whose listbox row the deferred refresh rewrites
 
         # Default styling options
         self.default_font_size = 30
@@ -74,27 +126,43 @@ class ShapePositioningTool:
         # Read shape from user configuration file
         self.current_shape = self.get_user_chosen_shape()
 
-        # Initialize template generator
-        self.template_generator = ShapeTemplateGenerator()
+        # Template generator is created on first export (see template_generator)
+        self._template_generator = None
 
         self.setup_ui()
         # Delay loading to ensure UI is ready
         self.root.after(500, self.load_default_image)
 
-    def get_user_chosen_shape(self):
-        """Read the user chosen shape from the JSON file"""
-        import json
-        import os
+    @property
+    def template_generator(self):
+        """ShapeTemplateGenerator, imported and created on first use (only exports need it)"""
+        if self._template_generator is None:
+            from shape_template_generator import ShapeTemplateGenerator
+            self._template_generator = ShapeTemplateGenerator()
+        return self._template_generator
 
+    def get_user_chosen_shape(self):
+        """Read the user chosen shape from the JSON file (cached until the file is modified)"""
         json_path = os.path.join('templates', 'shapes', 'user_choose_shape.json')
 
         try:
-            if os.path.exists(json_path):
-                with open(json_path, 'r', encoding='utf-8') as f:
+            mtime = os.stat(json_path).st_mtime_ns
+        except OSError:
+            # No configuration file
+            return '107'
+
+        try:
+            cached = _SHAPE_CFG_CACHE.get(json_path)
+            if cached and cached[0] == mtime:
+                data = cached[1]
+            else:
+                # Binary mode: json detects the UTF-8 encoding itself and skips text decoding
+                with open(json_path, 'rb') as f:
                     data = json.load(f)
-                    shape = data.get('user_chosen_shape', '107')
-                    print(f"Loading shape {shape} from user configuration")
-                    return shape
+                _SHAPE_CFG_CACHE[json_path] = (mtime, data)
+            shape = data.get('user_chosen_shape', '107')
+            print(f"Loading shape {shape} from user configuration")
+            return shape
         except Exception as e:
             print(f"Error reading user configuration: {e}")
 
@@ -104,6 +172,9 @@ class ShapePositioningTool:
     def setup_ui(self):
         """Setup the user interface"""
 
+        # One shared style for the tool's buttons, resolved once instead of per widget
+        ttk.Style(self.root).configure('Tool.TButton', padding=2)
+
         # Main frame
         main_frame = ttk.Frame(self.root)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -139,9 +210,10 @@ class ShapePositioningTool:
         left_panel.bind('<Configure>', configure_scroll_region)
         left_canvas.bind('<Configure>', configure_canvas_width)
 
-        # Enable mousewheel scrolling
+        # Enable mousewheel scrolling - one unit per wheel event, by the sign of the delta only
+        # (Windows reports multiples of 120, macOS small values)
         def on_mousewheel(event):
-            left_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+            left_canvas.yview_scroll(-1 if event.delta > 0 else 1, "units")
 
         left_canvas.bind("<MouseWheel>", on_mousewheel)
 
@@ -154,21 +226,21 @@ class ShapePositioningTool:
 
         # Image controls
         ttk.Label(left_panel, text="Image:").pack(anchor=tk.W, pady=(0, 5))
-        ttk.Button(left_panel, text="Load Image", command=self.load_image).pack(fill=tk.X, pady=(0, 5))
-        ttk.Button(left_panel, text="Reset to Default", command=self.load_default_image).pack(fill=tk.X, pady=(0, 5))
-        ttk.Button(left_panel, text="Center Image", command=self.center_image).pack(fill=tk.X, pady=(0, 10))
+        self._button(left_panel, "Load Image", self.load_image).pack(fill=tk.X, pady=(0, 5))
+        self._button(left_panel, "Reset to Default", self.load_default_image).pack(fill=tk.X, pady=(0, 5))
+        self._button(left_panel, "Center Image", self.center_image).pack(fill=tk.X, pady=(0, 10))
 
         # Element controls
         ttk.Label(left_panel, text="Add Elements:").pack(anchor=tk.W, pady=(0, 5))
-        ttk.Button(left_panel, text="Add Label", command=self.add_label).pack(fill=tk.X, pady=(0, 5))
-        ttk.Button(left_panel, text="Add Input Field", command=self.add_input).pack(fill=tk.X, pady=(0, 10))
+        self._button(left_panel, "Add Label", self.add_label).pack(fill=tk.X, pady=(0, 5))
+        self._button(left_panel, "Add Input Field", self.add_input).pack(fill=tk.X, pady=(0, 10))
 
         # Eraser tool
         ttk.Label(left_panel, text="Image Editing:").pack(anchor=tk.W, pady=(0, 5))
-        self.eraser_button = ttk.Button(left_panel, text="Enable Eraser", command=self.toggle_eraser)
+        self.eraser_button = self._button(left_panel, "Enable Eraser", self.toggle_eraser)
         self.eraser_button.pack(fill=tk.X, pady=(0, 5))
-        ttk.Button(left_panel, text="Save Edited Image", command=self.save_edited_image).pack(fill=tk.X, pady=(0, 5))
-        ttk.Button(left_panel, text="Save with Web Display Dimensions", command=self.save_with_display_dimensions).pack(fill=tk.X, pady=(0, 10))
+        self._button(left_panel, "Save Edited Image", self.save_edited_image).pack(fill=tk.X, pady=(0, 5))
+        self._button(left_panel, "Save with Web Display Dimensions", self.save_with_display_dimensions).pack(fill=tk.X, pady=(0, 10))
 
         # Area definition tool
         ttk.Label(left_panel, text="Area Definition:").pack(anchor=tk.W, pady=(0, 5))
@@ -177,13 +249,15 @@ class ShapePositioningTool:
         area_type_frame = ttk.Frame(left_panel)
         area_type_frame.pack(fill=tk.X, pady=(0, 5))
         self.area_type_var = tk.StringVar(value="shape")
-        ttk.Radiobutton(area_type_frame, text="Shape Area", variable=self.area_type_var, value="shape").pack(side=tk.LEFT)
-        ttk.Radiobutton(area_type_frame, text="Field Area", variable=self.area_type_var, value="field").pack(side=tk.LEFT)
-        ttk.Radiobutton(area_type_frame, text="Label Area", variable=self.area_type_var, value="label").pack(side=tk.LEFT)
+        self.area_type_buttons = []
+        for text, value in (("Shape Area", "shape"), ("Field Area", "field"), ("Label Area", "label")):
+            button = ttk.Radiobutton(area_type_frame, text=text, variable=self.area_type_var, value=value)
+            button.pack(side=tk.LEFT)
+            self.area_type_buttons.append(button)
 
-        self.area_button = ttk.Button(left_panel, text="Define Area", command=self.toggle_area_mode)
+        self.area_button = self._button(left_panel, "Define Area", self.toggle_area_mode)
         self.area_button.pack(fill=tk.X, pady=(0, 5))
-        ttk.Button(left_panel, text="Clear All Areas", command=self.clear_areas).pack(fill=tk.X, pady=(0, 10))
+        self._button(left_panel, "Clear All Areas", self.clear_areas).pack(fill=tk.X, pady=(0, 10))
 
         # Absolute positioning controls
         ttk.Label(left_panel, text="Absolute Positioning:").pack(anchor=tk.W, pady=(0, 5))
@@ -191,9 +265,9 @@ class ShapePositioningTool:
         # Reference point controls
         ref_frame = ttk.Frame(left_panel)
         ref_frame.pack(fill=tk.X, pady=(0, 5))
-        self.ref_button = ttk.Button(ref_frame, text="Set Reference Point", command=self.toggle_reference_mode)
+        self.ref_button = self._button(ref_frame, "Set Reference Point", self.toggle_reference_mode)
         self.ref_button.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 2))
-        ttk.Button(ref_frame, text="Clear", command=self.clear_reference_point, width=8).pack(side=tk.LEFT)
+        self._button(ref_frame, "Clear", self.clear_reference_point, width=8).pack(side=tk.LEFT)
 
         # Reference point coordinates display
         self.ref_coords_var = tk.StringVar(value="No reference point set")
@@ -237,7 +311,7 @@ class ShapePositioningTool:
         self.elements_listbox.bind('<<ListboxSelect>>', self.on_element_selected)
 
         # Catalog image preview button
-        ttk.Button(left_panel, text="Preview Catalog Image", command=self.preview_catalog_image).pack(fill=tk.X, pady=(5, 10))
+        self._button(left_panel, "Preview Catalog Image", self.preview_catalog_image).pack(fill=tk.X, pady=(5, 10))
 
         # Element properties
         ttk.Label(left_panel, text="Properties:").pack(anchor=tk.W, pady=(0, 5))
@@ -247,14 +321,14 @@ class ShapePositioningTool:
         self.text_var = tk.StringVar()
         self.text_entry = ttk.Entry(left_panel, textvariable=self.text_var)
         self.text_entry.pack(fill=tk.X, pady=(0, 5))
-        self.text_var.trace('w', self.on_text_changed)
+        self.text_var.trace_add('write', self.on_text_changed)
 
         # Name property (for input field names)
         ttk.Label(left_panel, text="Field Name:").pack(anchor=tk.W)
         self.field_name_var = tk.StringVar()
         self.field_name_entry = ttk.Entry(left_panel, textvariable=self.field_name_var)
         self.field_name_entry.pack(fill=tk.X, pady=(0, 5))
-        self.field_name_var.trace('w', self.on_field_name_changed)
+        self.field_name_var.trace_add('write', self.on_field_name_changed)
 
         # Font size property
         ttk.Label(left_panel, text="Font Size:").pack(anchor=tk.W)
@@ -262,7 +336,7 @@ class ShapePositioningTool:
         font_size_frame = ttk.Frame(left_panel)
         font_size_frame.pack(fill=tk.X, pady=(0, 5))
         ttk.Entry(font_size_frame, textvariable=self.font_size_var, width=5).pack(side=tk.LEFT)
-        ttk.Button(font_size_frame, text="Apply", command=self.on_font_size_changed, width=6).pack(side=tk.LEFT, padx=(2, 0))
+        self._button(font_size_frame, "Apply", self.on_font_size_changed, width=6).pack(side=tk.LEFT, padx=(2, 0))
 
         # Font color property
         ttk.Label(left_panel, text="Font Color:").pack(anchor=tk.W)
@@ -272,17 +346,17 @@ class ShapePositioningTool:
         color_combo = ttk.Combobox(color_frame, textvariable=self.font_color_var, width=8,
                                   values=["red", "black", "blue", "green", "orange", "purple", "brown"])
         color_combo.pack(side=tk.LEFT)
-        ttk.Button(color_frame, text="Apply", command=self.on_font_color_changed).pack(side=tk.LEFT, padx=(5, 0))
+        self._button(color_frame, "Apply", self.on_font_color_changed).pack(side=tk.LEFT, padx=(5, 0))
 
         # Delete button
-        ttk.Button(left_panel, text="Delete Element", command=self.delete_element).pack(fill=tk.X, pady=(0, 10))
+        self._button(left_panel, "Delete Element", self.delete_element).pack(fill=tk.X, pady=(0, 10))
 
         # Export/Import
         ttk.Label(left_panel, text="Data:").pack(anchor=tk.W, pady=(0, 5))
-        ttk.Button(left_panel, text="Export Layout", command=self.export_layout).pack(fill=tk.X, pady=(0, 5))
-        ttk.Button(left_panel, text="Import Layout", command=self.import_layout).pack(fill=tk.X, pady=(0, 5))
-        ttk.Button(left_panel, text="Generate HTML", command=self.generate_html).pack(fill=tk.X, pady=(0, 5))
-        ttk.Button(left_panel, text="Export as Popup Template", command=self.export_popup_template).pack(fill=tk.X, pady=(0, 10))
+        self._button(left_panel, "Export Layout", self.export_layout).pack(fill=tk.X, pady=(0, 5))
+        self._button(left_panel, "Import Layout", self.import_layout).pack(fill=tk.X, pady=(0, 5))
+        self._button(left_panel, "Generate HTML", self.generate_html).pack(fill=tk.X, pady=(0, 5))
+        self._button(left_panel, "Export as Popup Template", self.export_popup_template).pack(fill=tk.X, pady=(0, 10))
 
         # Middle panel - Canvas
         middle_panel = ttk.Frame(main_frame)
@@ -321,7 +395,7 @@ class ShapePositioningTool:
         web_controls_frame = ttk.Frame(right_panel)
         web_controls_frame.pack(fill=tk.X, pady=(0, 10))
 
-        ttk.Button(web_controls_frame, text="Refresh Preview", command=self.update_web_preview).pack(fill=tk.X, pady=(0, 5))
+        self._button(web_controls_frame, "Refresh Preview", self.update_web_preview).pack(fill=tk.X, pady=(0, 5))
 
         # Show web display toggle
         self.show_web_preview_var = tk.BooleanVar(value=True)
@@ -345,6 +419,10 @@ class ShapePositioningTool:
         self.canvas.bind("<B1-Motion>", self.on_canvas_drag)
         self.canvas.bind("<ButtonRelease-1>", self.on_canvas_release)
 
+    def _button(self, parent, text, command, **kwargs):
+        """Create a ttk.Button with the shared Tool.TButton style"""
+        return ttk.Button(parent, text=text, command=command, style='Tool.TButton', **kwargs)
+
     def load_default_image(self):
         """Load the default shape image"""
         shape_num = self.shape_var.get()
@@ -369,20 +447,45 @@ class ShapePositioningTool:
         """Load and display an image file"""
         try:
             self.image_path = file_path
-            self.image_original = Image.open(file_path)
 
-            # Resize image if too large
+            # Resize image if too large - decoded/resized images and their Tk photos are cached
+            # per file version, so switching back to a shape does not decode and resample again
             max_size = (600, 400)
-            self.image_original.thumbnail(max_size, Image.Resampling.LANCZOS)
+            cache_key = (os.path.abspath(file_path), os.stat(file_path).st_mtime_ns) + max_size
+            self.image_original = _load_thumbnail(*cache_key).copy()
+
+            self.image_display = self._photoimage_cache.get(cache_key)
+            if self.image_display is None:
+                self.image_display = ImageTk.PhotoImage(self.image_original)
+                if len(self._photoimage_cache) >= _IMAGE_CACHE_SIZE:
+                    self._photoimage_cache.pop(next(iter(self._photoimage_cache)))
+                self._photoimage_cache[cache_key] = self.image_display
+
+            # Clear canvas now; the image and everything positioned from it (overlay, scroll
+            # region) are placed in a single idle pass once Tk has settled the canvas geometry,
+            # instead of forcing update_idletasks here and redrawing the overlay 100ms later
+            self.canvas.delete("all")
+            self.canvas_image_id = None
+            if self._place_image_after_id:
+                self.root.after_cancel(self._place_image_after_id)
+            self._place_image_after_id = self.root.after_idle(self._place_loaded_image)
 
-            self.image_display = ImageTk.PhotoImage(self.image_original)
+            # Clear elements
+            self.elements = []
+            self._item_to_element.clear()
+            self.update_elements_list()
 
-            # Clear canvas and add image centered
-            self.canvas.delete("all")
+            # Update web preview
+            if hasattr(self, 'web_canvas'):
+                self.update_web_preview()
 
-            # Force canvas to update and get actual dimensions
-            self.canvas.update_idletasks()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load image: {str(e)}")
 
+    def _place_loaded_image(self):
+        """Add the loaded image centered on the canvas, then its overlay and scroll region"""
+        self._place_image_after_id = None
+        try:
             # Calculate center position with fallback values
             canvas_width = self.canvas.winfo_width()
             canvas_height = self.canvas.winfo_height()
@@ -397,24 +500,24 @@ class ShapePositioningTool:
             center_y = canvas_height // 2
 
             self.canvas_image_id = self.canvas.create_image(center_x, center_y, anchor=tk.CENTER, image=self.image_display)
+            # Keep the image under any elements drawn since the load (e.g. by import_layout)
+            self.canvas.tag_lower(self.canvas_image_id)
 
             # Update display overlay if enabled
             if self.show_display_overlay:
-                self.root.after(100, self.update_display_overlay)  # Delay to ensure image is rendered
+                self.update_display_overlay()
 
-            # Update canvas scroll region
-            bbox = self.canvas.bbox("all")
+            # Update canvas scroll region - when the image is the only item (the canvas was just
+            # cleared) it is the image's own box, no need to have Tk measure every item
+            if self.elements or self.show_display_overlay:
+                bbox = self.canvas.bbox("all")
+            else:
+                img_width, img_height = self.image_original.size
+                left, top = center_x - img_width // 2, center_y - img_height // 2
+                bbox = (left, top, left + img_width, top + img_height)
             if bbox:
                 self.canvas.configure(scrollregion=bbox)
 
-            # Clear elements
-            self.elements = []
-            self.update_elements_list()
-
-            # Update web preview
-            if hasattr(self, 'web_canvas'):
-                self.update_web_preview()
-
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load image: {str(e)}")
 
@@ -426,10 +529,7 @@ class ShapePositioningTool:
     def center_image(self):
         """Center the current image on the canvas"""
         if self.canvas_image_id and self.image_display:
-            # Force canvas update
-            self.canvas.update_idletasks()
-
-            # Get actual canvas dimensions
+            # Get actual canvas dimensions (the window is laid out by the time a button is clicked)
             canvas_width = self.canvas.winfo_width()
             canvas_height = self.canvas.winfo_height()
 
@@ -437,17 +537,20 @@ class ShapePositioningTool:
             center_x = canvas_width // 2
             center_y = canvas_height // 2
 
-            # Move image to center
+            # Move image to center - the existing image item is reused, only its position changes
             self.canvas.coords(self.canvas_image_id, center_x, center_y)
 
-            # Update display overlay if enabled
+            # Update display overlay if enabled, in the next idle pass together with the redraw
             if self.show_display_overlay:
-                self.root.after(100, self.update_display_overlay)
+                self.root.after_idle(self.update_display_overlay)
 
-            # Update scroll region
-            bbox = self.canvas.bbox("all")
-            if bbox:
-                self.canvas.configure(scrollregion=bbox)
+            # Update scroll region: the visible area plus the image's box, computed from the known
+            # sizes instead of having Tk measure every item with bbox("all")
+            img_width, img_height = self.image_original.size
+            left, top = center_x - img_width // 2, center_y - img_height // 2
+            self.canvas.configure(scrollregion=(min(0, left), min(0, top),
+                                                max(canvas_width, left + img_width),
+                                                max(canvas_height, top + img_height)))
 
     def preview_catalog_image(self):
         """Preview the current shape's catalog image in a popup window"""
@@ -479,8 +582,8 @@ class ShapePositioningTool:
         image_frame.pack(fill=tk.BOTH, expand=True)
 
         try:
-            # Load and resize image for preview
-            preview_image = Image.open(self.image_path)
+            # Load and resize image for preview (the decoded file is shared with load_image_file)
+            preview_image = _open_image(os.path.abspath(self.image_path), os.stat(self.image_path).st_mtime_ns)
 
             # Calculate size to fit in preview window
             max_width = 450
@@ -493,7 +596,8 @@ class ShapePositioningTool:
             new_width = int(img_width * ratio)
             new_height = int(img_height * ratio)
 
-            preview_image = preview_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            # BILINEAR: a fraction of LANCZOS's cost and indistinguishable at preview size
+            preview_image = preview_image.resize((new_width, new_height), Image.Resampling.BILINEAR)
             preview_photo = ImageTk.PhotoImage(preview_image)
 
             # Create label to display image
@@ -524,7 +628,6 @@ class ShapePositioningTool:
             return
 
         # Ask user for label text
-        from tkinter import simpledialog
         text = simpledialog.askstring("Add Label", "Enter label text:", initialvalue="A")
         if not text:
             return  # User cancelled
@@ -540,7 +643,8 @@ class ShapePositioningTool:
 
         self.elements.append(element)
         self.draw_element(element)
-        self.update_elements_list()
+        self.elements_listbox.insert(tk.END, self._element_label(element))
+        self.on_element_moved()
 
         # Update current position display to show absolute coordinates
         self.update_current_position_display(element['x'], element['y'])
@@ -562,7 +666,8 @@ class ShapePositioningTool:
 
         self.elements.append(element)
         self.draw_element(element)
-        self.update_elements_list()
+        self.elements_listbox.insert(tk.END, self._element_label(element))
+        self.on_element_moved()
 
         # Update current position display to show absolute coordinates
         self.update_current_position_display(element['x'], element['y'])
@@ -593,23 +698,51 @@ class ShapePositioningTool:
                 fill="black", tags="draggable"
             )
             element['text_id'] = text_id
+            self._item_to_element[text_id] = element
+
+        if element['canvas_id']:
+            self._item_to_element[element['canvas_id']] = element
 
     def update_elements_list(self):
-        """Update the elements listbox"""
+        """Rebuild the elements listbox (after the whole element list is replaced)"""
         self.elements_listbox.delete(0, tk.END)
-        for i, element in enumerate(self.elements):
-            self.elements_listbox.insert(tk.END, f"{element['type']}: {element['text']}")
+        for element in self.elements:
+            self.elements_listbox.insert(tk.END, self._element_label(element))
 
         # Auto-update web preview if enabled
         self.on_element_moved()
 
+    def _element_label(self, element):
+        """Listbox row text for an element"""
+        return f"{element['type']}: {element['text']}"
+
+    def _element_index(self, element):
+        """Index of an element in self.elements (no scan for the selected element), or None"""
+        index = self._selected_index
+        if (element is self.selected_element and index is not None
+                and index < len(self.elements) and self.elements[index] is element):
+            return index
+        for i, candidate in enumerate(self.elements):
+            if candidate is element:
+                if element is self.selected_element:
+                    self._selected_index = i
+                return i
+        return None
+
+    def refresh_element_row(self, element):
+        """Rewrite the single listbox row of an element"""
+        index = self._element_index(element)
+        if index is not None:
+            self.elements_listbox.delete(index)
+            self.elements_listbox.insert(index, self._element_label(element))
+
     def update_current_position_display(self, x, y):
         """Update the current position display with absolute coordinates"""
         if self.reference_point:
             # Calculate absolute position relative to reference point
             rel_x = x - self.reference_point[0]
             rel_y = y - self.reference_point[1]
-            distance = ((rel_x ** 2) + (rel_y ** 2)) ** 0.5
+            distance = math.hypot(rel_x, rel_y)
             self.current_pos_var.set(f"Position: ({x},{y}) | Absolute: ({rel_x:+.0f},{rel_y:+.0f}) | Distance: {distance:.1f}")
         else:
             self.current_pos_var.set(f"Position: ({x},{y}) | Set reference point for absolute coordinates")
@@ -621,6 +754,7 @@ class ShapePositioningTool:
             index = selection[0]
             if 0 <= index < len(self.elements):
                 self.selected_element = self.elements[index]
+                self._selected_index = index
                 self.text_var.set(self.selected_element['text'])
                 self.field_name_var.set(self.selected_element.get('field_name', ''))
 
@@ -646,14 +780,30 @@ class ShapePositioningTool:
                 if 'text_id' in self.selected_element:
                     self.canvas.itemconfig(self.selected_element['text_id'], text=new_text)
 
-            self.update_elements_list()
+            self.schedule_elements_list_update(self.selected_element)
 
     def on_field_name_changed(self, *args):
         """Handle field name property change"""
         if self.selected_element:
             new_field_name = self.field_name_var.get()
             self.selected_element['field_name'] = new_field_name
-            self.update_elements_list()
+            self.schedule_elements_list_update()
+
+    def schedule_elements_list_update(self, element=None, delay_ms=150):
+        """Refresh the element's listbox row and the web preview once typing pauses instead of on every keystroke"""
+        if element is not None and not any(dirty is element for dirty in self._dirty_elements):
+            self._dirty_elements.append(element)
+        if self._text_after_id:
+            self.root.after_cancel(self._text_after_id)
+        self._text_after_id = self.root.after(delay_ms, self._deferred_update_elements_list)
+
+    def _deferred_update_elements_list(self):
+        """Run the refresh scheduled by schedule_elements_list_update"""
+        self._text_after_id = None
+        for element in self._dirty_elements:
+            self.refresh_element_row(element)
+        self._dirty_elements = []
+        self.on_element_moved()
 
     def delete_element(self):
         """Delete the selected element"""
@@ -661,15 +811,21 @@ class ShapePositioningTool:
             # Remove from canvas
             if self.selected_element['canvas_id']:
                 self.canvas.delete(self.selected_element['canvas_id'])
+                self._item_to_element.pop(self.selected_element['canvas_id'], None)
             if 'text_id' in self.selected_element:
                 self.canvas.delete(self.selected_element['text_id'])
+                self._item_to_element.pop(self.selected_element['text_id'], None)
 
-            # Remove from list
-            self.elements.remove(self.selected_element)
+            # Remove from list and its listbox row
+            index = self._element_index(self.selected_element)
+            if index is not None:
+                del self.elements[index]
+                self.elements_listbox.delete(index)
             self.selected_element = None
+            self._selected_index = None
             self.text_var.set("")
             self.field_name_var.set("")
-            self.update_elements_list()
+            self.on_element_moved()
 
     def on_canvas_click(self, event):
         """Handle canvas click"""
@@ -693,51 +849,61 @@ class ShapePositioningTool:
         # Find clicked item
         clicked_item = self.canvas.find_closest(event.x, event.y)[0]
 
-        # Check if it's a draggable element
-        if "draggable" in self.canvas.gettags(clicked_item):
-            # Find corresponding element
-            for element in self.elements:
-                if (element['canvas_id'] == clicked_item or
-                    element.get('text_id') == clicked_item):
-                    self.selected_element = element
-                    self.text_var.set(element['text'])
-                    self.drag_data["x"] = event.x
-                    self.drag_data["y"] = event.y
-                    break
+        # Check if it's a draggable element - every draggable item is in the item map,
+        # so a local lookup replaces asking Tk for the item's tags
+        element = self._item_to_element.get(clicked_item)
+        if element is not None:
+            self.selected_element = element
+            self._selected_index = None  # Resolved on demand by _element_index
+            self.text_var.set(element['text'])
+            self.drag_data["x"] = event.x
+            self.drag_data["y"] = event.y
 
     def on_canvas_drag(self, event):
-        """Handle canvas drag"""
+        """Handle canvas drag - motion events are coalesced into one canvas update per ~16ms frame"""
+        self._pending_drag = (event.x, event.y)
+        if self._drag_after_id is None:
+            self._drag_after_id = self.root.after(16, self._flush_drag)
+
+    def _flush_drag(self):
+        """Apply the latest drag position to the canvas"""
+        self._drag_after_id = None
+        if self._pending_drag is None:
+            return
+        x, y = self._pending_drag
+        self._pending_drag = None
+
         if self.eraser_mode:
-            # Update eraser rectangle
+            # Update eraser rectangle - created on the first drag update, then only reshaped
             if self.eraser_start_x is not None and self.eraser_start_y is not None:
                 if self.eraser_rect_id:
-                    self.canvas.delete(self.eraser_rect_id)
-
-                self.eraser_rect_id = self.canvas.create_rectangle(
-                    self.eraser_start_x, self.eraser_start_y, event.x, event.y,
-                    outline="red", width=2, fill="", tags="eraser_rect"
-                )
+                    self.canvas.coords(self.eraser_rect_id, self.eraser_start_x, self.eraser_start_y, x, y)
+                else:
+                    self.eraser_rect_id = self.canvas.create_rectangle(
+                        self.eraser_start_x, self.eraser_start_y, x, y,
+                        outline="red", width=2, fill="", tags="eraser_rect"
+                    )
             return
 
         if self.area_mode:
-            # Update area rectangle
+            # Update area rectangle - created (in the area type's color) on the first drag update,
+            # then only reshaped
             if self.area_start_x is not None and self.area_start_y is not None:
                 if self.area_rect_id:
-                    self.canvas.delete(self.area_rect_id)
-
-                area_type = self.area_type_var.get()
-                color = {"shape": "blue", "field": "green", "label": "orange"}.get(area_type, "blue")
-
-                self.area_rect_id = self.canvas.create_rectangle(
-                    self.area_start_x, self.area_start_y, event.x, event.y,
-                    outline=color, width=3, fill="", tags=f"area_rect_{area_type}"
-                )
+                    self.canvas.coords(self.area_rect_id, self.area_start_x, self.area_start_y, x, y)
+                else:
+                    area_type = self.area_type_var.get()
+                    self.area_rect_id = self.canvas.create_rectangle(
+                        self.area_start_x, self.area_start_y, x, y,
+                        outline=_AREA_COLORS.get(area_type, "blue"), width=3, fill="",
+                        tags=f"area_rect_{area_type}"
+                    )
             return
 
         if self.selected_element:
-            # Calculate movement
-            delta_x = event.x - self.drag_data["x"]
-            delta_y = event.y - self.drag_data["y"]
+            # Calculate movement since the last applied position
+            delta_x = x - self.drag_data["x"]
+            delta_y = y - self.drag_data["y"]
 
             # Move the element
             self.canvas.move(self.selected_element['canvas_id'], delta_x, delta_y)
@@ -749,8 +915,8 @@ class ShapePositioningTool:
             self.selected_element['y'] += delta_y
 
             # Update drag data
-            self.drag_data["x"] = event.x
-            self.drag_data["y"] = event.y
+            self.drag_data["x"] = x
+            self.drag_data["y"] = y
 
             # Update current position display with absolute coordinates
             self.update_current_position_display(self.selected_element['x'], self.selected_element['y'])
@@ -761,6 +927,11 @@ class ShapePositioningTool:
 
     def on_canvas_release(self, event):
         """Handle canvas release"""
+        # Apply a drag position still waiting for its frame before finishing the drag
+        if self._drag_after_id is not None:
+            self.root.after_cancel(self._drag_after_id)
+            self._flush_drag()
+
         if self.eraser_mode:
             # Apply eraser
             if self.eraser_start_x is not None and self.eraser_start_y is not None:
@@ -795,7 +966,7 @@ class ShapePositioningTool:
                     self.canvas.delete(self.area_rect_id)
 
                 area_type = self.area_type_var.get()
-                color = {"shape": "blue", "field": "green", "label": "orange"}.get(area_type, "blue")
+                color = _AREA_COLORS.get(area_type, "blue")
 
                 # Create permanent area boundary
                 permanent_rect_id = self.canvas.create_rectangle(
@@ -859,41 +1030,7 @@ class ShapePositioningTool:
                     }
 
                 # Process elements for template generation
-                for e in self.elements:
-                    element_data = {
-                        'type': e['type'],
-                        'text': e.get('text', ''),
-                        'x': e['x'],
-                        'y': e['y']
-                    }
-
-                    # Add absolute positioning data if reference point is set
-                    if self.reference_point:
-                        ref_x, ref_y = self.reference_point
-                        element_data['absolute_positioning'] = {
-                            'relative_x': e['x'] - ref_x,
-                            'relative_y': e['y'] - ref_y,
-                            'distance_from_ref': ((e['x'] - ref_x)**2 + (e['y'] - ref_y)**2)**0.5
-                        }
-
-                    # Add additional properties based on element type
-                    if e['type'] == 'text':
-                        element_data['font_size'] = e.get('font_size', self.default_font_size)
-                        element_data['color'] = e.get('color', self.default_font_color)
-                    elif e['type'] == 'line':
-                        element_data['start_x'] = e.get('start_x', e['x'])
-                        element_data['start_y'] = e.get('start_y', e['y'])
-                        element_data['end_x'] = e.get('end_x', e['x'] + 50)
-                        element_data['end_y'] = e.get('end_y', e['y'])
-                        element_data['color'] = e.get('color', 'black')
-                        element_data['width'] = e.get('width', 2)
-                    elif e['type'] == 'rectangle':
-                        element_data['width'] = e.get('width', 50)
-                        element_data['height'] = e.get('height', 50)
-                        element_data['color'] = e.get('color', 'black')
-                        element_data['line_width'] = e.get('line_width', 2)
-
-                    data['elements'].append(element_data)
+                data['elements'] = [self._serialize_element(e, self.reference_point) for e in self.elements]
 
                 # Save JSON file
                 with open(file_path, 'w', encoding='utf-8') as f:
@@ -911,6 +1048,43 @@ class ShapePositioningTool:
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to export: {str(e)}")
 
+    def _serialize_element(self, e, reference_point):
+        """Build the exported layout entry of one element"""
+        element_data = {
+            'type': e['type'],
+            'text': e.get('text', ''),
+            'x': e['x'],
+            'y': e['y']
+        }
+
+        # Add absolute positioning data if reference point is set
+        if reference_point:
+            rel_x, rel_y = e['x'] - reference_point[0], e['y'] - reference_point[1]
+            element_data['absolute_positioning'] = {
+                'relative_x': rel_x,
+                'relative_y': rel_y,
+                'distance_from_ref': math.hypot(rel_x, rel_y)
+            }
+
+        # Add additional properties based on element type
+        if e['type'] == 'text':
+            element_data['font_size'] = e.get('font_size', self.default_font_size)
+            element_data['color'] = e.get('color', self.default_font_color)
+        elif e['type'] == 'line':
+            element_data['start_x'] = e.get('start_x', e['x'])
+            element_data['start_y'] = e.get('start_y', e['y'])
+            element_data['end_x'] = e.get('end_x', e['x'] + 50)
+            element_data['end_y'] = e.get('end_y', e['y'])
+            element_data['color'] = e.get('color', 'black')
+            element_data['width'] = e.get('width', 2)
+        elif e['type'] == 'rectangle':
+            element_data['width'] = e.get('width', 50)
+            element_data['height'] = e.get('height', 50)
+            element_data['color'] = e.get('color', 'black')
+            element_data['line_width'] = e.get('line_width', 2)
+
+        return element_data
+
     def import_layout(self):
         """Import a layout from JSON"""
         file_path = filedialog.askopenfilename(
@@ -920,7 +1094,7 @@ class ShapePositioningTool:
 
         if file_path:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
+                with open(file_path, 'rb') as f:
                     data = json.load(f)
 
                 # Load shape and image
@@ -934,6 +1108,7 @@ class ShapePositioningTool:
                 # Clear existing elements
                 self.canvas.delete("draggable")
                 self.elements = []
+                self._item_to_element.clear()
 
                 # Load elements
                 for elem_data in data.get('elements', []):
@@ -1066,7 +1241,7 @@ class ShapePositioningTool:
             self.canvas.configure(cursor="crosshair")
             messagebox.showinfo("Eraser Mode", "Click and drag to select areas to erase from the image.\n\nThe selected area will be filled with white to remove original letters.")
         else:
-            self.eraser_button.configure(text="Enable Eraser", style="TButton")
+            self.eraser_button.configure(text="Enable Eraser", style="Tool.TButton")
             self.canvas.configure(cursor="")
 
             # Clean up any eraser rectangle
@@ -1090,7 +1265,7 @@ class ShapePositioningTool:
                                f"Click and drag to define the {area_type} area.\n\n"
                                f"This will help position elements accurately within the defined boundary.")
         else:
-            self.area_button.configure(text="Define Area", style="TButton")
+            self.area_button.configure(text="Define Area", style="Tool.TButton")
             self.canvas.configure(cursor="")
 
             # Clean up any area rectangle
@@ -1102,11 +1277,8 @@ class ShapePositioningTool:
         """Clear all defined areas"""
         self.defined_areas.clear()
 
-        # Remove any visual indicators from canvas
-        for item_id in list(self.canvas.find_all()):
-            tags = self.canvas.gettags(item_id)
-            if 'area_boundary' in tags:
-                self.canvas.delete(item_id)
+        # Remove any visual indicators from canvas (one tag delete instead of inspecting every item)
+        self.canvas.delete("area_boundary")
 
         messagebox.showinfo("Areas Cleared", "All defined areas have been cleared.")
 
@@ -1225,8 +1397,7 @@ class ShapePositioningTool:
 
             # Update current image to show the result
             self.image_original = resized_image
-            self.image_display = ImageTk.PhotoImage(resized_image)
-            self.canvas.itemconfig(self.canvas_image_id, image=self.image_display)
+            self.refresh_display_image()
 
             # Update overlay to match new dimensions
             if self.show_display_overlay:
@@ -1241,6 +1412,18 @@ class ShapePositioningTool:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save with display dimensions: {str(e)}")
 
+    def refresh_display_image(self):
+        """Show the edited image_original, uploading into the current PhotoImage when possible"""
+        photo = self.image_display
+        # A photo shared with the load cache must stay as loaded, so it is never pasted into
+        if (photo is not None
+                and (photo.width(), photo.height()) == self.image_original.size
+                and all(photo is not cached for cached in self._photoimage_cache.values())):
+            photo.paste(self.image_original)
+        else:
+            self.image_display = ImageTk.PhotoImage(self.image_original)
+            self.canvas.itemconfig(self.canvas_image_id, image=self.image_display)
+
     def apply_eraser(self, x1, y1, x2, y2):
         """Apply eraser to the selected rectangular area"""
         if not self.image_original or not self.canvas_image_id:
@@ -1279,17 +1462,13 @@ class ShapePositioningTool:
             if img_y1 > img_y2:
                 img_y1, img_y2 = img_y2, img_y1
 
-            # Create a copy of the image and erase the selected area
-            img_copy = self.image_original.copy()
-            draw = ImageDraw.Draw(img_copy)
-
-            # Fill the rectangle with white
-            draw.rectangle([img_x1, img_y1, img_x2, img_y2], fill="white")
+            # Fill the rectangle (edges included) with white in place - a C region fill with no
+            # drawing context; image_original is the tool's own copy, never the cached file image
+            white = ImageColor.getcolor("white", self.image_original.mode)
+            self.image_original.paste(white, (img_x1, img_y1, min(img_x2 + 1, img_width), min(img_y2 + 1, img_height)))
 
             # Update the displayed image
-            self.image_original = img_copy
-            self.image_display = ImageTk.PhotoImage(img_copy)
-            self.canvas.itemconfig(self.canvas_image_id, image=self.image_display)
+            self.refresh_display_image()
 
             print(f"Erased area: ({img_x1},{img_y1}) to ({img_x2},{img_y2})")
 
@@ -1392,7 +1571,7 @@ class ShapePositioningTool:
             existing_data = {}
             if os.path.exists(json_path):
                 try:
-                    with open(json_path, 'r', encoding='utf-8') as f:
+                    with open(json_path, 'rb') as f:
                         existing_data = json.load(f)
                 except:
                     existing_data = {}
@@ -1601,7 +1780,7 @@ class ShapePositioningTool:
 
             try:
                 if os.path.exists(json_file_path):
-                    with open(json_file_path, 'r') as f:
+                    with open(json_file_path, 'rb') as f:
                         json_data = json.load(f)
 
                     shape_key = f"shape_{shape_num}"
@@ -1822,7 +2001,7 @@ class ShapePositioningTool:
             # Calculate distance
             dx = ex - ref_x
             dy = ey - ref_y
-            distance = (dx**2 + dy**2)**0.5
+            distance = math.hypot(dx, dy)
 
             # Draw line from reference point to element
             self.canvas.create_line(ref_x, ref_y, ex, ey,
@@ -2027,8 +2206,8 @@ class ShapePositioningTool:
                 # Update the main canvas as well
                 self.update_element_on_main_canvas(element_index, new_image_x, new_image_y)
 
-                # Update elements list
-                self.update_elements_list()
+                # Positions are not shown in the elements list - only the preview needs refreshing
+                self.on_element_moved()
 
                 print(f"Field moved from ({old_x:.1f}, {old_y:.1f}) to ({new_image_x:.1f}, {new_image_y:.1f})")
 
@@ -0,0 +1,102 @@
+import json
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "old_data"))
+
+import pytest
+
+from json_database import IronDrawingJSONDatabase
+
+
+def _analysis(rib_count):
+    """Minimal analysis result for an order drawing with the given rib count"""
+    return {"shape_type": "U-shape", "ribfinder": {"rib_count": rib_count}, "comparison": {}}
+
+
+def _insert_orders(db, first, count):
+    """Insert orders ORD<first>..ORD<first + count - 1> one at a time"""
+    for n in range(first, first + count):
+        db.insert_order_drawing(f"ORD{n}", f"drawing_{n}.png", _analysis(3))
+
+
+def _order_numbers(records):
+    return [record["order_number"] for record in records]
+
+
+def test_migrates_legacy_order_drawings_json(tmp_path):
+    legacy = {
+        "metadata": {"created": "2025-08-31T22:08:58", "description": "Iron order drawing analysis results"},
+        "drawings": [{"id": str(n), "order_number": f"ORD{n}", "file_name": f"drawing_{n}.png"} for n in range(3)]
+    }
+    (tmp_path / "order_drawings.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+    db = IronDrawingJSONDatabase(str(tmp_path))
+
+    assert (tmp_path / "order_drawings.jsonl").exists()
+    assert _order_numbers(db.get_order_drawings(limit=10)) == ["ORD2", "ORD1", "ORD0"]
+    assert db.get_statistics()["total_order_drawings"] == 3
+
+    # New records are appended after the migrated ones
+    _insert_orders(db, 3, 1)
+    assert _order_numbers(db.get_order_drawings(limit=2)) == ["ORD3", "ORD2"]
+
+
+def test_get_order_drawings_spans_a_rotation(tmp_path):
+    pytest.importorskip("zstandard")
+    db = IronDrawingJSONDatabase(str(tmp_path))
+    # Rotate the live log once it reaches a few records
+    db.ORDER_LOG_ROTATE_BYTES = 1500
+
+    _insert_orders(db, 0, 14)
+
+    # The newest records are in the live log, the older ones in the archive segments
+    assert len(list(tmp_path.glob("order_drawings.*.jsonl.zst"))) > 1
+    assert (tmp_path / "order_drawings.jsonl").stat().st_size
+    assert _order_numbers(db.get_order_drawings(limit=14)) == [f"ORD{n}" for n in range(13, -1, -1)]
+    assert _order_numbers(db.get_order_drawings(limit=5)) == ["ORD13", "ORD12", "ORD11", "ORD10", "ORD9"]
+
+
+def test_rebuilds_deleted_order_index(tmp_path):
+    db = IronDrawingJSONDatabase(str(tmp_path))
+    _insert_orders(db, 0, 5)
+
+    os.remove(tmp_path / "order_drawings.idx")
+
+    assert _order_numbers(db.get_order_drawings(limit=3)) == ["ORD4", "ORD3", "ORD2"]
+    assert (tmp_path / "order_drawings.idx").stat().st_size == 5 * 8
+
+    # Appends after the rebuild extend the new index
+    _insert_orders(db, 5, 1)
+    assert _order_numbers(db.get_order_drawings(limit=2)) == ["ORD5", "ORD4"]
+
+
+def test_session_defers_writes_until_exit(tmp_path):
+    db = IronDrawingJSONDatabase(str(tmp_path))
+    log_size = (tmp_path / "order_drawings.jsonl").stat().st_size
+
+    with db.session():
+        _insert_orders(db, 0, 3)
+        db.insert_catalog_shape("test_u_shape", {"shape_type": "U-shape", "rib_count": 3})
+
+        assert (tmp_path / "order_drawings.jsonl").stat().st_size == log_size
+        assert db.get_order_drawings(limit=10) == []
+        assert db.get_catalog_shapes() == []
+
+    assert _order_numbers(db.get_order_drawings(limit=10)) == ["ORD2", "ORD1", "ORD0"]
+    assert [shape["shape_name"] for shape in db.get_catalog_shapes("u-shape")] == ["test_u_shape"]
+    stats = db.get_statistics()
+    assert stats["total_order_drawings"] == 3
+    assert stats["total_catalog_shapes"] == 1
+
+
+def test_catalog_index_is_rebuilt_when_unreadable(tmp_path):
+    db = IronDrawingJSONDatabase(str(tmp_path))
+    db.insert_catalog_shape("test_u_shape", {"shape_type": "U-shape", "rib_count": 3})
+    db.insert_catalog_shape("test_l_shape", {"shape_type": "L-shape", "rib_count": 2})
+
+    # e.g. a pickled index left by an older version
+    (tmp_path / "catalog_shapes.idx").write_bytes(b"\x80\x04not json")
+
+    assert [shape["shape_name"] for shape in db.get_catalog_shapes("l-shape")] == ["test_l_shape"]
+    assert len(db.get_catalog_shapes()) == 2
+    assert json.loads((tmp_path / "catalog_shapes.idx").read_bytes())["by_type"] == {"u-shape": [0], "l-shape": [1]}
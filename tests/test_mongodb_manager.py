@@ -0,0 +1,91 @@
+import os
+import sys
+from datetime import datetime, timezone
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "old_data"))
+
+import pytest
+
+mongomock = pytest.importorskip("mongomock")
+import mongomock.gridfs
+
+import mongodb_manager
+from mongodb_manager import IronDrawingDatabase
+
+
+@pytest.fixture
+def make_db(monkeypatch):
+    """Build IronDrawingDatabase instances on an in-memory mongomock server"""
+    mongomock.gridfs.enable_gridfs_integration()
+    monkeypatch.setattr(mongodb_manager, "MongoClient", mongomock.MongoClient)
+    monkeypatch.setattr(IronDrawingDatabase, "_client_by_pid", {})
+
+    def make():
+        db = IronDrawingDatabase()
+        assert db.create_collections()
+        return db
+    return make
+
+
+def test_catalog_cache_serves_copies_until_the_ttl_expires(make_db):
+    db = make_db()
+    db.catalog_shapes.insert_one({"shape_name": "u1", "shape_type": "U-shape", "tags": ["symmetric"]})
+
+    shapes = db.get_catalog_shapes("U-shape")
+    shapes[0]["tags"].append("changed by the caller")
+    assert db.get_catalog_shapes("U-shape")[0]["tags"] == ["symmetric"]
+
+    # An update by another writer keeps the collection size; it is not seen before the TTL expires
+    db.catalog_shapes.update_one({"shape_name": "u1"}, {"$set": {"tags": ["updated"]}})
+    assert db.get_catalog_shapes("U-shape")[0]["tags"] == ["symmetric"]
+
+    db._catalog_ttl = 0
+    assert db.get_catalog_shapes("U-shape")[0]["tags"] == ["updated"]
+
+
+def test_instances_share_one_client_that_close_connection_leaves_open(make_db, monkeypatch):
+    first, second = make_db(), make_db()
+    assert first.client is second.client
+
+    closed = []
+    monkeypatch.setattr(first.client, "close", lambda: closed.append(True), raising=False)
+
+    first.close_connection()
+    assert closed == []
+    assert IronDrawingDatabase._client_by_pid[os.getpid()] is second.client
+    second.catalog_shapes.insert_one({"shape_name": "still_usable"})
+    assert second.catalog_shapes.count_documents({}) == 1
+
+    # The shared client is closed once, at process exit
+    mongodb_manager._close_shared_client()
+    assert closed == [True]
+    assert os.getpid() not in IronDrawingDatabase._client_by_pid
+
+
+def test_drawings_summary_breaks_timestamp_ties_by_id(make_db):
+    db = make_db()
+    # One batch shares a timestamp; mongomock does not take the raw BSON documents insert_order_drawings_bulk sends
+    timestamp = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    documents = [dict(db._build_order_document({"file_name": f"drawing_{n}.png", "comparison": {"similarity_score": n}}),
+                      timestamp=timestamp)
+                 for n in range(3)]
+    db.order_drawings.insert_many(documents)
+
+    summary = db.get_order_drawings_summary(limit=3)
+
+    assert [row["file_name"] for row in summary] == ["drawing_2.png", "drawing_1.png", "drawing_0.png"]
+    assert summary[0] == {"timestamp": summary[0]["timestamp"], "file_name": "drawing_2.png",
+                          "chatco": {"similarity_score": 2}}
+
+
+def test_summary_index_paths_are_not_arrays(make_db):
+    # An array anywhere on an indexed path would make the summary index multikey, so it could not cover the query
+    db = make_db()
+    document = db._build_order_document({"file_name": "drawing.png",
+                                         "comparison": {"similarity_score": 85, "differences": ["leg length"]}})
+
+    for field, _ in mongodb_manager._SUMMARY_INDEX:
+        value = document
+        for part in field.split("."):
+            assert not isinstance(value, list), field
+            value = value.get(part)
+        assert not isinstance(value, list), field